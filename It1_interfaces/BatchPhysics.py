@@ -0,0 +1,99 @@
+import heapq
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from OccupancyGrid import STATE_IDS
+from PieceStore import PieceStore, NOT_STARTED, IDLE
+
+MOVE = STATE_IDS["move"]
+
+
+class BatchPhysics:
+    """
+    Advances the physics of every piece of a PieceStore, instead of calling
+    each piece's Physics.update. The Physics objects still do the
+    per-command setup in reset() and publish their timing to the store row
+    (Physics._publish_timing); this class only reads and writes columns.
+
+    Every state but idle ends at a deadline known when its timer starts
+    (start_ms + total_ms), so the timers live in a min-heap and a step only
+    pops the ones that are due. The only per-tick work besides that is
+    interpolating the pieces that are actually in flight. Idle and resting
+    pieces cost nothing per tick:
+      - a timer that was (re)started is scheduled on the next step, with
+        start_ms = now if it starts on its first update
+      - flying pieces are interpolated from start_pos to end_pos over
+        duration_ms, then put on end_pos and dropped from the flying set
+      - a popped deadline whose row changed since it was pushed (store
+        epoch) is stale and skipped
+    """
+
+    def __init__(self, store: PieceStore):
+        self.store = store
+        self._deadlines: List[Tuple[int, int, int]] = []  # heap of (due ms, epoch, slot)
+        self._flying: Dict[int, int] = {}  # slot -> epoch of its move
+        self.moved = np.empty(0, dtype=np.int64)  # slots whose position the last step advanced
+
+    def step(self, now_ms: int) -> List[int]:
+        """Advance to now_ms; return the slots whose current state just finished, in slot order."""
+        s = self.store
+        self._schedule(now_ms)
+        self._fly(now_ms)
+
+        finished = []
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= now_ms:
+            _, epoch, slot = heapq.heappop(deadlines)
+            if s.alive[slot] and s.epoch[slot] == epoch:
+                finished.append(slot)
+        finished.sort()
+        return finished
+
+    def transitions(self, now_ms: int) -> List[Tuple[int, str]]:
+        """step(), as (slot, next state name) pairs – each piece goes to its state's first transition."""
+        return [(slot, next(iter(self.store.pieces[slot]._state.transitions)))
+                for slot in self.step(now_ms)]
+
+    def pending(self) -> int:
+        """Deadlines in the heap, stale ones included."""
+        return len(self._deadlines)
+
+    # ─── internal helpers ────────────────────────────────────────────
+    def _schedule(self, now_ms: int):
+        s = self.store
+        slots = s.take_restarted()
+        slots = slots[s.state[slots] != IDLE]
+        if not len(slots):
+            return
+        start = s.start_ms[slots]
+        start[start == NOT_STARTED] = now_ms
+        s.start_ms[slots] = start
+        due = start + s.total_ms[slots]
+        for slot, t, epoch, state in zip(slots.tolist(), due.tolist(), s.epoch[slots].tolist(),
+                                         s.state[slots].tolist()):
+            heapq.heappush(self._deadlines, (t, epoch, slot))
+            if state == MOVE:
+                self._flying[slot] = epoch
+
+    def _fly(self, now_ms: int):
+        s = self.store
+        if not self._flying:
+            self.moved = np.empty(0, dtype=np.int64)
+            return
+        rows = np.fromiter(self._flying, dtype=np.int64, count=len(self._flying))
+        epochs = np.fromiter(self._flying.values(), dtype=np.int64, count=len(self._flying))
+        current = s.alive[rows] & (s.epoch[rows] == epochs)
+        rows = rows[current]
+
+        elapsed = now_ms - s.start_ms[rows]
+        duration = s.duration_ms[rows]
+        flying = elapsed < duration
+        fly = rows[flying]
+        t = (elapsed[flying] / duration[flying])[:, None]
+        s.pos[fly] = s.start_pos[fly] + t * (s.end_pos[fly] - s.start_pos[fly])
+        arrived = rows[~flying]
+        s.pos[arrived] = s.end_pos[arrived]
+
+        self._flying = dict(zip(fly.tolist(), epochs[current][flying].tolist()))
+        self.moved = rows
@@ -0,0 +1,139 @@
+from typing import Dict, List, Tuple
+
+from Moves import Moves
+from OccupancyGrid import COLOR_IDS
+
+SIZE = 8
+
+
+def square(cell: Tuple[int, int]) -> int:
+    return cell[0] * SIZE + cell[1]
+
+
+def bit(cell: Tuple[int, int]) -> int:
+    return 1 << square(cell)
+
+
+def cells_of(mask: int) -> List[Tuple[int, int]]:
+    cells = []
+    while mask:
+        low = mask & -mask
+        sq = low.bit_length() - 1
+        cells.append(divmod(sq, SIZE))
+        mask ^= low
+    return cells
+
+
+# every line direction, and for each square the full ray to the board edge in that direction
+_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+_FULL_RAYS = [[0] * len(_DIRECTIONS) for _ in range(SIZE * SIZE)]
+for _sq in range(SIZE * SIZE):
+    for _d, (_dr, _dc) in enumerate(_DIRECTIONS):
+        _r, _c = divmod(_sq, SIZE)
+        _r, _c = _r + _dr, _c + _dc
+        while 0 <= _r < SIZE and 0 <= _c < SIZE:
+            _FULL_RAYS[_sq][_d] |= 1 << (_r * SIZE + _c)
+            _r, _c = _r + _dr, _c + _dc
+
+
+class PieceMasks:
+    """Attack tables of one piece code on the 8x8 board, built from its moves.txt rules."""
+
+    def __init__(self, moves: Moves):
+        self.color = moves.color
+        self.is_pawn = moves.is_pawn
+        self.leaps = [0] * (SIZE * SIZE)     # knight jumps and single steps (king): never blocked
+        self.rays: List[List[Tuple[int, int, int, bool]]] = [[] for _ in range(SIZE * SIZE)]
+        self.pawn_forward: List[List[Tuple[int, bool]]] = [[] for _ in range(SIZE * SIZE)]
+        self.pawn_captures = [0] * (SIZE * SIZE)
+
+        tables = moves.tables
+        for r in range(SIZE):
+            for c in range(SIZE):
+                sq = r * SIZE + c
+                if self.is_pawn:
+                    self.pawn_forward[sq] = [(bit(cell), is_double) for cell, is_double in tables.pawn_forward[r][c]]
+                    for cell in tables.pawn_captures[r][c]:
+                        self.pawn_captures[sq] |= bit(cell)
+                    continue
+                for ray in tables.rays[r][c]:
+                    if len(ray) == 1:
+                        if ray[0][1]:
+                            self.leaps[sq] |= bit(ray[0][0])
+                        continue
+                    ray_mask = targets = 0
+                    for cell, is_target in ray:
+                        ray_mask |= bit(cell)
+                        if is_target:
+                            targets |= bit(cell)
+                    (r1, c1), (r2, c2) = ray[0][0], ray[1][0]
+                    direction = (r2 - r1, c2 - c1)
+                    increasing = square(ray[1][0]) > square(ray[0][0])
+                    self.rays[sq].append((ray_mask, targets, _DIRECTIONS.index(direction), increasing))
+
+
+class BitboardEngine:
+    """
+    Optional move generator for the standard 8x8 board: one 64-bit occupancy
+    per colour and per (colour, piece type). Produces the same legal sets as
+    Moves.get_legal_moves.
+    """
+
+    def __init__(self, moves_by_code: Dict[str, Moves]):
+        for code, moves in moves_by_code.items():
+            if tuple(moves.dims) != (SIZE, SIZE):
+                raise ValueError(f"Bitboards need an {SIZE}x{SIZE} board, {code} uses {moves.dims}")
+        self.masks = {code: PieceMasks(moves) for code, moves in moves_by_code.items()}
+        self.by_color = {color: 0 for color in COLOR_IDS.values()}
+        self.by_code: Dict[str, int] = {code: 0 for code in moves_by_code}
+        self.occupied = 0
+
+    @classmethod
+    def from_factory(cls, piece_factory, codes) -> "BitboardEngine":
+        """Engine for the given piece codes, sharing the Moves of the factory templates."""
+        return cls({code: piece_factory._get_template(code)._state._moves for code in codes})
+
+    def load(self, occupancy):
+        """Rebuild the bitboards from a cell -> Piece mapping (OccupancyGrid or dict)."""
+        self.by_color = {color: 0 for color in COLOR_IDS.values()}
+        self.by_code = {code: 0 for code in self.masks}
+        self.occupied = 0
+        for cell, piece in occupancy.items():
+            b = bit(cell)
+            code = piece.get_id().split("_")[0]
+            color = COLOR_IDS.get(code[1], 0)
+            self.occupied |= b
+            self.by_color[color] = self.by_color.get(color, 0) | b
+            self.by_code[code] = self.by_code.get(code, 0) | b
+
+    def legal_mask(self, code: str, cell: Tuple[int, int], has_moved: bool = False) -> int:
+        m = self.masks[code]
+        sq = square(cell)
+        own = self.by_color.get(m.color, 0)
+        occupied = self.occupied
+
+        if m.is_pawn:
+            legal = 0
+            for b, is_double in m.pawn_forward[sq]:
+                if is_double and has_moved:
+                    continue
+                if occupied & b:
+                    break
+                legal |= b
+            enemy = occupied & ~own
+            return legal | (m.pawn_captures[sq] & enemy)
+
+        legal = m.leaps[sq] & ~own
+        for ray_mask, targets, direction, increasing in m.rays[sq]:
+            blockers = ray_mask & occupied
+            if blockers:
+                if increasing:
+                    first = (blockers & -blockers).bit_length() - 1
+                else:
+                    first = blockers.bit_length() - 1
+                ray_mask &= ~_FULL_RAYS[first][direction]  # keep up to and including the blocker
+            legal |= ray_mask & targets & ~own
+        return legal
+
+    def legal_moves(self, code: str, cell: Tuple[int, int], has_moved: bool = False) -> List[Tuple[int, int]]:
+        return cells_of(self.legal_mask(code, cell, has_moved))
@@ -0,0 +1,153 @@
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from Board import Board
+from OccupancyGrid import OccupancyGrid, STATE_IDS
+from PieceStore import PieceStore, NOT_STARTED
+
+MOVE = STATE_IDS["move"]
+
+
+class CaptureEvent:
+    __slots__ = ("time_ms", "winner", "loser", "cell")
+
+    def __init__(self, time_ms: float, winner, loser, cell: Tuple[int, int]):
+        self.time_ms = time_ms
+        self.winner = winner
+        self.loser = loser
+        self.cell = cell
+
+    def __repr__(self):
+        return f"CaptureEvent({self.time_ms:.2f}ms, {self.winner.get_id()} x {self.loser.get_id()} at {self.cell})"
+
+
+class Collisions:
+    """
+    Continuous-time cell tracking and captures for moving pieces.
+
+    A move is a straight segment walked at constant speed, and a mover stands
+    on the last cell it fully covered: it enters a cell when its (top-left)
+    position reaches that cell's corner, in whichever direction it goes. So
+    the instants at which a mover crosses into the next row or column follow
+    directly from its
+    start/end position, start time and duration in the PieceStore – no
+    sampling. update(now) takes every crossing since the previous update,
+    in time order, and replays them on the occupancy grid: a piece entering a
+    cell that is taken fights its occupant (the `captures` rule decides) at
+    the exact crossing time. Crossings at the same instant are applied
+    together (all movers of the instant are lifted before any is placed),
+    and two movers swapping cells at the same instant meet on the way.
+
+    Static pieces are only looked at through the grid cell a mover enters,
+    so the cost is the number of cell crossings, not pieces squared.
+    """
+
+    def __init__(self, board: Board, store: PieceStore, occupancy: OccupancyGrid,
+                 captures: Callable[[object, object], bool]):
+        self.board = board
+        self.store = store
+        self.occupancy = occupancy
+        self.captures = captures  # captures(arriving piece, occupant) -> arriving piece wins
+        self.last_ms = -math.inf
+        self.events: List[CaptureEvent] = []  # captures of the last update, in time order
+        self.crossings = 0                    # cell crossings replayed so far
+
+    def update(self, now_ms: int, movers: Optional[np.ndarray] = None) -> List:
+        """
+        Replay all crossings in (last update, now_ms]; return the pieces that
+        were captured. `movers` are the slots that moved since the last update
+        (BatchPhysics.moved); by default every started move is looked at.
+        """
+        t_from, self.last_ms = self.last_ms, now_ms
+        self.events = []
+
+        if movers is None:
+            movers = np.flatnonzero(self.tracked(np.arange(self.store.size)))
+        timeline: Dict[float, List[Tuple[int, Tuple[int, int]]]] = {}
+        for slot in movers.tolist():
+            for t, cell in self._crossings(slot, t_from, now_ms):
+                timeline.setdefault(t, []).append((slot, cell))
+
+        captured = []
+        for t in sorted(timeline):
+            captured.extend(self.apply_crossings(t, timeline[t]))
+        return captured
+
+    def tracked(self, slots: np.ndarray) -> np.ndarray:
+        """Mask of the slots whose cell this class keeps (live pieces in a started move)."""
+        s = self.store
+        return s.alive[slots] & (s.state[slots] == MOVE) & (s.start_ms[slots] != NOT_STARTED)
+
+    # ─── internal helpers ────────────────────────────────────────────
+    def _crossings(self, slot: int, t_from: float, t_to: float) -> List[Tuple[float, Tuple[int, int]]]:
+        """(time, new cell) of every row/column boundary the mover crosses in (t_from, t_to]."""
+        s = self.store
+        t0 = float(s.start_ms[slot])
+        duration = float(s.duration_ms[slot])
+        if t0 + duration <= t_from or t0 > t_to:
+            return []
+        (x0, y0), (x1, y1) = s.start_pos[slot], s.end_pos[slot]
+
+        entries: Dict[float, List[Optional[int]]] = {}  # time -> [row entered, column entered]
+        for axis, p0, p1, size in ((0, y0, y1, self.board.cell_H_pix), (1, x0, x1, self.board.cell_W_pix)):
+            if p1 == p0:
+                continue
+            # cell k is entered when p reaches k * size: after leaving p0 going up, before reaching p0 going down
+            if p1 > p0:
+                boundaries = range(math.floor(p0 / size) + 1, math.floor(p1 / size) + 1)
+            else:
+                boundaries = range(math.ceil(p0 / size) - 1, math.ceil(p1 / size) - 1, -1)
+            for k in boundaries:
+                t = t0 + duration * (k * size - p0) / (p1 - p0)
+                entries.setdefault(t, [None, None])[axis] = k
+
+        row, col = int(y0 // self.board.cell_H_pix), int(x0 // self.board.cell_W_pix)
+        crossings = []
+        for t in sorted(entries):
+            new_row, new_col = entries[t]
+            cell = (row if new_row is None else new_row, col if new_col is None else new_col)
+            if cell != (row, col) and t_from < t <= t_to:
+                crossings.append((t, cell))
+            row, col = cell
+        return crossings
+
+    def apply_crossings(self, t: float, moves: List[Tuple[int, Tuple[int, int]]]) -> List:
+        """Move the given (slot, new cell) pieces at instant t, fighting over taken cells; return the losers."""
+        s, grid = self.store, self.occupancy
+        moves = [(s.pieces[slot], cell) for slot, cell in moves if s.alive[slot] and grid.in_bounds(cell)]
+        self.crossings += len(moves)
+        captured = []
+
+        def fight(piece, opponent, cell):
+            winner, loser = (piece, opponent) if self.captures(piece, opponent) else (opponent, piece)
+            grid.remove(loser)
+            s.alive[loser._slot] = False  # later crossings of the loser are skipped
+            captured.append(loser)
+            self.events.append(CaptureEvent(t, winner, loser, cell))
+            return winner
+
+        # two movers trading cells at this instant pass through each other: they meet
+        origin = {piece.get_unique(): tuple(s.cell[piece._slot]) for piece, _ in moves}
+        for i, (a, cell_a) in enumerate(moves):
+            for b, cell_b in moves[i + 1:]:
+                if (s.alive[a._slot] and s.alive[b._slot] and
+                        cell_a == origin[b.get_unique()] and cell_b == origin[a.get_unique()]):
+                    fight(a, b, cell_a)
+
+        # lift every mover first so a piece leaving a cell never "captures" the one arriving
+        moves = [(piece, cell) for piece, cell in moves if s.alive[piece._slot]]
+        for piece, _ in moves:
+            grid.lift(piece)
+
+        for piece, cell in moves:
+            if not s.alive[piece._slot]:
+                continue
+            opponent = grid.get(cell)
+            if opponent is not None and fight(piece, opponent, cell) is not piece:
+                continue
+            grid.place(piece, cell)
+            s.cell[piece._slot] = cell
+            s.grid_state[piece._slot] = s.state[piece._slot]
+        return captured
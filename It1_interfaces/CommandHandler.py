@@ -1,60 +1,118 @@
+import numbers
+from typing import Dict, List, Optional, Tuple
+
 from Board import Board
 from Command import Command
 
+COUNTERS = ("accepted", "rejected", "dropped")
+
+
 class CommandHandler:
     def __init__(self, board: Board, pos_to_piece: dict):
         self.board = board
         self.pos_to_piece = pos_to_piece
+        self._cells: Dict[str, Tuple[int, int]] = {}  # algebraic -> cell, parsed once
+        self.last_counts = dict.fromkeys(COUNTERS, 0)  # of the last batch (tick)
+        self.last_accepted: List[Command] = []  # commands the pieces took in the last batch
+        self.totals = dict.fromkeys(COUNTERS, 0)
+
+    def handle_command(self, cmd: Command, now: int) -> bool:
+        """Validate and apply one command; True if the piece took it."""
+        target = self._validate(cmd)
+        if target is None:
+            return False
+        piece, src_cell, dst_cell = target
+        if not all(isinstance(square, str) for square in cmd.params[:2]):  # pieces read algebraic squares
+            cmd = Command(cmd.timestamp, cmd.piece_id, cmd.type,
+                          [self.board.cell_to_algebraic(src_cell), self.board.cell_to_algebraic(dst_cell)])
+        return self._apply(piece, cmd, now)
+
+    def handle_batch(self, commands: List[Command], now: int) -> Dict[str, int]:
+        """
+        Handle everything queued for one tick. Commands are ordered by
+        timestamp; of several commands for the same piece only the latest is
+        kept (the others are dropped as superseded/duplicate). All commands are
+        validated against the board as it stands at the start of the batch –
+        accepted moves only change cells later, in the collision phase.
+        Returns the accepted / rejected / dropped counts of this batch.
+        """
+        counts = dict.fromkeys(COUNTERS, 0)
+        accepted_cmds = []
+        latest = {}
+        for cmd in sorted(commands, key=lambda c: c.timestamp):
+            src_cell = self._cell(cmd.params[0]) if cmd.params else None
+            piece = self.pos_to_piece.get(src_cell) if src_cell is not None else None
+            key = piece.get_unique() if piece is not None else ("empty", src_cell)
+            if key in latest:
+                counts["dropped"] += 1
+            latest[key] = cmd
+
+        for cmd in sorted(latest.values(), key=lambda c: c.timestamp):
+            accepted = self.handle_command(cmd, now)
+            counts["accepted" if accepted else "rejected"] += 1
+            if accepted:
+                accepted_cmds.append(cmd)
+
+        self.last_counts = counts
+        self.last_accepted = accepted_cmds
+        for name, n in counts.items():
+            self.totals[name] += n
+        return counts
 
-    def handle_command(self, cmd: Command, now: int):
-        src_cell = self.board.algebraic_to_cell(cmd.params[0])
-        dst_cell = self.board.algebraic_to_cell(cmd.params[1])
+    # ─── internal helpers ────────────────────────────────────────────
+    def _cell(self, notation) -> Optional[Tuple[int, int]]:
+        """The cell of an algebraic square ("e2") or a (row, col) tuple; None for anything else or off the board."""
+        if isinstance(notation, tuple):  # the form GameJournal / GameSnapshot replay
+            if (len(notation) == 2 and all(isinstance(v, numbers.Integral) for v in notation)
+                    and self.board.is_valid_cell(notation)):
+                return int(notation[0]), int(notation[1])
+            return None
+        if not isinstance(notation, str):
+            return None
+        cell = self._cells.get(notation)
+        if cell is None:
+            try:
+                cell = self.board.algebraic_to_cell(notation)
+            except (ValueError, TypeError):
+                return None
+            self._cells[notation] = cell
+        return cell
+
+    def _validate(self, cmd: Command):
+        """(piece, src_cell, dst_cell) if the command is legal on the current board, else None."""
+        if len(cmd.params) < 2:  # a square is missing
+            src_cell = dst_cell = None
+        else:
+            src_cell = self._cell(cmd.params[0])
+            dst_cell = self._cell(cmd.params[1])
+        if src_cell is None or dst_cell is None:
+            print(f"Bad square in command: {cmd.params}")
+            return None
 
         if src_cell not in self.pos_to_piece:
             print("Source cell empty. Command ignored.")
-            return
+            return None
 
         moving_piece = self.pos_to_piece[src_cell]
-
-        # בדיקת תנועות חוקיות - כולל לוגיקת פיונים
-        legal_moves = moving_piece._state._moves.get_moves(*src_cell, moving_piece._has_moved, self.pos_to_piece)
-        if dst_cell not in legal_moves:
-            print(f"Illegal move: {cmd.params[0]} to {cmd.params[1]}")
-            return
+        moves = moving_piece._state._moves
 
         # בדיקה: אם בתא היעד יש כלי ששייך לאותו שחקן, אין לעבד את הפקודה
         if dst_cell in self.pos_to_piece:
             target_piece = self.pos_to_piece[dst_cell]
             if target_piece.get_id()[1] == moving_piece.get_id()[1]:
                 print("Move blocked: Destination occupied by friendly piece.")
-                return
+                return None
 
-        # בדיקה אם יש חיילים בדרך
-        if not self._is_path_clear(src_cell, dst_cell):
-            print("Move blocked: Path is obstructed.")
-            return
+        # בדיקת תנועות חוקיות - כולל לוגיקת פיונים וחסימות בדרך (טבלאות מחושבות מראש)
+        if not moves.is_legal(src_cell, dst_cell, moving_piece._has_moved, self.pos_to_piece):
+            print(f"Illegal move: {cmd.params[0]} to {cmd.params[1]}")
+            return None
+
+        return moving_piece, src_cell, dst_cell
 
+    @staticmethod
+    def _apply(moving_piece, cmd: Command, now: int) -> bool:
         # אם כל הבדיקות עוברות, נעביר את הפקודה לכלי המתאים
+        before = moving_piece._state
         moving_piece.on_command(cmd, now)
-
-    def _is_path_clear(self, src_cell, dst_cell):
-        dx = dst_cell[1] - src_cell[1]
-        dy = dst_cell[0] - src_cell[0]
-        
-        step_x = 0
-        if dx != 0:
-            step_x = dx // abs(dx)
-        
-        step_y = 0
-        if dy != 0:
-            step_y = dy // abs(dy)
-
-        # נבדוק רק אם התנועה היא בקו ישר
-        if (step_x != 0 or step_y != 0) and (abs(dx) == abs(dy) or dx == 0 or dy == 0):
-            cur_cell = (src_cell[0] + step_y, src_cell[1] + step_x)
-            while cur_cell != dst_cell:
-                if cur_cell in self.pos_to_piece:
-                    return False
-                cur_cell = (cur_cell[0] + step_y, cur_cell[1] + step_x)
-        
-        return True
+        return moving_piece._state is not before
@@ -0,0 +1,83 @@
+import threading
+import time
+from collections import deque
+from typing import Any, List, Optional
+
+DROP_OLDEST = "drop_oldest"  # a full queue forgets its oldest event (latest state wins – displays)
+DROP_NEWEST = "drop_newest"  # a full queue refuses the new event (keeps the beginning of a story)
+BLOCK = "block"              # the publisher waits for room (lossless, but a slow consumer slows it down)
+POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+
+
+class EventQueue:
+    """
+    Bounded FIFO between publishers and one consuming thread. What happens
+    when it is full is the queue's policy; with the two drop policies put()
+    never waits, so a slow consumer can only lose its own events, never hold
+    up the publisher. The consumer takes events in batches (get_batch).
+    """
+
+    def __init__(self, maxsize: int = 1024, policy: str = DROP_OLDEST, block_timeout_s: Optional[float] = None):
+        if maxsize < 1:
+            raise ValueError(f"EventQueue size must be at least 1, got {maxsize}")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy {policy!r}, expected one of {POLICIES}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.block_timeout_s = block_timeout_s  # BLOCK only: give up (and drop) after this long
+        self.dropped = 0
+        self.closed = False
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item: Any) -> bool:
+        """Queue an item; False if this item was dropped instead (full with DROP_NEWEST / BLOCK timeout, or closed)."""
+        with self._lock:
+            if self.closed:
+                return False
+            if len(self._items) >= self.maxsize:
+                if self.policy == DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self.policy == DROP_OLDEST:
+                    self._items.popleft()
+                    self.dropped += 1
+                elif not self._wait_for_room():
+                    self.dropped += 1
+                    return False
+            self._items.append(item)
+            self._not_empty.notify()
+            return True
+
+    def get_batch(self, max_items: int, timeout_s: Optional[float] = None) -> List[Any]:
+        """Up to max_items items, oldest first; waits up to timeout_s for the first one. [] once closed and empty."""
+        with self._lock:
+            if not self._items and not self.closed:
+                self._not_empty.wait(timeout_s)
+            n = min(max_items, len(self._items))
+            batch = [self._items.popleft() for _ in range(n)]
+            if batch:
+                self._not_full.notify_all()
+            return batch
+
+    def close(self):
+        """No more puts; the consumer still gets what is queued."""
+        with self._lock:
+            self.closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    # ─── internal helpers ────────────────────────────────────────────
+    def _wait_for_room(self) -> bool:
+        deadline = None if self.block_timeout_s is None else time.monotonic() + self.block_timeout_s
+        while len(self._items) >= self.maxsize and not self.closed:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._not_full.wait(remaining)
+        return not self.closed
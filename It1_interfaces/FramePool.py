@@ -0,0 +1,49 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+class FramePool:
+    """
+    Arrays the render loop reuses instead of allocating per frame.
+
+    frame():   full frames, handed out round-robin from `frames` buffers. A
+               frame stays valid until `frames` more have been taken, so a
+               caller can keep the previous frame while drawing the next one.
+    scratch(): per-draw temporaries (e.g. the uint16 blend of one sprite),
+               one growing buffer per name, returned as a view of the
+               requested shape. Only valid until the next scratch() of that
+               name.
+    Both allocate only when a shape (or, for scratch, a size) is first seen.
+    Not thread-safe: one pool per drawing thread.
+    """
+
+    def __init__(self, frames: int = 2):
+        if frames < 1:
+            raise ValueError(f"FramePool needs at least 1 frame, got {frames}")
+        self.frames = frames
+        self.allocations = 0
+        self._frames: List[np.ndarray] = []
+        self._next = 0
+        self._scratch: Dict[Tuple[str, np.dtype], np.ndarray] = {}
+
+    def frame(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """The next full-frame buffer (contents undefined: copy the background in with np.copyto)."""
+        if not self._frames or self._frames[0].shape != tuple(shape) or self._frames[0].dtype != dtype:
+            self._frames = [np.empty(shape, dtype=dtype) for _ in range(self.frames)]
+            self.allocations += self.frames
+        frame = self._frames[self._next]
+        self._next = (self._next + 1) % self.frames
+        return frame
+
+    def scratch(self, name: str, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """A view of `shape` on the named scratch buffer (contents undefined)."""
+        dtype = np.dtype(dtype)
+        size = 1
+        for n in shape:
+            size *= n
+        buf = self._scratch.get((name, dtype))
+        if buf is None or buf.size < size:
+            buf = self._scratch[(name, dtype)] = np.empty(size, dtype=dtype)
+            self.allocations += 1
+        return buf[:size].reshape(shape)
@@ -3,7 +3,8 @@ import pathlib
 import time
 import queue
 import cv2
-from typing import Dict, Tuple, Optional
+import numpy as np
+from typing import Dict, List, Tuple, Optional
 import threading
 
 from Board import Board
@@ -11,22 +12,78 @@ from Command import Command
 from Piece import Piece
 from PieceFactory import PieceFactory
 from InputHandler import InputHandler
+from InputSource import InputSource, KeyboardSource, ScriptedSource
 from GameRenderer import GameRenderer
+from NullRenderer import NullRenderer
+from SpriteAtlas import NullAtlas
+from Clock import Clock, RealTimeClock, VirtualClock
 from CommandHandler import CommandHandler
+from OccupancyGrid import OccupancyGrid
+from PieceStore import PieceStore
+from BatchPhysics import BatchPhysics
+from Collisions import Collisions
+from LoopStats import LoopStats
+from MessageBroker import MessageBroker
+from GameEventPublisher import GameEventPublisher
+from GameJournal import GameJournal
+from SpectatorStream import SpectatorStream
+from FrameRecorder import FrameRecorder
+
+MAX_TICKS_PER_FRAME = 25  # drop simulation time instead of spiralling when a frame takes too long
 
 class Game:
-    def __init__(self, board: Board, pieces_root: pathlib.Path, placement_csv: pathlib.Path):
+    def __init__(self, board: Board, pieces_root: pathlib.Path, placement_csv: pathlib.Path,
+                 tick_hz: float = 100.0, max_fps: Optional[float] = 60.0, headless: bool = False,
+                 clock: Optional[Clock] = None, input_sources: Optional[List[InputSource]] = None,
+                 broker: Optional[MessageBroker] = None, journal: Optional[GameJournal] = None,
+                 spectators: Optional[SpectatorStream] = None, recorder: Optional[FrameRecorder] = None):
+        """
+        The simulation advances in fixed ticks of 1000 / tick_hz ms; frames are
+        drawn at most max_fps times a second (None = as often as the loop spins).
+        headless: no sprites are decoded and nothing is drawn, board.img is never
+        read; use run_headless() to play scripted commands on virtual time.
+        clock: source of game time; real time by default, a VirtualClock for
+        headless games.
+        input_sources: where input comes from; the keyboard by default, none
+        for headless games.
+        broker: where game events (EventType) are published; subscribe to it
+        before run(). A private broker without subscribers by default.
+        journal: records the game (commands, captures, snapshots) for
+        JournalReplay; written while run() / run_headless() plays.
+        spectators: gets the state after every tick and streams it, as
+        binary deltas, to whoever subscribed to it.
+        recorder: gets every drawn frame and writes the ones its skip policy
+        keeps to a video or PNG files, on its own thread; closed when the
+        game ends.
+        """
+        if clock is None:
+            clock = VirtualClock() if headless else RealTimeClock()
+        self.clock = clock
+        self.headless = headless
         self.board = board
+        self.tick_ms = 1000.0 / tick_hz
+        self.max_fps = max_fps
+        self.stats = LoopStats()
+        self.broker = broker if broker is not None else MessageBroker()
+        self.events = GameEventPublisher(self.broker)
+        self.journal = journal
+        self.spectators = spectators
+        self.recorder = recorder
         self.user_input_queue = queue.Queue()
-        self.start_time = time.monotonic()
-        self.piece_factory = PieceFactory(board, pieces_root)
+        self.piece_factory = PieceFactory(board, pieces_root, NullAtlas() if headless else None, clock)
         self.pieces: Dict[str, Piece] = {}
-        self.pos_to_piece: Dict[Tuple[int, int], Piece] = {}
+        self.occupancy = OccupancyGrid(board.H_cells, board.W_cells)
+        self.store = PieceStore(board.H_cells * board.W_cells)
+        self.physics = BatchPhysics(self.store)
+        self.collisions = Collisions(board, self.store, self.occupancy, self._captures)
+        self.pos_to_piece = self.occupancy  # cell -> Piece view, kept for older callers
         self._load_pieces_from_csv(placement_csv)
         
         self._running = True
-        self.input_handler = InputHandler(self.user_input_queue, self.board, self)
-        self.renderer = GameRenderer(self.board)
+        if input_sources is None:
+            input_sources = [] if headless else [KeyboardSource()]
+        self.input_handler = InputHandler(self.user_input_queue, self.board, self, clock, input_sources)
+        self.renderer = NullRenderer(self.board) if headless else GameRenderer(self.board)
         self.command_handler = CommandHandler(self.board, self.pos_to_piece)
 
 
@@ -41,82 +98,253 @@ class Game:
                     cell = (row_idx, col_idx)
                     piece = self.piece_factory.create_piece(code, cell)
                     self.pieces[piece.get_unique()] = piece
-                    self.pos_to_piece[cell] = piece
+                    self.occupancy.place(piece, cell)
+                    self.store.add(piece, cell)
 
     def game_time_ms(self) -> int:
-        return int((time.monotonic() - self.start_time) * 1000)
+        return self.clock.now_ms()
 
     def run(self):
-        self.input_handler.start_keyboard_thread()
+        self.input_handler.start()
 
         start_ms = self.game_time_ms()
         for piece in self.pieces.values():
             piece.reset(start_ms)
+        self._start_events(start_ms)
+
+        # no cap still means at most one frame per ms of game time, so a virtual clock keeps moving
+        frame_ms = 1000.0 / self.max_fps if self.max_fps else 1.0
+        sim_ms = float(start_ms)       # simulation clock, advances in whole ticks
+        last_ms = start_ms
+        accumulator = 0.0
+        next_frame_ms = float(start_ms)
+        prev_pos = self._piece_positions()
+        self.stats.reset()
 
         while self._running and not self._is_win():
+            self.input_handler.update()
             now = self.game_time_ms()
+            accumulator += now - last_ms
+            last_ms = now
+
+            ticks = 0
+            while accumulator >= self.tick_ms and ticks < MAX_TICKS_PER_FRAME:
+                prev_pos = self._piece_positions()
+                self._tick(int(sim_ms))
+                sim_ms += self.tick_ms
+                accumulator -= self.tick_ms
+                ticks += 1
+            if ticks == MAX_TICKS_PER_FRAME:
+                accumulator = 0.0
+
+            if now >= next_frame_ms:
+                self._render(int(sim_ms), accumulator / self.tick_ms, prev_pos)
+                next_frame_ms = max(next_frame_ms + frame_ms, now)
+            else:
+                # nothing due: sleep until the next tick or frame instead of spinning
+                wait_ms = min(self.tick_ms - accumulator, next_frame_ms - now)
+                with self.stats.phase("idle"):
+                    self.clock.sleep_ms(max(wait_ms, 0))
+
+        self.input_handler.stop()
+        self._end_events(int(sim_ms))
+        print(self.stats.format())
+        print("commands:", self.command_handler.totals)
+        print("input latency:", self.input_handler.latency_stats())
+        if self.recorder is not None:
+            print("recording:", self.recorder.report())
+        self._announce_win()
+        self._running = False
+        self.renderer.destroy_windows()
+
+    def run_headless(self, commands: List[Command], max_ms: Optional[int] = None) -> dict:
+        """
+        Play a scripted command stream tick by tick. On the (default) virtual
+        clock this runs as fast as the CPU allows; on a real or scaled clock it
+        keeps that clock's pace. Each command is queued on the first tick at or
+        after its timestamp. The game ends on a win, when max_ms is reached, or
+        once every command has been played and all pieces are back to idle –
+        that last one only without input sources (bots keep a game going).
+        """
+        script = ScriptedSource(commands)
+        script.start(self.input_handler)
+        self.input_handler.start()
+        start_ms = self.game_time_ms()
+        for piece in self.pieces.values():
+            piece.reset(start_ms)
+        self._start_events(start_ms)
+
+        self.stats.reset()
+        sim_ms = float(start_ms)
+        while not self._is_win():
+            now = int(sim_ms)
+            if max_ms is not None and now > max_ms:
+                break
+            script.poll(now)
+            self.input_handler.update()
+            self._tick(now)
+            if script.done() and not self.input_handler.sources and self._is_settled():
+                break
+            sim_ms += self.tick_ms
+            self.clock.sleep_ms(sim_ms - self.game_time_ms())
+        self.input_handler.stop()
+        self._end_events(int(sim_ms))
+
+        return {
+            "winner": self.winner(),
+            "end_ms": int(sim_ms),
+            "ticks": self.stats.ticks,
+            "pieces": len(self.pieces),
+            "commands": dict(self.command_handler.totals),
+        }
+
+    def _start_events(self, now: int):
+        self.broker.start()
+        self.events.game_start(now, (piece.get_id() for piece in self.pieces.values()))
+        if self.journal is not None:
+            self.journal.begin(now, self)
+        if self.spectators is not None:
+            self.spectators.begin(now, self)
+
+    def _end_events(self, now: int):
+        self.events.game_end(now, self.winner())
+        self.broker.stop()
+        if self.journal is not None:
+            self.journal.close(now, self.winner())
+        if self.spectators is not None:
+            self.spectators.close(self.winner())
+        if self.recorder is not None:
+            self.recorder.close()
 
-            for piece in self.pieces.values():
-                piece.update(now)
+    def _is_settled(self) -> bool:
+        return self.store.all_idle()
 
-            self._update_position_mapping()
+    def _tick(self, now: int):
+        """Run one fixed step of the simulation at `now`, the tick's start time (the loops advance sim_ms after it)."""
+        with self.stats.phase("physics"):
+            for slot, next_state in self.physics.transitions(now):
+                self.store.pieces[slot].finish_state(now, next_state)
 
-            while not self.user_input_queue.empty():
-                cmd = self.user_input_queue.get()
-                self.command_handler.handle_command(cmd, now)
+        with self.stats.phase("collisions"):
+            self._update_position_mapping(now)
+            for event in self.collisions.events:
+                self.events.piece_captured(event)
+                if self.journal is not None:
+                    self.journal.capture(event)
 
-            # Drawing
+        with self.stats.phase("commands"):
+            batch = self._drain_input()
+            if batch:
+                self.command_handler.handle_batch(batch, now)
+                for cmd in self.command_handler.last_accepted:
+                    if cmd.type == "move":
+                        self.events.piece_moved(cmd)
+                    if self.journal is not None:
+                        self.journal.command(now, cmd)
+        self.stats.ticks += 1
+        if self.journal is not None:
+            self.journal.after_tick(now, self)
+        if self.spectators is not None:
+            self.spectators.after_tick(now)
+
+    def _drain_input(self) -> List[Command]:
+        """Take everything queued so far under a single acquisition of the queue lock."""
+        q = self.user_input_queue
+        with q.mutex:
+            batch = list(q.queue)
+            q.queue.clear()
+            q.not_full.notify_all()
+        return batch
+
+    def _render(self, now: int, alpha: float, prev_pos: np.ndarray):
+        """Draw the board with pieces interpolated `alpha` of a tick past their last simulated position."""
+        store = self.store
+        slots = store.live_slots()
+        cur, prev = store.pos[slots], prev_pos[slots]
+        moving = np.any(cur != prev, axis=1)
+        between = prev[moving] + alpha * (cur[moving] - prev[moving])
+        positions = {store.pieces[slot].get_unique(): (x, y)
+                     for slot, (x, y) in zip(slots[moving].tolist(), between.tolist())}
+        # animation frames are only needed for drawing, so they advance per frame, not per tick
+        for piece in self.pieces.values():
+            piece._state._graphics.update(now)
+
+        with self.stats.phase("render"):
             current_board_img = self.renderer.draw(
                 self.pieces,
                 self.input_handler.focus_cell,
                 self.input_handler.focus_cell2,
                 self.input_handler._selected_source,
                 self.input_handler._selected_source2,
-                now
+                now,
+                positions
             )
+        if self.recorder is not None:
+            with self.stats.phase("record"):
+                self.recorder.offer(current_board_img, now)
+        with self.stats.phase("present"):
             self.renderer.show(current_board_img)
+        self.stats.frames += 1
 
-        self._announce_win()
-        self._running = False
-        self.renderer.destroy_windows()
+    def _piece_positions(self) -> np.ndarray:
+        """Copy of every slot's position, to interpolate from."""
+        return self.store.pos.copy()
 
-    def _update_position_mapping(self):
-        self.pos_to_piece.clear()
-        to_remove = set()
-
-        for piece in list(self.pieces.values()):
-            x, y = map(int, piece._state._physics.get_pos())
-            cell_x = x // self.board.cell_W_pix
-            cell_y = y // self.board.cell_H_pix
-            pos = (cell_y, cell_x)
-
-            if pos in self.pos_to_piece:
-                opponent = self.pos_to_piece[pos]
-                if (not opponent._state._current_command or
-                    opponent._state._current_command.type in ["idle", "long_rest", "short_rest"] or
-                        (piece._state._current_command and
-                         piece._state._current_command.type not in ["idle", "long_rest", "short_rest"] and
-                        opponent._state._physics.start_time > piece._state._physics.start_time)):
-                    self.pos_to_piece[pos] = piece
-                    to_remove.add(opponent.get_unique())
-                else:
-                    to_remove.add(piece.get_unique())
-            else:
-                self.pos_to_piece[pos] = piece
+    def _update_position_mapping(self, now: int):
+        """Move pieces on the occupancy grid when their cell changed, resolving captures."""
+        store = self.store
+        captured = self.collisions.update(now, self.physics.moved)
 
-        for k in to_remove:
-            self.pieces.pop(k, None)
+        # moves are tracked exactly by Collisions; anything else that left its cell is caught here.
+        # Only pieces that moved or changed state since the last tick can have a new cell or state
+        slots = np.union1d(store.take_touched(), self.physics.moved)
+        slots = slots[store.alive[slots]]
+        cells = store.cells_of(slots, self.board.cell_W_pix, self.board.cell_H_pix)
+        rows, cols = cells[:, 0], cells[:, 1]
+        in_bounds = (rows >= 0) & (rows < self.board.H_cells) & (cols >= 0) & (cols < self.board.W_cells)
+        # a mover's sampled cell runs ahead of Collisions' on the way up or left – don't move it twice
+        changed = in_bounds & ~self.collisions.tracked(slots) & np.any(cells != store.cell[slots], axis=1)
+
+        # pieces that stay put only need their state pushed to the grid, and only when it changed
+        for slot in slots[~changed & (store.state[slots] != store.grid_state[slots])].tolist():
+            piece = store.pieces[slot]
+            self.occupancy.set_state(piece, piece._state.name)
+            store.grid_state[slot] = store.state[slot]
+
+        if changed.any():
+            moved = [(slot, (r, c)) for slot, (r, c) in zip(slots[changed].tolist(), cells[changed].tolist())]
+            captured.extend(self.collisions.apply_crossings(now, moved))
+
+        for piece in captured:
+            store.remove(piece)
+            self.pieces.pop(piece.get_unique(), None)
+
+    @staticmethod
+    def _captures(piece, opponent) -> bool:
+        """True if `piece`, arriving on the cell of `opponent`, captures it."""
+        return (not opponent._state._current_command or
+                opponent._state._current_command.type in ["idle", "long_rest", "short_rest"] or
+                (piece._state._current_command and
+                 piece._state._current_command.type not in ["idle", "long_rest", "short_rest"] and
+                 opponent._state._physics.start_time > piece._state._physics.start_time))
 
     def _is_win(self) -> bool:
-        kings = [p for p in self.pieces.values() if p.get_id().lower().startswith("k")]
-        return len(kings) <= 1
+        return self.store.count_kings() <= 1
 
-    def _announce_win(self):
+    def winner(self) -> Optional[str]:
+        """Winning colour ("White" / "Black"), "Draw" if no king is left, None while both stand."""
         kings = [p for p in self.pieces.values() if p.get_id().lower().startswith("k")]
         if not kings:
+            return "Draw"
+        if len(kings) == 1:
+            return "White" if kings[0].get_id()[1] == 'W' else "Black"
+        return None
+
+    def _announce_win(self):
+        winner = self.winner()
+        if winner == "Draw":
              print("Draw.")
-        elif len(kings) == 1:
-            winner_color = "White" if kings[0].get_id()[1] == 'W' else "Black"
-            print(f"{winner_color} wins!")
+        elif winner:
+            print(f"{winner} wins!")
         else: # Should not happen if _is_win is correct
             print("Game over.")
@@ -1,10 +1,33 @@
+from typing import Iterable, Optional
+
 from Command import Command
 from MessageBroker import MessageBroker
-from EventQueue import EventQueue
 from EventType import EventType
+
+
 class GameEventPublisher:
-        def __init__(self, broker: MessageBroker):
-                self.broker = broker
+    """
+    What the game tells the broker, and in which shape:
+      GAME_START     – {"time_ms", "pieces": [piece ids]}
+      PIECE_MOVED    – the accepted move Command
+      PIECE_CAPTURED – the Collisions.CaptureEvent
+      GAME_END       – {"time_ms", "winner": "White" / "Black" / "Draw" / None}
+    """
+
+    def __init__(self, broker: MessageBroker):
+        self.broker = broker
+
+    def send(self, event_type: EventType, data):
+        self.broker.publish(event_type, data)
+
+    def game_start(self, now_ms: int, piece_ids: Iterable[str]):
+        self.send(EventType.GAME_START, {"time_ms": now_ms, "pieces": list(piece_ids)})
+
+    def piece_moved(self, cmd: Command):
+        self.send(EventType.PIECE_MOVED, cmd)
+
+    def piece_captured(self, event):
+        self.send(EventType.PIECE_CAPTURED, event)
 
-        def send(self, event_type: EventType, command: Command):
-                self.broker.publish(event_type, command)
+    def game_end(self, now_ms: int, winner: Optional[str]):
+        self.send(EventType.GAME_END, {"time_ms": now_ms, "winner": winner})
@@ -0,0 +1,109 @@
+import concurrent.futures
+import contextlib
+import io
+import multiprocessing
+import os
+import pathlib
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from Board import Board
+from Game import Game
+from InputSource import RandomPlayer
+from Moves import Moves
+
+COLOURS = {"W": "White", "B": "Black"}
+
+_worker: Optional["GameFarm"] = None  # the farm a pool process plays for, set by its initializer
+
+
+class GameFarm:
+    """
+    Plays many headless games of two RandomPlayers across a process pool.
+    Each game is one seed: on virtual time the same seed plays the same game,
+    whichever process or machine it lands on.
+
+    The parent builds one game before the pool starts, which fills the
+    process-wide caches every game reads (Moves tables, and sprites for
+    non-headless boards). With the fork start method the workers inherit
+    them instead of building their own; elsewhere each worker builds them
+    once, in its initializer, not once per game.
+    """
+
+    def __init__(self, make_board: Callable[[], Board], pieces_root: pathlib.Path, placement_csv: pathlib.Path,
+                 workers: Optional[int] = None, max_ms: int = 300_000, think_ms: int = 250,
+                 tick_hz: float = 100.0):
+        self.make_board = make_board
+        self.pieces_root = pieces_root
+        self.placement_csv = placement_csv
+        self.workers = workers or os.cpu_count() or 1
+        self.max_ms = max_ms
+        self.think_ms = think_ms
+        self.tick_hz = tick_hz
+
+    def play(self, seed: int) -> Dict:
+        """One game in this process: winner (None when max_ms ran out), game time, captures per colour."""
+        game = Game(self.make_board(), self.pieces_root, self.placement_csv, tick_hz=self.tick_hz, headless=True)
+        for colour in COLOURS:
+            game.input_handler.sources.append(RandomPlayer(colour, seed * 2 + (colour == "B"), self.think_ms))
+        start = _count_colours(game)
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # refused moves are printed
+            result = game.run_headless([], self.max_ms)
+        left = _count_colours(game)
+        return {
+            "seed": seed,
+            "winner": result["winner"],
+            "end_ms": result["end_ms"],
+            "ticks": result["ticks"],
+            # a colour's captures are the pieces the other colour lost
+            "captures": {name: start[other] - left[other] for name, other in (("White", "Black"), ("Black", "White"))},
+            "commands": result["commands"],
+            "wall_s": time.perf_counter() - t0,
+        }
+
+    def run(self, seeds: Iterable[int], chunksize: int = 4) -> List[Dict]:
+        """Play one game per seed on the pool; results come back in seed order."""
+        seeds = list(seeds)
+        self._warm_up()
+        context = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+        with concurrent.futures.ProcessPoolExecutor(self.workers, mp_context=context,
+                                                    initializer=_init_worker, initargs=(self,)) as pool:
+            return list(pool.map(_play, seeds, chunksize=chunksize))
+
+    @staticmethod
+    def summary(results: List[Dict]) -> Dict:
+        """Wins per colour (None = ran out of time), mean game length and captures over many games."""
+        n = max(len(results), 1)
+        wins: Dict[Optional[str], int] = {}
+        for r in results:
+            wins[r["winner"]] = wins.get(r["winner"], 0) + 1
+        return {
+            "games": len(results),
+            "wins": wins,
+            "mean_end_ms": sum(r["end_ms"] for r in results) / n,
+            "mean_captures": {name: sum(r["captures"][name] for r in results) / n for name in COLOURS.values()},
+            "ticks": sum(r["ticks"] for r in results),
+        }
+
+    # ─── internal helpers ────────────────────────────────────────────
+    def _warm_up(self):
+        Game(self.make_board(), self.pieces_root, self.placement_csv, tick_hz=self.tick_hz, headless=True)
+
+
+def _count_colours(game: Game) -> Dict[str, int]:
+    counts = dict.fromkeys(COLOURS.values(), 0)
+    for piece in game.pieces.values():
+        counts[COLOURS[piece.get_id()[1]]] += 1
+    return counts
+
+
+def _init_worker(farm: GameFarm):
+    global _worker
+    _worker = farm
+    if not Moves._table_cache:  # not forked from a warmed-up parent
+        farm._warm_up()
+
+
+def _play(seed: int) -> Dict:
+    return _worker.play(seed)
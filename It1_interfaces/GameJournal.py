@@ -0,0 +1,221 @@
+"""
+Journal file format (little endian):
+
+    header   MAGIC, u8 version, f64 tick_ms, i64 start_ms
+    record*  u8 kind, varint ms since the previous record, body
+
+    INTERN    varint length, utf-8 text – the next symbol id (0, 1, ...)
+    COMMAND   CMD:  piece sym, type sym, src row/col, dst row/col, flags,
+                    i32 record time - command timestamp
+    CAPTURE   CAP:  winner sym, loser sym, row, col
+    SNAPSHOT  SNAP: u32 ticks played, u16 rows; then rows * GameSnapshot.ROW
+    END       END:  winner sym (NO_SYM if none)
+
+Piece ids, command types and state names are written once as INTERN
+records and referred to by number after that. A command is stored with
+cells; flag PARAMS_ALGEBRAIC brings its ["e2", "e4"] form back. Record
+times never go back: captures of a tick come before its commands and its
+snapshot, all at or before the tick time.
+"""
+
+import pathlib
+import queue
+import struct
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from Command import Command
+from GameSnapshot import GameSnapshot, ROW, NO_SYM, PARAMS_ALGEBRAIC, algebraic_to_cell, command_params
+
+MAGIC = b"KFJ\x00"
+VERSION = 1
+HEADER = struct.Struct("<4sBdq")
+INTERN, COMMAND, CAPTURE, SNAPSHOT, END = range(5)
+CMD = struct.Struct("<HHbbbbBi")
+CAP = struct.Struct("<HHbb")
+SNAP = struct.Struct("<IH")
+END_BODY = struct.Struct("<H")
+FLUSH_BYTES = 16 * 1024  # hand the buffer to the writer thread once it is this big
+
+
+def write_varint(buf: bytearray, n: int):
+    while n >= 0x80:
+        buf.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+
+def read_varint(data, i: int) -> Tuple[int, int]:
+    """(value, index after it)."""
+    n = shift = 0
+    while True:
+        b = data[i]
+        i += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, i
+        shift += 7
+
+
+class JournalRecord:
+    __slots__ = ("kind", "time_ms", "data")
+
+    def __init__(self, kind: int, time_ms: int, data):
+        self.kind = kind
+        self.time_ms = time_ms
+        self.data = data
+
+    def __repr__(self):
+        return f"JournalRecord({self.kind}, {self.time_ms}, {self.data!r})"
+
+
+class GameJournal:
+    """
+    Append-only binary journal of one game: every accepted command, every
+    capture, and a snapshot of all pieces every snapshot_every_ms of game
+    time (for seeking in JournalReplay). Records are encoded on the game
+    thread into a small buffer – a few struct.pack calls per event – and
+    written to disk by a background thread, so the game loop never waits
+    for the file.
+    """
+
+    def __init__(self, path: pathlib.Path, snapshot_every_ms: int = 1000):
+        self.path = pathlib.Path(path)
+        self.snapshot_every_ms = snapshot_every_ms
+        self.records = 0
+        self._symbols = {}
+        self._buf = bytearray()
+        self._last_ms = 0
+        self._last_snapshot_ms = None
+        self._chunks: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+        self._file = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ─── called by Game ──────────────────────────────────────────────
+    def begin(self, now_ms: int, game):
+        self._file = self.path.open("wb")
+        self._thread = threading.Thread(target=self._write_chunks, daemon=True, name="journal-writer")
+        self._thread.start()
+        self._buf += HEADER.pack(MAGIC, VERSION, game.tick_ms, now_ms)
+        self._last_ms = now_ms
+        self.snapshot(now_ms, game)
+        self._flush()
+
+    def command(self, now_ms: int, cmd: Command):
+        src, dst = cmd.params[0], cmd.params[1]
+        flags = PARAMS_ALGEBRAIC if isinstance(src, str) else 0  # a mixed ["e2", (4, 4)] comes back in src's form
+        src, dst = (algebraic_to_cell(p) if isinstance(p, str) else p for p in (src, dst))
+        piece, kind = self._sym(str(cmd.piece_id)), self._sym(cmd.type)
+        self._record(COMMAND, now_ms)
+        self._buf += CMD.pack(piece, kind, src[0], src[1], dst[0], dst[1], flags, now_ms - cmd.timestamp)
+
+    def capture(self, event):
+        winner, loser = self._sym(event.winner.get_id()), self._sym(event.loser.get_id())
+        self._record(CAPTURE, int(event.time_ms))
+        self._buf += CAP.pack(winner, loser, event.cell[0], event.cell[1])
+
+    def after_tick(self, now_ms: int, game):
+        if now_ms - self._last_snapshot_ms >= self.snapshot_every_ms:
+            self.snapshot(now_ms, game)
+        if len(self._buf) >= FLUSH_BYTES:
+            self._flush()
+
+    def snapshot(self, now_ms: int, game):
+        rows = GameSnapshot.capture(game, now_ms).rows(self._sym)
+        self._record(SNAPSHOT, now_ms)
+        self._buf += SNAP.pack(game.stats.ticks, len(rows))
+        self._buf += rows.tobytes()
+        self._last_snapshot_ms = now_ms
+
+    def close(self, now_ms: int, winner: Optional[str]):
+        winner_sym = NO_SYM if winner is None else self._sym(winner)
+        self._record(END, now_ms)
+        self._buf += END_BODY.pack(winner_sym)
+        self._flush()
+        self._chunks.put(None)
+        self._thread.join()
+        self._file.close()
+
+    # ─── internal helpers ────────────────────────────────────────────
+    def _record(self, kind: int, time_ms: int):
+        self._buf.append(kind)
+        write_varint(self._buf, max(time_ms - self._last_ms, 0))
+        self._last_ms = max(time_ms, self._last_ms)
+        self.records += 1
+
+    def _sym(self, text: str) -> int:
+        sym = self._symbols.get(text)
+        if sym is None:
+            sym = self._symbols[text] = len(self._symbols)
+            data = text.encode()
+            self._record(INTERN, self._last_ms)
+            write_varint(self._buf, len(data))
+            self._buf += data
+        return sym
+
+    def _flush(self):
+        if self._buf:
+            self._chunks.put(bytes(self._buf))
+            self._buf.clear()
+
+    def _write_chunks(self):
+        while True:
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._file.flush()
+                return
+            self._file.write(chunk)
+
+
+class JournalReader:
+    """Decodes a journal file: header fields, then records() in file order."""
+
+    def __init__(self, path: pathlib.Path):
+        self.data = pathlib.Path(path).read_bytes()
+        magic, version, self.tick_ms, self.start_ms = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a game journal")
+        if version != VERSION:
+            raise ValueError(f"{path}: journal version {version}, expected {VERSION}")
+        self.symbols: List[str] = []
+
+    def records(self) -> Iterator[JournalRecord]:
+        """
+        COMMAND -> Command, CAPTURE -> (winner id, loser id, cell),
+        SNAPSHOT -> (ticks played, ROW array, symbol table), END -> winner.
+        """
+        data, symbols = self.data, self.symbols
+        symbols.clear()
+        i, t = HEADER.size, self.start_ms
+        while i < len(data):
+            kind = data[i]
+            dt, i = read_varint(data, i + 1)
+            t += dt
+            if kind == INTERN:
+                n, i = read_varint(data, i)
+                symbols.append(data[i:i + n].decode())
+                i += n
+                continue
+            if kind == COMMAND:
+                piece, cmd_type, sr, sc, dr, dc, flags, ts_offset = CMD.unpack_from(data, i)
+                i += CMD.size
+                params = command_params((sr, sc), (dr, dc), flags)
+                yield JournalRecord(kind, t, Command(t - ts_offset, symbols[piece], symbols[cmd_type], params))
+            elif kind == CAPTURE:
+                winner, loser, row, col = CAP.unpack_from(data, i)
+                i += CAP.size
+                yield JournalRecord(kind, t, (symbols[winner], symbols[loser], (row, col)))
+            elif kind == SNAPSHOT:
+                ticks, count = SNAP.unpack_from(data, i)
+                i += SNAP.size
+                rows = np.frombuffer(data, dtype=ROW, count=count, offset=i)
+                i += count * ROW.itemsize
+                yield JournalRecord(kind, t, (ticks, rows, symbols))
+            elif kind == END:
+                (winner,) = END_BODY.unpack_from(data, i)
+                i += END_BODY.size
+                yield JournalRecord(kind, t, None if winner == NO_SYM else symbols[winner])
+            else:
+                raise ValueError(f"Unknown journal record kind {kind} at byte {i}")
@@ -1,53 +1,153 @@
 import cv2
+import numpy as np
 from Board import Board
+from FramePool import FramePool
+
+# (color) of the cursor squares, in drawing order:
+# focus user 1, focus user 2, selected source user 1, selected source user 2
+CURSOR_COLORS = ((0, 255, 255), (255, 0, 0), (0, 0, 255), (0, 255, 0))
+
 
 class GameRenderer:
-    def __init__(self, board: Board):
+    def __init__(self, board: Board, incremental: bool = True, verify: bool = False):
+        """
+        incremental=True keeps a persistent frame and only restores/redraws the
+        cells that changed since the last frame. incremental=False redraws the
+        whole board every frame. verify=True renders both and reports any mismatch.
+        Frames and blend temporaries come from a FramePool, so drawing
+        allocates no arrays once the first frames are done.
+        """
         self.board = board
+        self.incremental = incremental
+        self.verify = verify
+        self.pool = FramePool(frames=2)  # full redraws; verify keeps one while drawing the other
+        self._frame = None
+        self._drawn = {}  # piece unique -> (x, y, sprite) drawn in the previous frame
+        self._cursors = (None, None, None, None)
+        self.last_dirty_cells = 0
+        self.mismatched_frames = 0
+
+    def draw(self, pieces: dict, focus_cell: tuple, focus_cell2: tuple, selected_source: tuple, selected_source2: tuple, now_ms: int,
+             positions: dict = None):
+        """positions: optional piece unique -> (x, y) overriding where a piece is drawn (interpolation)."""
+        positions = positions or {}
+        if not self.incremental:
+            return self.draw_full(pieces, focus_cell, focus_cell2, selected_source, selected_source2, now_ms, positions)
+
+        frame = self._draw_incremental(pieces, (focus_cell, focus_cell2, selected_source, selected_source2), positions)
+
+        if self.verify:
+            expected = self.draw_full(pieces, focus_cell, focus_cell2, selected_source, selected_source2, now_ms, positions)
+            if not np.array_equal(frame, expected):
+                self.mismatched_frames += 1
+                print(f"Incremental frame differs from full redraw at {now_ms} ms.")
+                np.copyto(frame, expected)
+        return frame
+
+    def draw_full(self, pieces: dict, focus_cell: tuple, focus_cell2: tuple, selected_source: tuple, selected_source2: tuple, now_ms: int,
+                  positions: dict = None):
+        """Redraw everything over a copy of the board (reference path); valid until two more full redraws."""
+        positions = positions or {}
+        background = self.board.img.img
+        frame = self.pool.frame(background.shape, background.dtype)
+        np.copyto(frame, background)
+
+        for uid, piece in pieces.items():
+            piece.draw_on_region(frame, pos=positions.get(uid), pool=self.pool)
+
+        for cell, color in zip((focus_cell, focus_cell2, selected_source, selected_source2), CURSOR_COLORS):
+            if cell:
+                self._draw_cursor(frame, cell, color)
+
+        return frame
+
+    # ─── incremental path ────────────────────────────────────────────
+    def _draw_incremental(self, pieces: dict, cursors: tuple, positions: dict):
+        background = self.board.img.img
+        first_frame = self._frame is None or self._frame.shape != background.shape
+        if first_frame:
+            self._frame = background.copy()
+            self._drawn = {}
+            self._cursors = (None, None, None, None)
+
+        rows = -(-background.shape[0] // self.board.cell_H_pix)
+        cols = -(-background.shape[1] // self.board.cell_W_pix)
+
+        dirty = set()
+        if first_frame:
+            dirty.update((r, c) for r in range(rows) for c in range(cols))
+
+        drawn = {}
+        for uid, piece in pieces.items():
+            x, y, sprite = piece.get_sprite(positions.get(uid))
+            if sprite.img is None:
+                continue
+            drawn[uid] = (x, y, sprite)
+            old = self._drawn.pop(uid, None)
+            if old is None or old[0] != x or old[1] != y or old[2] is not sprite:
+                self._add_rect_cells(dirty, x, y, sprite.img.shape[1], sprite.img.shape[0], rows, cols)
+                if old is not None:
+                    self._add_rect_cells(dirty, old[0], old[1], old[2].img.shape[1], old[2].img.shape[0], rows, cols)
+        for x, y, sprite in self._drawn.values():  # pieces that disappeared
+            self._add_rect_cells(dirty, x, y, sprite.img.shape[1], sprite.img.shape[0], rows, cols)
+
+        for old_cell, new_cell in zip(self._cursors, cursors):
+            if old_cell != new_cell:
+                for cell in (old_cell, new_cell):
+                    if cell:
+                        self._add_cursor_cells(dirty, cell, rows, cols)
+
+        self._drawn = drawn
+        self._cursors = cursors
+        self.last_dirty_cells = len(dirty)
+        if not dirty:
+            return self._frame
+
+        # which pieces touch which dirty cell, keeping the draw order of `pieces`
+        touching = {}
+        for uid, (x, y, sprite) in drawn.items():
+            for cell in self._rect_cells(x, y, sprite.img.shape[1], sprite.img.shape[0], rows, cols):
+                if cell in dirty:
+                    touching.setdefault(cell, []).append((pieces[uid], (x, y)))
+
+        cw, ch = self.board.cell_W_pix, self.board.cell_H_pix
+        for cell in dirty:
+            r, c = cell
+            ox, oy = c * cw, r * ch
+            region = self._frame[oy:oy + ch, ox:ox + cw]
+            np.copyto(region, background[oy:oy + ch, ox:ox + cw])
+            for piece, pos in touching.get(cell, ()):
+                piece.draw_on_region(region, ox, oy, pos, self.pool)
+            for cursor, color in zip(cursors, CURSOR_COLORS):
+                if cursor and abs(cursor[0] - r) <= 1 and abs(cursor[1] - c) <= 1:
+                    self._draw_cursor(region, cursor, color, ox, oy)
+
+        return self._frame
+
+    def _rect_cells(self, x, y, w, h, rows, cols):
+        cw, ch = self.board.cell_W_pix, self.board.cell_H_pix
+        r0, r1 = max(y // ch, 0), min((y + h - 1) // ch, rows - 1)
+        c0, c1 = max(x // cw, 0), min((x + w - 1) // cw, cols - 1)
+        return [(r, c) for r in range(r0, r1 + 1) for c in range(c0, c1 + 1)]
+
+    def _add_rect_cells(self, dirty, x, y, w, h, rows, cols):
+        dirty.update(self._rect_cells(x, y, w, h, rows, cols))
+
+    @staticmethod
+    def _add_cursor_cells(dirty, cell, rows, cols):
+        # the 2px outline bleeds one pixel into the neighbouring cells
+        r, c = cell
+        for rr in range(max(r - 1, 0), min(r + 2, rows)):
+            for cc in range(max(c - 1, 0), min(c + 2, cols)):
+                dirty.add((rr, cc))
 
-    def draw(self, pieces: dict, focus_cell: tuple, focus_cell2: tuple, selected_source: tuple, selected_source2: tuple, now_ms: int):
-        board_clone = self.board.clone()
-
-        for piece in pieces.values():
-            piece.draw_on_board(board_clone, now_ms)
-
-        # Draw focus square for user 1 (yellow)
-        if focus_cell:
-            y, x = focus_cell
-            x1 = x * self.board.cell_W_pix
-            y1 = y * self.board.cell_H_pix
-            x2 = (x + 1) * self.board.cell_W_pix
-            y2 = (y + 1) * self.board.cell_H_pix
-            cv2.rectangle(board_clone.img.img, (x1, y1), (x2, y2), (0, 255, 255), 2)
-
-        # Draw focus square for user 2 (blue)
-        if focus_cell2:
-            y2_, x2_ = focus_cell2
-            sx1 = x2_ * self.board.cell_W_pix
-            sy1 = y2_ * self.board.cell_H_pix
-            sx2 = (x2_ + 1) * self.board.cell_W_pix
-            sy2 = (y2_ + 1) * self.board.cell_H_pix
-            cv2.rectangle(board_clone.img.img, (sx1, sy1), (sx2, sy2), (255, 0, 0), 2)
-
-        # Draw source selection square for user 1
-        if selected_source:
-            sy, sx = selected_source
-            sx1 = sx * self.board.cell_W_pix
-            sy1 = sy * self.board.cell_H_pix
-            sx2 = (sx + 1) * self.board.cell_W_pix
-            sy2 = (sy + 1) * self.board.cell_H_pix
-            cv2.rectangle(board_clone.img.img, (sx1, sy1), (sx2, sy2), (0, 0, 255), 2)
-
-        # Draw source selection square for user 2
-        if selected_source2:
-            sy, sx = selected_source2
-            sx1 = sx * self.board.cell_W_pix
-            sy1 = sy * self.board.cell_H_pix
-            sx2 = (sx + 1) * self.board.cell_W_pix
-            sy2 = (sy + 1) * self.board.cell_H_pix
-            cv2.rectangle(board_clone.img.img, (sx1, sy1), (sx2, sy2), (0, 255, 0), 2)
-
-        return board_clone.img.img
+    def _draw_cursor(self, image, cell, color, ox: int = 0, oy: int = 0):
+        y, x = cell
+        x1 = x * self.board.cell_W_pix - ox
+        y1 = y * self.board.cell_H_pix - oy
+        x2 = (x + 1) * self.board.cell_W_pix - ox
+        y2 = (y + 1) * self.board.cell_H_pix - oy
+        cv2.rectangle(image, (x1, y1), (x2, y2), color, 2)
 
     @staticmethod
     def show(image):
@@ -0,0 +1,224 @@
+import asyncio
+import math
+import pathlib
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from Board import Board
+from Clock import RealTimeClock
+from Command import Command
+from Game import Game, MAX_TICKS_PER_FRAME
+from LatencyHistogram import LatencyHistogram
+from NetProtocol import HELLO_BODY, MOVE_BODY, WATCH, read_frame, decode_hello, decode_move
+from SpectatorStream import SpectatorStream
+
+SLOW_CLIENT_BYTES = 1 << 20  # a client this much behind on reading is disconnected
+MAX_CLIENT_FRAME = max(HELLO_BODY.size, MOVE_BODY.size)
+
+
+class HostedGame:
+    """One authoritative, headless Game on the server and the clients watching its SpectatorStream."""
+
+    def __init__(self, game_id: int, game: Game):
+        self.id = game_id
+        self.game = game
+        self.stream = game.spectators
+        self.clients: Dict[asyncio.StreamWriter, Callable[[bytes], bool]] = {}  # writer -> its stream subscription
+        self.histogram = LatencyHistogram()  # how long after its due time each tick was done
+        self.ticks = 0
+        self.skipped_ticks = 0
+        self.moves = {"accepted": 0, "refused": 0}  # refused here: not the sender's piece or colour
+        self.bytes_sent = 0
+        self.finished = False
+        self._sim_ms = 0.0
+        self._next_due = 0.0  # perf_counter() time the next tick is due
+
+    def start(self, first_due: float):
+        """Start the game; its ticks fall due every tick_ms from first_due (a perf_counter() time)."""
+        game = self.game
+        start_ms = game.game_time_ms()
+        for piece in game.pieces.values():
+            piece.reset(start_ms)
+        game._start_events(start_ms)
+        self._sim_ms = float(start_ms)
+        self._next_due = first_due
+
+    def advance(self) -> int:
+        """Run every tick that is due and broadcast what changed; returns the ticks run."""
+        game = self.game
+        period = game.tick_ms / 1000
+        ticks = 0
+        while self._next_due <= time.perf_counter() and ticks < MAX_TICKS_PER_FRAME and not game._is_win():
+            game._tick(int(self._sim_ms))
+            self.histogram.record((time.perf_counter() - self._next_due) * 1000)
+            self._sim_ms += game.tick_ms
+            self._next_due += period
+            ticks += 1
+        behind = time.perf_counter() - self._next_due
+        if behind >= 0:  # too far behind: skip ahead instead of spiralling
+            skip = math.floor(behind / period) + 1
+            self._sim_ms += skip * game.tick_ms
+            self._next_due += skip * period
+            self.skipped_ticks += skip
+        self.ticks += ticks
+        if game._is_win():
+            self.finished = True
+            game._end_events(int(self._sim_ms))  # the stream sends END
+        return ticks
+
+    def submit(self, colour: str, src: Tuple[int, int], dst: Tuple[int, int]):
+        """A client's move request. The server only takes moves of the sender's own pieces."""
+        game = self.game
+        piece = game.pos_to_piece.get(src)
+        if colour == WATCH or piece is None or piece.get_id()[1] != colour or not game.board.is_valid_cell(dst):
+            self.moves["refused"] += 1
+            return
+        self.moves["accepted"] += 1
+        game.input_handler.submit(Command(game.game_time_ms(), piece.get_unique(), "move",
+                                          [game.board.cell_to_algebraic(src), game.board.cell_to_algebraic(dst)]))
+
+    def join(self, writer: asyncio.StreamWriter):
+        """Stream the game to a client; it gets the welcome and a keyframe right away."""
+        def send(data: bytes) -> bool:
+            if writer.is_closing():
+                return False
+            if writer.transport.get_write_buffer_size() > SLOW_CLIENT_BYTES:
+                print(f"Game {self.id}: dropping a client that stopped reading")
+                writer.close()
+                return False
+            writer.write(data)
+            self.bytes_sent += len(data)
+            return True
+        self.clients[writer] = send
+        self.stream.subscribe(send)
+
+    def leave(self, writer: asyncio.StreamWriter):
+        send = self.clients.pop(writer, None)
+        if send is not None:
+            self.stream.unsubscribe(send)
+
+
+class GameServer:
+    """
+    asyncio TCP server hosting many authoritative Games in one process. Each
+    game is headless and runs on its own real-time clock; a single tick
+    loop advances every game that is due. Each game's SpectatorStream sends
+    its clients, after every tick, one delta (NetProtocol) of the pieces
+    that changed – encoded once, written to all of them. Clients only send
+    move requests; the server's
+    game validates them like local input. Per game it keeps a histogram of
+    how late each tick finished against its due time.
+    """
+
+    def __init__(self, make_board: Callable[[], Board], pieces_root: pathlib.Path, placement_csv: pathlib.Path,
+                 tick_hz: float = 100.0, host: str = "127.0.0.1", port: int = 0, keyframe_every: int = 100):
+        self.make_board = make_board
+        self.pieces_root = pieces_root
+        self.placement_csv = placement_csv
+        self.tick_hz = tick_hz
+        self.keyframe_every = keyframe_every
+        self.host = host
+        self.port = port
+        self.games: Dict[int, HostedGame] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._running = False
+        self._started = 0.0
+        self._next_pass = 0.0  # perf_counter() time of the tick loop's next pass
+
+    def host_game(self, game_id: int) -> HostedGame:
+        """The game with this id, started now if there is none (or the last one finished)."""
+        hosted = self.games.get(game_id)
+        if hosted is None or hosted.finished:
+            game = Game(self.make_board(), self.pieces_root, self.placement_csv, tick_hz=self.tick_hz,
+                        headless=True, clock=RealTimeClock(), input_sources=[],
+                        spectators=SpectatorStream(game_id, self.keyframe_every))
+            hosted = self.games[game_id] = HostedGame(game_id, game)
+            hosted.start(self._next_pass)  # on the loop's grid, so lateness is the loop's, not a phase offset
+        return hosted
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._on_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._running = True
+        self._started = self._next_pass = time.perf_counter()
+        self._loop_task = asyncio.create_task(self._tick_loop())
+
+    async def stop(self):
+        self._running = False
+        if self._loop_task is not None:
+            await self._loop_task
+        self._server.close()
+        for hosted in self.games.values():
+            for writer in list(hosted.clients):
+                writer.close()
+            hosted.clients.clear()
+        await self._server.wait_closed()
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"Serving on {self.host}:{self.port}")
+        try:
+            await self._loop_task
+        finally:
+            await self.stop()
+
+    def reset_stats(self):
+        """Start the report over from now, e.g. after a warm-up."""
+        self._started = time.perf_counter()
+        for hosted in self.games.values():
+            hosted.histogram = LatencyHistogram()
+            hosted.ticks = hosted.skipped_ticks = hosted.bytes_sent = 0
+            hosted.stream.encode_s = hosted.stream.fanout_s = 0.0
+
+    def report(self) -> dict:
+        """Tick lateness over all games, achieved tick rate and traffic."""
+        elapsed = max(time.perf_counter() - self._started, 1e-9)
+        merged = LatencyHistogram()
+        for hosted in self.games.values():
+            merged.merge(hosted.histogram)
+        games = max(len(self.games), 1)
+        ticks = max(sum(h.ticks for h in self.games.values()), 1)
+        return {
+            "games": len(self.games),
+            "tick_hz_per_game": sum(h.ticks for h in self.games.values()) / elapsed / games,
+            "skipped_ticks": sum(h.skipped_ticks for h in self.games.values()),
+            "tick_late": merged.summary(),
+            "bytes_per_s": sum(h.bytes_sent for h in self.games.values()) / elapsed,
+            "encode_us_per_tick": sum(h.stream.encode_s for h in self.games.values()) / ticks * 1e6,
+            "fanout_us_per_tick": sum(h.stream.fanout_s for h in self.games.values()) / ticks * 1e6,
+            "moves": {k: sum(h.moves[k] for h in self.games.values()) for k in ("accepted", "refused")},
+            "commands": {k: sum(h.game.command_handler.totals[k] for h in self.games.values())
+                         for k in ("accepted", "rejected", "dropped")},
+        }
+
+    # ─── internal helpers ────────────────────────────────────────────
+    async def _on_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        hosted = None
+        try:
+            game_id, colour = decode_hello(await read_frame(reader, MAX_CLIENT_FRAME))
+            hosted = self.host_game(game_id)
+            hosted.join(writer)
+            while True:
+                src, dst = decode_move(await read_frame(reader, MAX_CLIENT_FRAME))
+                hosted.submit(colour, src, dst)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ValueError as e:  # a malformed message ends the connection, never the server
+            print(f"Dropping client {writer.get_extra_info('peername')}: {e}")
+        finally:
+            if hosted is not None:
+                hosted.leave(writer)
+            writer.close()
+
+    async def _tick_loop(self):
+        period = 1.0 / self.tick_hz
+        while self._running:
+            await asyncio.sleep(max(self._next_pass - time.perf_counter(), 0.0))
+            for hosted in list(self.games.values()):
+                if not hosted.finished:
+                    hosted.advance()
+            now = time.perf_counter()
+            self._next_pass += period
+            if self._next_pass <= now:  # overloaded: stay on the grid but drop the passes already missed
+                self._next_pass += math.ceil((now - self._next_pass) / period) * period
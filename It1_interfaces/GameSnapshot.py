@@ -0,0 +1,258 @@
+import struct
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from Command import Command
+
+NO_SYM = 0xFFFF
+PARAMS_ALGEBRAIC = 1  # the command's params were ["e2", "e4"] rather than cells
+
+# one piece in serialized form: its PieceStore row plus the command its current state runs
+ROW = np.dtype([
+    ("piece", "<u2"), ("state", "<u2"), ("cmd_type", "<u2"), ("flags", "u1"), ("has_moved", "u1"),
+    ("cell", "i1", 2), ("cmd_src", "i1", 2), ("cmd_dst", "i1", 2), ("cmd_ts", "<i8"),
+    ("pos", "<f8", 2), ("start_ms", "<i8"), ("duration_ms", "<i4"), ("total_ms", "<i4"),
+    ("start_pos", "<f8", 2), ("end_pos", "<f8", 2),
+])
+BLOB = struct.Struct("<4sqIHH")  # magic, time_ms, ticks, names, rows
+BLOB_MAGIC = b"KFS\x00"
+
+STORE_COLUMNS = ("pos", "start_ms", "duration_ms", "total_ms", "start_pos", "end_pos", "state",
+                 "grid_state", "color", "kind", "has_moved", "alive", "cell", "epoch")
+GRID_PLANES = ("index", "color", "state")
+
+
+class GameSnapshot:
+    """
+    The simulation state of a Game at the end of a tick – PieceStore rows,
+    occupancy grid, physics timers and each piece's current state and
+    command – without any pixels.
+
+    capture() copies arrays, not objects: a column that did not change since
+    the `previous` snapshot is shared with it (snapshots are read-only), so
+    a snapshot per tick costs little more than the columns that moved. The
+    pieces' State objects and Commands are referenced, never copied – they
+    are not changed after the fact. restore() writes all of it back into the
+    same Game in place (np.copyto and a short loop over the pieces), in
+    microseconds, so rewinding is as cheap as saving.
+
+    to_bytes() / from_bytes() and rows() / load_rows() are the compact
+    serialized form (one ROW per piece), for save files and GameJournal.
+    """
+
+    __slots__ = ("time_ms", "ticks", "size", "columns", "store_pieces", "free", "touched", "restarted",
+                 "grid_planes", "grid_lists", "deadlines", "flying", "moved", "pieces", "piece_states")
+
+    # ─── capture / restore in memory ─────────────────────────────────
+    @classmethod
+    def capture(cls, game, time_ms: int, previous: Optional["GameSnapshot"] = None) -> "GameSnapshot":
+        snap = cls.__new__(cls)
+        store, grid, physics = game.store, game.occupancy, game.physics
+        snap.time_ms = time_ms
+        snap.ticks = game.stats.ticks
+        n = snap.size = store.size
+        shared = previous is not None and previous.size == n
+
+        snap.columns = {}
+        for name in STORE_COLUMNS:
+            column = getattr(store, name)[:n]
+            old = previous.columns[name] if shared else None
+            snap.columns[name] = old if old is not None and np.array_equal(old, column) else _frozen(column)
+        snap.grid_planes = {}
+        for name in GRID_PLANES:
+            plane = getattr(grid, name)
+            old = previous.grid_planes[name] if previous is not None else None
+            snap.grid_planes[name] = old if old is not None and np.array_equal(old, plane) else _frozen(plane)
+
+        snap.store_pieces = _shared(tuple(store.pieces[:n]), previous and previous.store_pieces)
+        snap.free = tuple(store._free)
+        snap.touched = frozenset(store._touched)
+        snap.restarted = frozenset(store._restarted)
+        snap.grid_lists = (tuple(grid._pieces), tuple(grid._cells), tuple(grid._state_names),
+                           dict(grid._slot_of), tuple(grid._free))
+        snap.deadlines = tuple(physics._deadlines)
+        snap.flying = dict(physics._flying)
+        snap.moved = physics.moved
+        snap.pieces = _shared(tuple(game.pieces.items()), previous and previous.pieces)
+        snap.piece_states = _shared(tuple(
+            (piece, piece._slot, piece._state, piece._state._current_command, piece._current_cmd,
+             piece._state._graphics.start_time, piece._state._graphics.current_frame)
+            for piece in store.pieces[:n] if piece is not None), previous and previous.piece_states)
+        return snap
+
+    def restore(self, game):
+        """Put `game` (the game this was captured from) back into this state."""
+        store, grid, physics = game.store, game.occupancy, game.physics
+        n = self.size
+        if store.capacity < n:
+            store._allocate(max(n, store.capacity * 2))
+        for piece, slot, state, command, piece_cmd, gfx_start, gfx_frame in self.piece_states:
+            if piece._slot != slot:  # re-added to another slot after this snapshot
+                piece._bind(store, slot)
+                for s in state._machine.values():
+                    s._physics._store, s._physics._slot = store, slot
+            piece._state = state
+            state._current_command = command
+            piece._current_cmd = piece_cmd
+            state._graphics.start_time = gfx_start
+            state._graphics.current_frame = gfx_frame
+
+        for name, column in self.columns.items():
+            np.copyto(getattr(store, name)[:n], column)
+        store.size = n
+        store.pieces[:n] = self.store_pieces
+        store._free[:] = self.free
+        store._touched = set(self.touched)
+        store._restarted = set(self.restarted)
+
+        for name, plane in self.grid_planes.items():
+            np.copyto(getattr(grid, name), plane)
+        pieces, cells, names, slot_of, free = self.grid_lists
+        grid._pieces[:] = pieces
+        grid._cells[:] = cells
+        grid._state_names[:] = names
+        grid._slot_of = dict(slot_of)
+        grid._free[:] = free
+
+        physics._deadlines = list(self.deadlines)
+        physics._flying = dict(self.flying)
+        physics.moved = self.moved
+        game.collisions.last_ms = self.time_ms
+        game.collisions.events = []
+        game.pieces.clear()
+        game.pieces.update(self.pieces)
+        game.stats.ticks = self.ticks
+
+    def nbytes(self, previous: Optional["GameSnapshot"] = None) -> int:
+        """Bytes of array data this snapshot holds that `previous` does not share."""
+        shared = set()
+        if previous is not None:
+            shared = {id(a) for a in (*previous.columns.values(), *previous.grid_planes.values())}
+        return sum(a.nbytes for a in (*self.columns.values(), *self.grid_planes.values()) if id(a) not in shared)
+
+    # ─── serialized form ─────────────────────────────────────────────
+    def rows(self, sym: Callable[[str], int]) -> np.ndarray:
+        """One ROW per piece on the board; `sym` numbers the strings (piece ids, states, command types)."""
+        c = self.columns
+        slots = np.flatnonzero(c["alive"])
+        rows = np.zeros(len(slots), dtype=ROW)
+        for name in ("pos", "start_ms", "duration_ms", "total_ms", "start_pos", "end_pos", "has_moved", "cell"):
+            rows[name] = c[name][slots]
+        by_slot = {entry[1]: entry for entry in self.piece_states}
+        for row, slot in zip(rows, slots.tolist()):
+            piece, _, state, cmd = by_slot[slot][:4]
+            row["piece"] = sym(piece.get_id())
+            row["state"] = sym(state.name)
+            if cmd is None:
+                row["cmd_type"] = NO_SYM
+                continue
+            src, dst = cmd.params[0], cmd.params[1]
+            if isinstance(src, str):
+                row["flags"] = PARAMS_ALGEBRAIC
+                src, dst = algebraic_to_cell(src), algebraic_to_cell(dst)
+            row["cmd_type"] = sym(cmd.type)
+            row["cmd_src"], row["cmd_dst"], row["cmd_ts"] = src, dst, cmd.timestamp
+        return rows
+
+    @classmethod
+    def load_rows(cls, game, rows: np.ndarray, symbols: List[str], time_ms: int, ticks: int,
+                  pieces: Dict[str, object]) -> "GameSnapshot":
+        """
+        Rebuild `game` from serialized rows and return its snapshot. `pieces`
+        maps piece id -> Piece for every piece the game was created with,
+        captured ones included. Slower than restore(): it re-adds pieces and
+        rebuilds the grid and the timers; restore() the result to come back.
+        """
+        store, grid = game.store, game.occupancy
+        grid.clear()
+        on_board = set()
+        for row in rows:
+            piece = pieces[symbols[row["piece"]]]
+            on_board.add(piece.get_id())
+            cell = (int(row["cell"][0]), int(row["cell"][1]))
+            if piece._slot is None or store.pieces[piece._slot] is not piece:
+                store.add(piece, cell)  # captured since: back on the board
+            game.pieces[piece.get_unique()] = piece
+
+            state = piece._state._machine[symbols[row["state"]]]
+            cmd = None
+            if row["cmd_type"] != NO_SYM:
+                cmd = Command(int(row["cmd_ts"]), piece.get_id(), symbols[row["cmd_type"]],
+                              command_params(row["cmd_src"], row["cmd_dst"], row["flags"]))
+                state._graphics.reset(cmd)
+            state._current_command = cmd
+            piece._current_cmd = cmd
+            piece._set_state(state)
+
+            slot = piece._slot
+            for name in ("pos", "start_ms", "duration_ms", "total_ms", "start_pos", "end_pos", "has_moved"):
+                getattr(store, name)[slot] = row[name]
+            store.cell[slot] = cell
+            store.grid_state[slot] = store.state[slot]
+            store.restart_timer(slot)  # BatchPhysics schedules the restored timer on the next step
+            grid.place(piece, cell)
+
+        for piece_id, piece in pieces.items():
+            if piece_id not in on_board:
+                store.remove(piece)
+                game.pieces.pop(piece.get_unique(), None)
+        game.physics._deadlines.clear()
+        game.physics._flying.clear()
+        game.physics.moved = np.empty(0, dtype=np.int64)
+        game.collisions.last_ms = time_ms
+        game.stats.ticks = ticks
+        return cls.capture(game, time_ms)
+
+    def to_bytes(self) -> bytes:
+        """Self-contained compact form: BLOB header, the names, then the rows."""
+        names: Dict[str, int] = {}
+        rows = self.rows(lambda text: names.setdefault(text, len(names)))
+        encoded = [text.encode() for text in names]
+        parts = [BLOB.pack(BLOB_MAGIC, self.time_ms, self.ticks, len(encoded), len(rows))]
+        for data in encoded:
+            parts.append(struct.pack("<B", len(data)) + data)
+        parts.append(rows.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, game, data: bytes, pieces: Dict[str, object]) -> "GameSnapshot":
+        """load_rows() from to_bytes() output."""
+        magic, time_ms, ticks, name_count, row_count = BLOB.unpack_from(data, 0)
+        if magic != BLOB_MAGIC:
+            raise ValueError("Not a game snapshot")
+        i = BLOB.size
+        symbols = []
+        for _ in range(name_count):
+            n = data[i]
+            symbols.append(data[i + 1:i + 1 + n].decode())
+            i += 1 + n
+        rows = np.frombuffer(data, dtype=ROW, count=row_count, offset=i)
+        return cls.load_rows(game, rows, symbols, time_ms, ticks, pieces)
+
+
+def command_params(src, dst, flags: int) -> list:
+    """Params of a serialized command, in the form the game used."""
+    src, dst = (int(src[0]), int(src[1])), (int(dst[0]), int(dst[1]))
+    if flags & PARAMS_ALGEBRAIC:
+        return [cell_to_algebraic(src), cell_to_algebraic(dst)]
+    return [src, dst]
+
+
+# same 8x8 notation as Board.algebraic_to_cell / cell_to_algebraic, without needing a Board
+def algebraic_to_cell(notation: str) -> Tuple[int, int]:
+    return 8 - int(notation[1]), ord(notation[0]) - ord("a")
+
+
+def cell_to_algebraic(cell: Tuple[int, int]) -> str:
+    return f"{chr(ord('a') + cell[1])}{8 - cell[0]}"
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    copy = array.copy()
+    copy.flags.writeable = False
+    return copy
+
+
+def _shared(value: tuple, old: Optional[tuple]) -> tuple:
+    return old if old is not None and old == value else value
@@ -1,30 +1,37 @@
 import pathlib
-import time
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
 import copy
 from img import Img
 from Command import Command
 from Board import Board
+from SpriteAtlas import SpriteAtlas
+from Clock import Clock
 
 
 class Graphics:
+    __slots__ = ("board", "atlas", "loop", "fps", "frame_time_ms", "current_frame", "start_time", "sprites")
+
     def __init__(self,
                  sprites_folder: pathlib.Path,
                  board: Board,
                  loop: bool = True,
-                 fps: float = 6.0):
+                 fps: float = 6.0,
+                 atlas: Optional[SpriteAtlas] = None,
+                 clock: Optional[Clock] = None):
         self.board = board  # קודם כל שומרים את ה-board
+        self.atlas = atlas if atlas is not None else SpriteAtlas.shared()
         self.loop = loop
         self.fps = fps
         self.frame_time_ms = 1000 / fps  # ms per frame
         self.current_frame = 0
-        self.start_time = time.monotonic()
+        self.start_time = clock.now_ms() if clock else 0  # ms since game start, like every now_ms
         self.sprites: List[Img] = self._load_sprites(sprites_folder)
 
     def copy(self):
-        """Create a shallow copy of the graphics object."""
+        """Create a shallow copy of the graphics object (sprites are shared, not copied)."""
         g = Graphics.__new__(Graphics)  # יצירה בלי קריאה ל־__init__
+        g.atlas = self.atlas
         g.sprites = self.sprites
         g.loop = self.loop
         g.fps = self.fps
@@ -56,12 +63,8 @@ class Graphics:
 
     # ─── internal helper ──────────────────────────────────────────────
     def _load_sprites(self, folder: pathlib.Path) -> List[Img]:
-        """Load all sprite images from a folder in sorted order and resize to cell size."""
-        images = []
+        """Get the sprites of a folder from the atlas (decoded once per folder and cell size)."""
         cell_w, cell_h = self.board.cell_W_pix, self.board.cell_H_pix
-        for img_path in sorted(folder.iterdir()):
-            if img_path.suffix.lower() in (".png", ".jpg", ".jpeg"):
-                images.append(Img().read(img_path, size=(cell_w, cell_h)))
-        return images
+        return self.atlas.get_sprites(folder, (cell_w, cell_h))
 
 
@@ -1,11 +1,15 @@
 import pathlib
 from Graphics import Graphics
 from Board import Board
+from SpriteAtlas import SpriteAtlas
+from Clock import Clock
 
 
 class GraphicsFactory:
-    def __init__(self, board: Board):
+    def __init__(self, board: Board, atlas: SpriteAtlas = None, clock: Clock = None):
         self.board = board
+        self.atlas = atlas if atlas is not None else SpriteAtlas.shared()
+        self.clock = clock
 
     def load(self,
              sprites_dir: pathlib.Path,
@@ -20,5 +24,7 @@ class GraphicsFactory:
             sprites_folder=sprites_dir,
             board=self.board,
             loop=loop,
-            fps=fps
+            fps=fps,
+            atlas=self.atlas,
+            clock=self.clock
         )
@@ -1,149 +1,192 @@
+import math
 import queue
 import threading
 import time
-from typing import Optional, Tuple
-
-import keyboard
+from collections import deque
+from typing import Dict, List, Optional, Tuple
 
 from Board import Board
+from Clock import Clock
 from Command import Command
+from InputSource import InputSource, KeyboardSource
+from KeyEvent import KeyEvent
+
+REPEAT_DELAY_S = 0.25     # a held arrow key starts repeating after this long
+REPEAT_INTERVAL_S = 0.15  # and then moves the cursor once per interval
+
+DIRECTIONS_USER1 = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}
+DIRECTIONS_USER2 = {"w": (-1, 0), "s": (1, 0), "a": (0, -1), "d": (0, 1)}
+
+
+class PlayerInput:
+    """Cursor, selection and held keys of one player; each player has its own lock and repeat timers."""
+
+    def __init__(self, name: str, directions: Dict[str, Tuple[int, int]], select_key: str, color: str,
+                 focus_cell: Tuple[int, int]):
+        self.name = name
+        self.directions = directions
+        self.select_key = select_key
+        self.color = color  # the pieces this player may select ("B" / "W")
+        self.focus_cell = focus_cell
+        self.selection_mode = "source"
+        self.selected_source: Optional[Tuple[int, int]] = None
+        self.held: Dict[str, float] = {}  # key -> time of its next auto-repeat
+        self.lock = threading.Lock()
+
+    def keys(self):
+        return (*self.directions, self.select_key)
 
 
 class InputHandler:
-    def __init__(self, user_input_queue: queue.Queue, board: Board, game):
+    """
+    Turns key events into cursor moves and move Commands. Input comes from
+    InputSources (the keyboard by default; scripted or programmatic ones for
+    replays and load tests) or is injected with on_key_event / submit;
+    nothing here sleeps. Auto-repeat of held arrows and polling of the
+    sources are driven by update(), which the game loop calls every iteration.
+    """
+
+    def __init__(self, user_input_queue: queue.Queue, board: Board, game, clock: Optional[Clock] = None,
+                 sources: Optional[List[InputSource]] = None):
         self.user_input_queue = user_input_queue
         self.board = board
-        self.game = game  # To access pos_to_piece, game_time_ms, and _running
-        self._lock = threading.Lock()
-
-        # --- User 1 state ---
-        self.focus_cell = (0, 0)
-        self._selection_mode = "source"
-        self._selected_source: Optional[Tuple[int, int]] = None
-
-        # --- User 2 state ---
-        self.focus_cell2 = (self.board.H_cells - 1, 0)
-        self._selection_mode2 = "source"
-        self._selected_source2: Optional[Tuple[int, int]] = None
-
-    def start_keyboard_thread(self):
-        threading.Thread(target=self._keyboard_loop, daemon=True).start()
-
-    def _keyboard_loop(self):
-        while self.game._running:
-            time.sleep(0.05)
-            with self._lock:
-                self._handle_user1_input()
-                self._handle_user2_input()
-
-    def _handle_user1_input(self):
-        if keyboard.is_pressed('esc'):
-            self.game._running = False
+        self.game = game  # To access pos_to_piece and _running
+        self.clock = clock if clock is not None else game.clock  # command timestamps
+
+        self.user1 = PlayerInput("User 1", DIRECTIONS_USER1, "enter", "B", (0, 0))
+        self.user2 = PlayerInput("User 2", DIRECTIONS_USER2, "space", "W", (self.board.H_cells - 1, 0))
+        self.players = (self.user1, self.user2)
+        self._player_of = {key: player for player in self.players for key in player.keys()}
+
+        self.sources = list(sources) if sources is not None else [KeyboardSource()]
+        self.latency_ms = deque(maxlen=1000)  # key event -> command enqueued
+
+    # ─── what the renderer reads ─────────────────────────────────────
+    @property
+    def focus_cell(self):
+        return self.user1.focus_cell
+
+    @property
+    def focus_cell2(self):
+        return self.user2.focus_cell
+
+    @property
+    def _selected_source(self):
+        return self.user1.selected_source
+
+    @property
+    def _selected_source2(self):
+        return self.user2.selected_source
+
+    # ─── input sources ───────────────────────────────────────────────
+    def start(self):
+        for source in self.sources:
+            source.start(self)
+
+    def stop(self):
+        for source in self.sources:
+            source.stop()
+
+    def add_source(self, source: InputSource):
+        self.sources.append(source)
+        source.start(self)
+
+    def submit(self, cmd: Command, event_time: Optional[float] = None):
+        """Put a ready Command on the game queue (event_time: time.monotonic() of its key event)."""
+        self.user_input_queue.put(cmd)
+        if event_time is not None:
+            self.latency_ms.append((time.monotonic() - event_time) * 1000)
+
+    def on_key_event(self, event: KeyEvent):
+        if event.key == "esc":
+            if event.down:
+                self.game._running = False
             return
 
-        dy, dx = 0, 0
-        if keyboard.is_pressed('left'): dx = -1
-        elif keyboard.is_pressed('right'): dx = 1
-        if keyboard.is_pressed('up'): dy = -1
-        elif keyboard.is_pressed('down'): dy = 1
-
-        if dx != 0 or dy != 0:
-            h, w = self.board.H_cells, self.board.W_cells
-            y, x = self.focus_cell
-            self.focus_cell = ((y + dy) % h, (x + dx) % w)
-            time.sleep(0.2)
-
-        if keyboard.is_pressed('enter'):
-            self._on_enter_pressed()
-            time.sleep(0.2)
-
-    def _handle_user2_input(self):
-        dy2, dx2 = 0, 0
-        if keyboard.is_pressed('a'): dx2 = -1
-        elif keyboard.is_pressed('d'): dx2 = 1
-        if keyboard.is_pressed('w'): dy2 = -1
-        elif keyboard.is_pressed('s'): dy2 = 1
-
-        if dx2 != 0 or dy2 != 0:
-            h, w = self.board.H_cells, self.board.W_cells
-            y2, x2 = self.focus_cell2
-            self.focus_cell2 = ((y2 + dy2) % h, (x2 + dx2) % w)
-            time.sleep(0.2)
-
-        if keyboard.is_pressed('space'):
-            self._on_space_pressed()
-            time.sleep(0.2)
-
-    def _on_enter_pressed(self):
-        if self._selection_mode == "source":
-            if self.focus_cell in self.game.pos_to_piece:
-                piece = self.game.pos_to_piece[self.focus_cell]
-                if piece.get_id()[1] == 'B':
-                    src_alg = self.board.cell_to_algebraic(self.focus_cell)
-                    print(f"User 1 source selected at {self.focus_cell} -> {src_alg}")
-                    self._selected_source = self.focus_cell
-                    self._selection_mode = "dest"
-                else:
-                    print("User 1 cannot select this piece.")
-        elif self._selection_mode == "dest":
-            if self._selected_source is None:
-                self._reset_selection()
+        player = self._player_of.get(event.key)
+        if player is None:
+            return
+        with player.lock:
+            if not event.down:
+                player.held.pop(event.key, None)
                 return
-
-            src_cell = self._selected_source
-            dst_cell = self.focus_cell
-            src_alg = self.board.cell_to_algebraic(src_cell)
-            dst_alg = self.board.cell_to_algebraic(dst_cell)
-            print(f"User 1 destination selected at {dst_cell} -> {dst_alg}")
-
-            piece = self.game.pos_to_piece.get(src_cell)
-            if piece:
-                cmd = Command(
-                    timestamp=self.game.game_time_ms(),
-                    piece_id=piece.get_unique(),
-                    type="move",
-                    params=[src_alg, dst_alg]
-                )
-                self.user_input_queue.put(cmd)
-            self._reset_selection()
-
-    def _on_space_pressed(self):
-        if self._selection_mode2 == "source":
-            if self.focus_cell2 in self.game.pos_to_piece:
-                piece = self.game.pos_to_piece[self.focus_cell2]
-                if piece.get_id()[1] == 'W':
-                    src_alg = self.board.cell_to_algebraic(self.focus_cell2)
-                    print(f"User 2 source selected at {self.focus_cell2} -> {src_alg}")
-                    self._selected_source2 = self.focus_cell2
-                    self._selection_mode2 = "dest"
+            if event.key in player.held:
+                return  # the OS repeating a held key; repeats come from our own timers
+            if event.key == player.select_key:
+                player.held[event.key] = math.inf  # one selection per press
+                self._on_select(player, event.time)
+            else:
+                player.held[event.key] = event.time + REPEAT_DELAY_S
+                self._move_focus(player, event.key)
+
+    def update(self, now_s: Optional[float] = None):
+        """Poll the sources, then fire the auto-repeats that are due (time.monotonic() seconds)."""
+        now_ms = self.clock.now_ms()
+        for source in self.sources:
+            source.poll(now_ms)
+
+        if now_s is None:
+            now_s = time.monotonic()
+        for player in self.players:
+            with player.lock:
+                for key, due in player.held.items():
+                    if due <= now_s:
+                        self._move_focus(player, key)
+                        player.held[key] = max(due + REPEAT_INTERVAL_S, now_s)
+
+    def latency_stats(self) -> dict:
+        samples = sorted(self.latency_ms)
+        if not samples:
+            return {"count": 0}
+        return {
+            "count": len(samples),
+            "mean_ms": sum(samples) / len(samples),
+            "p50_ms": samples[len(samples) // 2],
+            "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+            "max_ms": samples[-1],
+        }
+
+    # ─── per-player actions (called with player.lock held) ───────────
+    def _move_focus(self, player: PlayerInput, key: str):
+        dy, dx = player.directions[key]
+        h, w = self.board.H_cells, self.board.W_cells
+        y, x = player.focus_cell
+        player.focus_cell = ((y + dy) % h, (x + dx) % w)
+
+    def _on_select(self, player: PlayerInput, event_time: float):
+        if player.selection_mode == "source":
+            if player.focus_cell in self.game.pos_to_piece:
+                piece = self.game.pos_to_piece[player.focus_cell]
+                if piece.get_id()[1] == player.color:
+                    src_alg = self.board.cell_to_algebraic(player.focus_cell)
+                    print(f"{player.name} source selected at {player.focus_cell} -> {src_alg}")
+                    player.selected_source = player.focus_cell
+                    player.selection_mode = "dest"
                 else:
-                    print("User 2 cannot select this piece.")
-        elif self._selection_mode2 == "dest":
-            if self._selected_source2 is None:
-                self._reset_selection2()
+                    print(f"{player.name} cannot select this piece.")
+        elif player.selection_mode == "dest":
+            if player.selected_source is None:
+                self._reset_selection(player)
                 return
 
-            src_cell = self._selected_source2
-            dst_cell = self.focus_cell2
+            src_cell = player.selected_source
+            dst_cell = player.focus_cell
             src_alg = self.board.cell_to_algebraic(src_cell)
             dst_alg = self.board.cell_to_algebraic(dst_cell)
-            print(f"User 2 destination selected at {dst_cell} -> {dst_alg}")
+            print(f"{player.name} destination selected at {dst_cell} -> {dst_alg}")
 
             piece = self.game.pos_to_piece.get(src_cell)
             if piece:
                 cmd = Command(
-                    timestamp=self.game.game_time_ms(),
+                    timestamp=self.clock.now_ms(),
                     piece_id=piece.get_unique(),
                     type="move",
                     params=[src_alg, dst_alg]
                 )
-                self.user_input_queue.put(cmd)
-            self._reset_selection2()
-
-    def _reset_selection(self):
-        self._selection_mode = "source"
-        self._selected_source = None
+                self.submit(cmd, event_time)
+            self._reset_selection(player)
 
-    def _reset_selection2(self):
-        self._selection_mode2 = "source"
-        self._selected_source2 = None
+    @staticmethod
+    def _reset_selection(player: PlayerInput):
+        player.selection_mode = "source"
+        player.selected_source = None
@@ -0,0 +1,165 @@
+import pathlib
+import queue
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional, Union
+
+from Command import Command
+from KeyEvent import KeyEvent
+
+
+class InputSource(ABC):
+    """
+    Something that produces input for an InputHandler: key events (which go
+    through the players' cursors) or ready-made Commands (which go straight to
+    the game's command queue via InputHandler.submit).
+    """
+
+    def start(self, handler):
+        self.handler = handler
+
+    def stop(self):
+        pass
+
+    @abstractmethod
+    def poll(self, now_ms: int):
+        """Called from the game loop every iteration with the game time."""
+        pass
+
+
+class KeyboardSource(InputSource):
+    """The local keyboard, through keyboard-library hooks (imported only when started)."""
+
+    def __init__(self):
+        self._keyboard = None
+        self._hook = None
+
+    def start(self, handler):
+        super().start(handler)
+        import keyboard
+        self._keyboard = keyboard
+        self._hook = keyboard.hook(self._on_keyboard_event)
+
+    def stop(self):
+        if self._hook is not None:
+            self._keyboard.unhook(self._hook)
+            self._hook = None
+
+    def poll(self, now_ms: int):
+        pass  # events arrive on the keyboard library's listener thread
+
+    def _on_keyboard_event(self, event):
+        if event.name is None:
+            return
+        down = event.event_type == self._keyboard.KEY_DOWN
+        self.handler.on_key_event(KeyEvent(event.name.lower(), down, time.monotonic()))
+
+
+class ScriptedSource(InputSource):
+    """
+    Replays a list of timestamped Commands: each is submitted on the first
+    poll at or after its timestamp (game ms). load() reads a script file with
+    one "<ms> <src> <dst>" line per move; blank lines and # comments are skipped.
+    """
+
+    def __init__(self, commands: List[Command]):
+        self.commands = sorted(commands, key=lambda cmd: cmd.timestamp)
+        self._next = 0
+
+    @classmethod
+    def from_file(cls, path: Union[str, pathlib.Path]) -> "ScriptedSource":
+        return cls(cls.load(path))
+
+    @staticmethod
+    def load(path: Union[str, pathlib.Path]) -> List[Command]:
+        commands = []
+        for line in pathlib.Path(path).read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            ms, src, dst = line.split()
+            commands.append(Command(int(ms), 0, "move", [src, dst]))
+        return commands
+
+    def done(self) -> bool:
+        return self._next >= len(self.commands)
+
+    def poll(self, now_ms: int):
+        while self._next < len(self.commands) and self.commands[self._next].timestamp <= now_ms:
+            self.handler.submit(self.commands[self._next])
+            self._next += 1
+
+
+class ProgrammaticSource(InputSource):
+    """
+    Thread-safe API for feeding input from code (bots, load tests, a network
+    client). Commands go to the game queue immediately; key presses are
+    buffered and delivered from the game loop like keyboard events.
+    """
+
+    def __init__(self):
+        self._keys: "queue.SimpleQueue[KeyEvent]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self.submitted = 0
+
+    def submit(self, cmd: Command):
+        self.handler.submit(cmd)
+        with self._lock:
+            self.submitted += 1
+
+    def move(self, src: str, dst: str, timestamp: Optional[int] = None, piece_id=0):
+        if timestamp is None:
+            timestamp = self.handler.clock.now_ms()
+        self.submit(Command(timestamp, piece_id, "move", [src, dst]))
+
+    def press(self, key: str):
+        """A full key press (down and up)."""
+        now = time.monotonic()
+        self._keys.put(KeyEvent(key, True, now))
+        self._keys.put(KeyEvent(key, False, now))
+
+    def key(self, event: KeyEvent):
+        self._keys.put(event)
+
+    def poll(self, now_ms: int):
+        while True:
+            try:
+                event = self._keys.get_nowait()
+            except queue.Empty:
+                return
+            self.handler.on_key_event(event)
+
+
+class RandomPlayer(InputSource):
+    """
+    A bot for one colour ("W" / "B"): every think_ms of game time it moves a
+    random idle piece of its own to a random legal cell. Seeded, so a game
+    between two RandomPlayers on virtual time plays the same every run.
+    """
+
+    def __init__(self, colour: str, seed: int = 0, think_ms: int = 250):
+        self.colour = colour
+        self.think_ms = think_ms
+        self.rng = random.Random(seed)
+        self._next_ms = 0
+
+    def poll(self, now_ms: int):
+        if now_ms < self._next_ms:
+            return
+        self._next_ms = now_ms + self.think_ms
+        game = self.handler.game
+        grid = game.pos_to_piece
+        idle = [(cell, piece) for cell, piece in grid.items()
+                if piece.get_id()[1] == self.colour and piece._state.name == "idle"]
+        self.rng.shuffle(idle)
+        for cell, piece in idle:
+            moves = piece._state._moves
+            targets = [dst for dst in moves.get_moves(*cell, piece._has_moved, grid)
+                       if moves.is_legal(cell, dst, piece._has_moved, grid)]
+            if targets:
+                dst = self.rng.choice(targets)
+                self.handler.submit(Command(now_ms, piece.get_unique(), "move",
+                                            [game.board.cell_to_algebraic(cell), game.board.cell_to_algebraic(dst)]))
+                return
@@ -0,0 +1,94 @@
+import bisect
+import pathlib
+from typing import Dict, List, Optional, Tuple
+
+from Board import Board
+from Command import Command
+from Game import Game
+from GameJournal import JournalReader, COMMAND, CAPTURE, SNAPSHOT, END
+from GameSnapshot import GameSnapshot
+
+
+class JournalReplay:
+    """
+    Rebuilds a journalled game as it was at any time. The journal's commands
+    are played again on a headless game with the same pieces. To get to time
+    t, seek() restores the last snapshot at or before t and simulates only
+    the ticks after it, so a seek costs at most one snapshot interval of
+    simulation, wherever in the game it lands. A journal snapshot is decoded
+    into the game once (GameSnapshot.load_rows); after that, going back to it
+    is a GameSnapshot.restore. Seeking forward from the current position
+    just keeps simulating when that is shorter.
+    """
+
+    def __init__(self, path: pathlib.Path, board: Board, pieces_root: pathlib.Path, placement_csv: pathlib.Path):
+        reader = JournalReader(path)
+        self.tick_ms = reader.tick_ms
+        self.start_ms = reader.start_ms
+        self.snapshots: List[Tuple[int, int, object, List[str]]] = []  # (time, ticks played, rows, symbols)
+        self.commands: Dict[int, List[Command]] = {}  # tick time -> commands accepted in that tick
+        self.captures: List[Tuple[int, str, str, Tuple[int, int]]] = []
+        self.winner: Optional[str] = None
+        self.end_ms = self.start_ms
+        for record in reader.records():
+            self.end_ms = record.time_ms
+            if record.kind == COMMAND:
+                self.commands.setdefault(record.time_ms, []).append(record.data)
+            elif record.kind == CAPTURE:
+                self.captures.append((record.time_ms, *record.data))
+            elif record.kind == SNAPSHOT:
+                ticks, rows, symbols = record.data
+                self.snapshots.append((record.time_ms, ticks, rows, list(symbols)))
+            elif record.kind == END:
+                self.winner = record.data
+        if not self.snapshots:
+            raise ValueError(f"{path}: journal has no snapshot to start from")
+        self._snapshot_times = [snap[0] for snap in self.snapshots]
+
+        self.game = Game(board, pieces_root, placement_csv, tick_hz=1000.0 / self.tick_ms, headless=True)
+        self._pieces = {piece.get_id(): piece for piece in self.game.pieces.values()}
+        self.ticks = None  # ticks played by the game in its current state
+        self._restored: Dict[int, GameSnapshot] = {}  # journal snapshot index -> decoded snapshot
+        self.restores = 0
+        self.ticks_simulated = 0
+
+    @property
+    def time_ms(self) -> Optional[int]:
+        """Time of the last tick the game has played (None before the first seek)."""
+        return None if self.ticks is None else self._tick_time(self.ticks - 1)
+
+    def seek(self, t: int) -> Game:
+        """The game as it was after the last tick at or before t."""
+        i = max(bisect.bisect_right(self._snapshot_times, t) - 1, 0)
+        snap_ticks = self.snapshots[i][1]
+        if self.ticks is None or self.time_ms > t or self.ticks < snap_ticks:
+            self._restore(i)
+        while self._tick_time(self.ticks) <= t:
+            now = self._tick_time(self.ticks)
+            for cmd in self.commands.get(now, ()):
+                self.game.user_input_queue.put(cmd)
+            self.game._tick(now)
+            self.ticks += 1
+            self.ticks_simulated += 1
+        return self.game
+
+    def board_at(self, t: int) -> Dict[Tuple[int, int], str]:
+        """cell -> piece id at time t."""
+        game = self.seek(t)
+        return {cell: piece.get_id() for cell, piece in game.pos_to_piece.items()}
+
+    # ─── internal helpers ────────────────────────────────────────────
+    def _tick_time(self, tick: int) -> int:
+        # tick k of the recorded game ran at int(start + k * tick_ms), like Game.run_headless
+        return int(self.start_ms + tick * self.tick_ms)
+
+    def _restore(self, i: int):
+        snap = self._restored.get(i)
+        if snap is None:
+            time_ms, ticks, rows, symbols = self.snapshots[i]
+            snap = GameSnapshot.load_rows(self.game, rows, symbols, time_ms, ticks, self._pieces)
+            self._restored[i] = snap
+        else:
+            snap.restore(self.game)
+        self.ticks = snap.ticks
+        self.restores += 1
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class KeyEvent:
+    key: str        # key name, lower case ("up", "enter", "w", ...)
+    down: bool      # True = pressed, False = released
+    time: float     # time.monotonic() seconds when the key event happened
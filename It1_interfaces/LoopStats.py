@@ -0,0 +1,56 @@
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+
+class LoopStats:
+    """
+    Counts simulation ticks and rendered frames and accumulates wall-clock and
+    CPU time (of the calling thread) per named phase of the game loop.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.ticks = 0
+        self.frames = 0
+        self.wall: Dict[str, float] = {}
+        self.cpu: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        wall0, cpu0 = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.wall[name] = self.wall.get(name, 0.0) + time.perf_counter() - wall0
+            self.cpu[name] = self.cpu.get(name, 0.0) + time.thread_time() - cpu0
+            self.calls[name] = self.calls.get(name, 0) + 1
+
+    def report(self) -> dict:
+        elapsed = max(time.perf_counter() - self._start, 1e-9)
+        return {
+            "elapsed_s": elapsed,
+            "tick_hz": self.ticks / elapsed,
+            "fps": self.frames / elapsed,
+            "phases": {
+                name: {
+                    "calls": self.calls[name],
+                    "wall_ms": self.wall[name] * 1000,
+                    "cpu_ms": self.cpu[name] * 1000,
+                    "cpu_ms_per_call": self.cpu[name] * 1000 / self.calls[name],
+                }
+                for name in self.wall
+            },
+        }
+
+    def format(self) -> str:
+        r = self.report()
+        lines = [f"{r['elapsed_s']:.1f}s  ticks {r['tick_hz']:.1f}/s  frames {r['fps']:.1f}/s"]
+        for name, p in r["phases"].items():
+            lines.append(f"  {name:<10} {p['calls']:>7} calls  wall {p['wall_ms']:9.1f} ms  "
+                         f"cpu {p['cpu_ms']:9.1f} ms  ({p['cpu_ms_per_call']:.3f} ms/call)")
+        return "\n".join(lines)
@@ -0,0 +1,97 @@
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from LatencyHistogram import LatencyHistogram
+from NetProtocol import (HELLO, MOVE, DELTA, KEYFRAME, END, HELLO_BODY, MOVE_BODY, GONE, WATCH,
+                         frame, read_frame, decode_welcome, decode_delta)
+from OccupancyGrid import STATE_IDS
+
+IDLE = STATE_IDS["idle"]
+MOVING = STATE_IDS["move"]
+
+
+class LoopbackClient:
+    """
+    A scripted player that talks to a GameServer over the real TCP protocol.
+    It joins a game, keeps its own view of the pieces from the deltas, and
+    every move_every_ms asks to move one of its idle pieces a short random
+    step (the server's game decides whether that is legal). Also measures
+    how long a move request takes to show up as that piece moving.
+    """
+
+    def __init__(self, host: str, port: int, game_id: int, colour: str = WATCH,
+                 move_every_ms: float = 200.0, seed: int = 0):
+        self.host = host
+        self.port = port
+        self.game_id = game_id
+        self.colour = colour
+        self.move_every_ms = move_every_ms
+        self.rng = random.Random(seed)
+        self.piece_ids: List[str] = []
+        self.pieces: Dict[int, Tuple[int, int, int]] = {}  # piece number -> (row, col, state)
+        self.winner: Optional[str] = None
+        self.ended = False
+        self.deltas = 0
+        self.bytes_received = 0
+        self.moves_sent = 0
+        self.move_latency = LatencyHistogram()  # request -> first delta showing the piece moving
+        self._pending: Dict[int, float] = {}  # piece number -> perf_counter() of its move request
+
+    async def run(self, seconds: float):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write(frame(HELLO_BODY.pack(HELLO, self.game_id, self.colour.encode())))
+        body = await read_frame(reader)
+        self.bytes_received += len(body)
+        _, _, self.piece_ids = decode_welcome(body)
+        receiving = asyncio.create_task(self._receive(reader))
+        deadline = time.perf_counter() + seconds
+        try:
+            while not self.ended and time.perf_counter() < deadline:
+                await asyncio.sleep(self.move_every_ms / 1000)
+                if self.colour != WATCH:
+                    self._send_move(writer)
+        finally:
+            receiving.cancel()
+            writer.close()
+
+    # ─── internal helpers ────────────────────────────────────────────
+    def _send_move(self, writer: asyncio.StreamWriter):
+        mine = [n for n, (_, _, state) in self.pieces.items()
+                if state == IDLE and self.piece_ids[n][1] == self.colour]
+        if not mine:
+            return
+        n = self.rng.choice(mine)
+        row, col, _ = self.pieces[n]
+        dr, dc = self.rng.randint(-2, 2), self.rng.randint(-2, 2)
+        writer.write(frame(MOVE_BODY.pack(MOVE, row, col, row + dr, col + dc)))
+        self._pending[n] = time.perf_counter()
+        self.moves_sent += 1
+
+    async def _receive(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                body = await read_frame(reader)
+                self.bytes_received += len(body)
+                if body[0] in (DELTA, KEYFRAME):
+                    self._apply(decode_delta(body)[1])
+                elif body[0] == END:
+                    self.winner = body[1:].decode() or None
+                    self.ended = True
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            self.ended = True
+
+    def _apply(self, rows):
+        self.deltas += 1
+        now = time.perf_counter()
+        for n, row, col, state in zip(rows["piece"].tolist(), rows["row"].tolist(), rows["col"].tolist(),
+                                      rows["state"].tolist()):
+            if state == GONE:
+                self.pieces.pop(n, None)
+                self._pending.pop(n, None)
+                continue
+            self.pieces[n] = (row, col, state)
+            if state == MOVING and n in self._pending:
+                self.move_latency.record((now - self._pending.pop(n)) * 1000)
@@ -1,15 +1,126 @@
+import threading
+from typing import Any, Dict, List, Optional, Set
+
 from Subscriber import Subscriber
 from EventType import EventType
+from EventQueue import EventQueue, DROP_OLDEST
+
+DEFAULT_MAXSIZE = 1024
+
+
+class _Subscription:
+    """One subscriber's queue and the thread that delivers it."""
+
+    def __init__(self, subscriber: Subscriber, queue: EventQueue, batch_size: int):
+        self.subscriber = subscriber
+        self.queue = queue
+        self.batch_size = batch_size
+        self.event_types: Set[EventType] = set()
+        self.delivered = 0
+        self.errors = 0
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self.queue.closed:  # stopped before: deliver into a fresh queue, the old thread drains the old one
+            old = self.queue
+            self.queue = EventQueue(old.maxsize, old.policy, old.block_timeout_s)
+            self.queue.dropped = old.dropped
+        self.thread = threading.Thread(target=self._deliver, args=(self.queue,), daemon=True,
+                                       name=f"events-{type(self.subscriber).__name__}")
+        self.thread.start()
+
+    def _deliver(self, queue: EventQueue):
+        while True:
+            batch = queue.get_batch(self.batch_size, timeout_s=0.1)
+            if not batch:
+                if queue.closed and not len(queue):
+                    return
+                continue
+            try:
+                self.subscriber.handle_batch(batch)
+            except Exception as e:  # a broken subscriber must not take the bus down
+                self.errors += 1
+                print(f"Subscriber {type(self.subscriber).__name__} failed: {e}")
+            self.delivered += len(batch)
+
+
 class MessageBroker:
-    def __init__(self):
-        self.subscribers = {}  
-
-    def subscribe(self, event_type: EventType, subscriber: Subscriber):
-        if event_type not in self.subscribers:
-            self.subscribers[event_type] = []
-        self.subscribers[event_type].append(subscriber)
-
-    def publish(self, event_type: EventType,data):
-        if event_type in self.subscribers:
-            for sub in self.subscribers[event_type]:
-                sub.handle_event(event_type, data)
+    """
+    Publish/subscribe bus for game events. publish() only appends to the
+    bounded queue of every subscriber of that event type and returns; each
+    subscriber has its own delivery thread that hands it the queued events
+    in batches. A slow subscriber therefore only fills (and, by its queue
+    policy, drops from) its own queue – the game loop and the other
+    subscribers never wait for it, unless it subscribed with policy BLOCK.
+
+    Queues only absorb bursts up to their maxsize. The publisher holds the
+    GIL while it publishes, so a delivery thread only drains its queue
+    between switch intervals (sys.getswitchinterval(), 5 ms): a burst of
+    more than maxsize events within one interval is cut by the drop
+    policies even for an idle subscriber. bench_events.py, 20000 events
+    back to back, no-op subscriber alone: ~90% dropped with a 256-slot
+    queue, 60-70% with the default DEFAULT_MAXSIZE. A game publishes at
+    most a few dozen events per tick (moves and captures of 32 pieces),
+    far below the default.
+    """
+
+    def __init__(self, batch_size: int = 64):
+        self.batch_size = batch_size
+        self.subscribers: Dict[EventType, List[_Subscription]] = {}
+        self._subscriptions: Dict[int, _Subscription] = {}  # id(subscriber) -> its queue
+        self._lock = threading.Lock()
+        self._running = False
+
+    def subscribe(self, event_type: EventType, subscriber: Subscriber,
+                  maxsize: int = DEFAULT_MAXSIZE, policy: str = DROP_OLDEST):
+        """Deliver event_type to subscriber. Queue size / policy are set by its first subscribe()."""
+        with self._lock:
+            sub = self._subscriptions.get(id(subscriber))
+            if sub is None:
+                sub = _Subscription(subscriber, EventQueue(maxsize, policy), self.batch_size)
+                self._subscriptions[id(subscriber)] = sub
+                if self._running:
+                    sub.start()
+            if event_type not in sub.event_types:
+                sub.event_types.add(event_type)
+                # copy on write, so publish() can read the list without the lock
+                self.subscribers[event_type] = self.subscribers.get(event_type, []) + [sub]
+
+    def publish(self, event_type: EventType, data: Any):
+        for sub in self.subscribers.get(event_type, ()):
+            sub.queue.put((event_type, data))
+
+    def start(self):
+        """Start delivering; events published before are delivered first. Also restarts a stopped broker."""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            for sub in self._subscriptions.values():
+                sub.start()
+
+    def stop(self, timeout_s: float = 1.0):
+        """
+        Stop accepting events until the next start() and let each subscriber
+        finish what is queued (waits up to timeout_s each).
+        """
+        with self._lock:
+            self._running = False
+            subs = list(self._subscriptions.values())
+        for sub in subs:
+            sub.queue.close()
+        for sub in subs:
+            if sub.thread is not None:
+                sub.thread.join(timeout_s)
+
+    def stats(self) -> Dict[str, dict]:
+        """Per subscriber: events queued / delivered / dropped and failed batches."""
+        return {
+            f"{type(sub.subscriber).__name__}#{i}": {
+                "queued": len(sub.queue),
+                "delivered": sub.delivered,
+                "dropped": sub.queue.dropped,
+                "errors": sub.errors,
+            }
+            for i, sub in enumerate(self._subscriptions.values())
+        }
@@ -1,18 +1,29 @@
 # Moves.py  – drop-in replacement
 import pathlib
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+from OccupancyGrid import OccupancyGrid, COLOR_IDS
+
+
 class Moves:
+    # (rules, dims, pawn direction) -> precomputed tables, shared by every Moves with the same rules
+    _table_cache: Dict[tuple, "MoveTables"] = {}
+
     def __init__(self, txt_path: pathlib.Path, dims: Tuple[int, int]):
         """Initialize moves with rules from text file and board dimensions."""
         self.dims = dims  # Dimensions of the board (rows, cols)
         self.rules = self._load_rules(txt_path)  # Load movement rules from file
         self.piece_type = self._get_piece_type_from_path(txt_path)  # זיהוי סוג הכלי
-        
+        self.color = COLOR_IDS.get(self.piece_type[1:2], 0)
+        self.is_pawn = self.piece_type.startswith('P')
+        self.direction = 1 if self.piece_type == 'PB' else -1  # PB זז למטה, PW זז למעלה
+        self.tables = self._get_tables()
+
     def _get_piece_type_from_path(self, txt_path: pathlib.Path) -> str:
         """Extract piece type from the file path."""
         # נתיב כמו: pieces/PB/moves.txt -> PB
         return txt_path.parent.name
-        
+
     def _load_rules(self, txt_path: pathlib.Path) -> List[Tuple[int, int]]:
         """Load movement rules from a text file."""
         rules = []
@@ -27,69 +38,143 @@ class Moves:
         except Exception as e:
             raise ValueError(f"Error loading rules from {txt_path}: {e}")
         return rules
-        
+
+    def _get_tables(self) -> "MoveTables":
+        key = (tuple(self.rules), tuple(self.dims), self.direction if self.is_pawn else 0)
+        tables = Moves._table_cache.get(key)
+        if tables is None:
+            tables = MoveTables(self.rules, self.dims, self.is_pawn, self.direction)
+            Moves._table_cache[key] = tables
+        return tables
+
     def get_moves(self, r: int, c: int, has_moved: bool = False, pos_to_piece: dict = None) -> List[Tuple[int, int]]:
-        """Get all possible moves from a given position."""
-        possible_moves = []
-        
+        """Get all possible moves from a given position (rule targets, no obstruction checks for non-pawns)."""
+        t = self.tables
+        if not self.is_pawn:
+            return list(t.targets[r][c])
+
         # לוגיקה מיוחדת לפיונים
-        if self.piece_type.startswith('P'):  # פיון (PW או PB)
-            direction = 1 if self.piece_type == 'PB' else -1  # PB זז למטה, PW זז למעלה
-            
-            # תנועות קדימה - בסדר עולה של מרחק
-            # צריך לבדוק שכל הדרך ריקה
-            forward_moves = [(dr, dc) for dr, dc in self.rules if dc == 0]
-            forward_moves.sort(key=lambda x: abs(x[0]))  # מיון לפי מרחק
-            
-            for dr, dc in forward_moves:
-                # תנועה של 2 צעדים רק אם לא זז עדיין
-                if abs(dr) == 2 and has_moved:
-                    continue
-                
-                new_r, new_c = r + dr, c + dc
-                # בדיקה שבתוך הלוח
-                if 0 <= new_r < self.dims[0] and 0 <= new_c < self.dims[1]:
-                    target_cell = (new_r, new_c)
-                    
-                    # אם יש כלי במקום - לא יכול לזוז לשם ולא מעבר לזה
-                    if pos_to_piece is not None and target_cell in pos_to_piece:
-                        break  # עוצר את כל התנועות הקדימה הבאות
-                    
-                    # אם המקום ריק - יכול לזוז
+        possible_moves = []
+        for target_cell, is_double in t.pawn_forward[r][c]:
+            # תנועה של 2 צעדים רק אם לא זז עדיין
+            if is_double and has_moved:
+                continue
+            # אם יש כלי במקום - לא יכול לזוז לשם ולא מעבר לזה
+            if pos_to_piece is not None and target_cell in pos_to_piece:
+                break
+            possible_moves.append(target_cell)
+
+        # תנועות אכילה (אלכסונית וקדימה)
+        if pos_to_piece is not None:
+            for target_cell in t.pawn_captures[r][c]:
+                color = _color_at(pos_to_piece, target_cell)
+                if color and color != self.color:  # בדיקה שזה יריב (צבע שונה)
                     possible_moves.append(target_cell)
-            
-            # תנועות אכילה (אלכסונית וקדימה)
-            if pos_to_piece is not None:
-                # אכילה אלכסונית
-                for dc in [-1, 1]:  # שמאל וימין
-                    capture_r, capture_c = r + direction, c + dc
-                    
-                    if 0 <= capture_r < self.dims[0] and 0 <= capture_c < self.dims[1]:
-                        target_cell = (capture_r, capture_c)
-                        
-                        if target_cell in pos_to_piece:
-                            target_piece = pos_to_piece[target_cell]
-                            # בדיקה שזה יריב (צבע שונה)
-                            if target_piece.get_id()[1] != self.piece_type[1]:
-                                possible_moves.append(target_cell)
-                
-                # אכילה קדימה
-                capture_r, capture_c = r + direction, c
-                if 0 <= capture_r < self.dims[0] and 0 <= capture_c < self.dims[1]:
-                    target_cell = (capture_r, capture_c)
-                    
-                    if target_cell in pos_to_piece:
-                        target_piece = pos_to_piece[target_cell]
-                        # בדיקה שזה יריב (צבע שונה)
-                        if target_piece.get_id()[1] != self.piece_type[1]:
-                            possible_moves.append(target_cell)
-        
-        else:
-            # לוגיקה רגילה לכלים שאינם פיונים
-            for dr, dc in self.rules:
-                new_r, new_c = r + dr, c + dc
-                if 0 <= new_r < self.dims[0] and 0 <= new_c < self.dims[1]:
-                    possible_moves.append((new_r, new_c))
-                
         return possible_moves
 
+    def get_legal_moves(self, r: int, c: int, has_moved: bool, occupancy) -> List[Tuple[int, int]]:
+        """All targets that are reachable, not blocked on the way and not held by a friendly piece."""
+        if self.is_pawn:
+            return self.get_moves(r, c, has_moved, occupancy)
+
+        legal = []
+        for ray in self.tables.rays[r][c]:
+            for cell, is_target in ray:
+                color = _color_at(occupancy, cell)
+                if is_target and color != self.color:
+                    legal.append(cell)
+                if color:
+                    break  # anything further along this ray is blocked
+        return legal
+
+    def is_legal(self, src: Tuple[int, int], dst: Tuple[int, int], has_moved: bool, occupancy) -> bool:
+        """Table lookup version of get_legal_moves for a single destination."""
+        if self.is_pawn:
+            return dst in self.get_moves(*src, has_moved, occupancy)
+
+        between = self.tables.reach[src[0]][src[1]].get(dst)
+        if between is None or _color_at(occupancy, dst) == self.color:
+            return False
+        for cell in between:
+            if cell in occupancy:
+                return False
+        return True
+
+
+class MoveTables:
+    """
+    Everything about a rule set that only depends on the board size, per source cell:
+      targets[r][c]       – in-bounds rule targets, in rule order
+      rays[r][c]          – per direction, the cells walked outwards as (cell, is_target);
+                            cells between two targets are included so they can block
+      reach[r][c]         – target -> cells strictly between source and target
+      pawn_forward[r][c]  – (cell, is_double) forward steps ordered by distance
+      pawn_captures[r][c] – diagonal and forward capture cells
+    """
+
+    def __init__(self, rules: List[Tuple[int, int]], dims: Tuple[int, int], is_pawn: bool, direction: int):
+        rows, cols = dims
+        self.targets = [[() for _ in range(cols)] for _ in range(rows)]
+        self.rays = [[() for _ in range(cols)] for _ in range(rows)]
+        self.reach = [[{} for _ in range(cols)] for _ in range(rows)]
+        self.pawn_forward = [[() for _ in range(cols)] for _ in range(rows)]
+        self.pawn_captures = [[() for _ in range(cols)] for _ in range(rows)]
+
+        def inside(cell):
+            return 0 <= cell[0] < rows and 0 <= cell[1] < cols
+
+        # rule offsets grouped by direction: straight/diagonal lines can be blocked, leaps cannot
+        lines: Dict[Tuple[int, int], set] = {}
+        leaps = []
+        for dr, dc in rules:
+            if dr == 0 and dc == 0:
+                continue
+            if dr == 0 or dc == 0 or abs(dr) == abs(dc):
+                dist = max(abs(dr), abs(dc))
+                lines.setdefault((dr // dist, dc // dist), set()).add(dist)
+            elif (dr, dc) not in leaps:
+                leaps.append((dr, dc))
+
+        forward = sorted((rule for rule in rules if rule[1] == 0), key=lambda x: abs(x[0]))
+
+        for r in range(rows):
+            for c in range(cols):
+                self.targets[r][c] = tuple((r + dr, c + dc) for dr, dc in rules if inside((r + dr, c + dc)))
+
+                if is_pawn:
+                    self.pawn_forward[r][c] = tuple(((r + dr, c), abs(dr) == 2)
+                                                    for dr, dc in forward if inside((r + dr, c)))
+                    self.pawn_captures[r][c] = tuple(cell for cell in ((r + direction, c - 1),
+                                                                       (r + direction, c + 1),
+                                                                       (r + direction, c))
+                                                     if inside(cell))
+                    continue
+
+                rays = []
+                reach = {}
+                for (sr, sc), dists in lines.items():
+                    ray = []
+                    for k in range(1, max(dists) + 1):
+                        cell = (r + sr * k, c + sc * k)
+                        if not inside(cell):
+                            break
+                        ray.append((cell, k in dists))
+                        if k in dists:
+                            reach[cell] = tuple(step for step, _ in ray[:-1])
+                    if ray:
+                        rays.append(tuple(ray))
+                for dr, dc in leaps:
+                    cell = (r + dr, c + dc)
+                    if inside(cell):
+                        rays.append(((cell, True),))
+                        reach[cell] = ()
+                self.rays[r][c] = tuple(rays)
+                self.reach[r][c] = reach
+
+
+def _color_at(occupancy, cell) -> int:
+    """COLOR_IDS of the piece on a cell, 0 if empty."""
+    if isinstance(occupancy, OccupancyGrid):
+        return int(occupancy.color[cell])
+    piece = occupancy.get(cell)
+    return 0 if piece is None else COLOR_IDS.get(piece.get_id()[1], 0)
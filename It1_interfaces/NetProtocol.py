@@ -0,0 +1,100 @@
+"""
+Wire format between GameServer and its clients: every message is a frame
+(u32 length, then the body), the body starts with its kind byte.
+
+client -> server
+    HELLO    HELLO_BODY: game id, colour ("W" / "B", or "-" to only watch)
+    MOVE     MOVE_BODY:  src row/col, dst row/col
+server -> client
+    WELCOME  WELCOME_HEAD: game id, tick_ms, piece count; then per piece
+             u8 length + its id (utf-8). Pieces are numbered in this order.
+    DELTA    DELTA_HEAD: tick, row count; then rows * DELTA_ROW – only the
+             pieces whose cell, state or position changed since the last
+             delta; state GONE = captured
+    KEYFRAME like DELTA, with every piece
+    END      END_HEAD, then the winner (utf-8, empty if none)
+"""
+import asyncio
+import struct
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+FRAME = struct.Struct("<I")
+HELLO, MOVE, WELCOME, DELTA, END, KEYFRAME = range(1, 7)
+HELLO_BODY = struct.Struct("<BHc")
+MOVE_BODY = struct.Struct("<Bbbbb")
+WELCOME_HEAD = struct.Struct("<BHdH")
+DELTA_HEAD = struct.Struct("<BIH")
+DELTA_ROW = np.dtype([("piece", "<u2"), ("row", "i1"), ("col", "i1"), ("state", "u1"),
+                      ("x", "<f4"), ("y", "<f4")])
+END_HEAD = struct.Struct("<B")
+GONE = 0xFF
+WATCH = "-"
+
+
+def frame(body: bytes) -> bytes:
+    return FRAME.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader, max_size: Optional[int] = None) -> bytes:
+    """The next frame's body; ValueError (before reading it) if it is longer than max_size."""
+    (n,) = FRAME.unpack(await reader.readexactly(FRAME.size))
+    if max_size is not None and n > max_size:
+        raise ValueError(f"frame of {n} bytes, at most {max_size} expected")
+    return await reader.readexactly(n)
+
+
+def decode_hello(body: bytes) -> Tuple[int, str]:
+    """game id, colour; ValueError if body is not a well-formed HELLO."""
+    _, game_id, colour = _unpack(body, HELLO, HELLO_BODY)
+    colour = colour.decode("ascii", errors="replace")
+    if colour not in ("W", "B", WATCH):
+        raise ValueError(f"unknown colour {colour!r}")
+    return game_id, colour
+
+
+def decode_move(body: bytes) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """src, dst cell; ValueError if body is not a well-formed MOVE."""
+    _, sr, sc, dr, dc = _unpack(body, MOVE, MOVE_BODY)
+    return (sr, sc), (dr, dc)
+
+
+def encode_welcome(game_id: int, tick_ms: float, piece_ids: List[str]) -> bytes:
+    parts = [WELCOME_HEAD.pack(WELCOME, game_id, tick_ms, len(piece_ids))]
+    for piece_id in piece_ids:
+        data = piece_id.encode()
+        parts.append(bytes([len(data)]) + data)
+    return frame(b"".join(parts))
+
+
+def decode_welcome(body: bytes) -> Tuple[int, float, List[str]]:
+    _, game_id, tick_ms, count = WELCOME_HEAD.unpack_from(body, 0)
+    i = WELCOME_HEAD.size
+    piece_ids = []
+    for _ in range(count):
+        n = body[i]
+        piece_ids.append(body[i + 1:i + 1 + n].decode())
+        i += 1 + n
+    return game_id, tick_ms, piece_ids
+
+
+def encode_delta(tick: int, rows: np.ndarray, kind: int = DELTA) -> bytes:
+    return frame(DELTA_HEAD.pack(kind, tick, len(rows)) + rows.tobytes())
+
+
+def decode_delta(body: bytes) -> Tuple[int, np.ndarray]:
+    _, tick, count = DELTA_HEAD.unpack_from(body, 0)
+    return tick, np.frombuffer(body, dtype=DELTA_ROW, count=count, offset=DELTA_HEAD.size)
+
+
+def encode_end(winner) -> bytes:
+    return frame(END_HEAD.pack(END) + (winner or "").encode())
+
+
+# ─── internal helpers ────────────────────────────────────────────
+def _unpack(body: bytes, kind: int, layout: struct.Struct) -> tuple:
+    if len(body) != layout.size or body[0] != kind:
+        got = f"kind {body[0]}" if body else "an empty body"
+        raise ValueError(f"expected kind {kind} in {layout.size} bytes, got {got} in {len(body)}")
+    return layout.unpack(body)
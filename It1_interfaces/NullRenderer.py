@@ -0,0 +1,22 @@
+class NullRenderer:
+    """
+    Stand-in for GameRenderer in headless games: same interface, no pixels,
+    no windows.
+    """
+
+    def __init__(self, board=None):
+        self.board = board
+        self.last_dirty_cells = 0
+        self.mismatched_frames = 0
+
+    def draw(self, pieces: dict, focus_cell: tuple, focus_cell2: tuple, selected_source: tuple, selected_source2: tuple, now_ms: int,
+             positions: dict = None):
+        return None
+
+    @staticmethod
+    def show(image):
+        pass
+
+    @staticmethod
+    def destroy_windows():
+        pass
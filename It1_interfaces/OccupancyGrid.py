@@ -0,0 +1,137 @@
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+EMPTY = -1
+COLOR_IDS = {"W": 1, "B": 2}   # 0 = empty cell
+STATE_IDS = {"idle": 0, "move": 1, "jump": 2, "short_rest": 3, "long_rest": 4}
+
+
+class OccupancyGrid(Mapping):
+    """
+    Which piece stands on which cell, kept as NumPy planes:
+      index[r, c] – slot of the piece on the cell (EMPTY if none)
+      color[r, c] – COLOR_IDS of that piece (0 if none)
+      state[r, c] – STATE_IDS of that piece's current state
+    Updated only when a piece changes cell or state. It is also a read-only
+    Mapping cell -> Piece, so code written against the old pos_to_piece dict
+    keeps working.
+    """
+
+    def __init__(self, rows: int, cols: int):
+        self.rows = rows
+        self.cols = cols
+        self.index = np.full((rows, cols), EMPTY, dtype=np.int32)
+        self.color = np.zeros((rows, cols), dtype=np.int8)
+        self.state = np.zeros((rows, cols), dtype=np.int8)
+        self._pieces: List = []                      # slot -> Piece (None when free)
+        self._cells: List[Optional[Tuple[int, int]]] = []  # slot -> cell (None when lifted)
+        self._state_names: List[Optional[str]] = []  # slot -> state name in the state plane
+        self._slot_of: Dict[int, int] = {}           # piece unique -> slot
+        self._free: List[int] = []
+
+    # ─── Mapping interface: cell -> Piece ────────────────────────────
+    def __getitem__(self, cell: Tuple[int, int]):
+        slot = self._slot_at(cell)
+        if slot == EMPTY:
+            raise KeyError(cell)
+        return self._pieces[slot]
+
+    def __contains__(self, cell) -> bool:
+        return self._slot_at(cell) != EMPTY
+
+    def get(self, cell, default=None):
+        slot = self._slot_at(cell)
+        return default if slot == EMPTY else self._pieces[slot]
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return (cell for cell in self._cells if cell is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for cell in self._cells if cell is not None)
+
+    # ─── queries ─────────────────────────────────────────────────────
+    def in_bounds(self, cell: Tuple[int, int]) -> bool:
+        return 0 <= cell[0] < self.rows and 0 <= cell[1] < self.cols
+
+    def color_at(self, cell: Tuple[int, int]) -> int:
+        return int(self.color[cell]) if self.in_bounds(cell) else 0
+
+    def cell_of(self, piece) -> Optional[Tuple[int, int]]:
+        slot = self._slot_of.get(piece.get_unique())
+        return None if slot is None else self._cells[slot]
+
+    def cells_of_color(self, color: str) -> List[Tuple[int, int]]:
+        rows, cols = np.nonzero(self.color == COLOR_IDS[color])
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def count(self, color: str) -> int:
+        return int(np.count_nonzero(self.color == COLOR_IDS[color]))
+
+    # ─── updates ─────────────────────────────────────────────────────
+    def place(self, piece, cell: Tuple[int, int]):
+        """Put a piece (new or lifted) on an empty cell."""
+        uid = piece.get_unique()
+        slot = self._slot_of.get(uid)
+        if slot is None:
+            slot = self._free.pop() if self._free else len(self._pieces)
+            if slot == len(self._pieces):
+                self._pieces.append(None)
+                self._cells.append(None)
+                self._state_names.append(None)
+            self._pieces[slot] = piece
+            self._slot_of[uid] = slot
+        elif self._cells[slot] is not None:
+            self.lift(piece)
+        self._cells[slot] = cell
+        self._state_names[slot] = piece._state.name
+        self.index[cell] = slot
+        self.color[cell] = COLOR_IDS.get(piece.get_id()[1], 0)
+        self.state[cell] = STATE_IDS.get(piece._state.name, 0)
+
+    def lift(self, piece):
+        """Take a piece off its cell but keep its slot (it is about to be placed again)."""
+        slot = self._slot_of[piece.get_unique()]
+        cell = self._cells[slot]
+        if cell is not None:
+            self.index[cell] = EMPTY
+            self.color[cell] = 0
+            self.state[cell] = 0
+            self._cells[slot] = None
+
+    def remove(self, piece):
+        """Forget a piece (captured)."""
+        slot = self._slot_of.get(piece.get_unique())
+        if slot is None:
+            return
+        self.lift(piece)
+        del self._slot_of[piece.get_unique()]
+        self._pieces[slot] = None
+        self._free.append(slot)
+
+    def set_state(self, piece, state_name: str):
+        slot = self._slot_of.get(piece.get_unique())
+        if slot is None or self._state_names[slot] == state_name:
+            return
+        self._state_names[slot] = state_name
+        cell = self._cells[slot]
+        if cell is not None:
+            self.state[cell] = STATE_IDS.get(state_name, 0)
+
+    def clear(self):
+        self.index.fill(EMPTY)
+        self.color.fill(0)
+        self.state.fill(0)
+        self._pieces.clear()
+        self._cells.clear()
+        self._state_names.clear()
+        self._slot_of.clear()
+        self._free.clear()
+
+    # ─── internal helpers ────────────────────────────────────────────
+    def _slot_at(self, cell) -> int:
+        r, c = cell
+        if 0 <= r < self.rows and 0 <= c < self.cols:
+            return int(self.index[r, c])
+        return EMPTY
@@ -4,15 +4,21 @@ from weakref import finalize
 
 from Command import Command
 from Board import Board
+from Clock import Clock
+from PieceStore import NOT_STARTED
 
 
 class Physics(ABC):
-    def __init__(self, start_cell: Tuple[int, int], board: Board, speed_m_s: float = 1.0):
+    def __init__(self, start_cell: Tuple[int, int], board: Board, speed_m_s: float = 1.0, clock: Clock = None):
+        self._store = None  # PieceStore row holding pos and start_time once the piece joins a game
+        self._slot = None
         self.start_cell = start_cell
         self.board = board
+        self.speed_m_s = speed_m_s
+        self.clock = clock
         self.speed = speed_m_s * 100
         self.pos = self.board.cell_to_world(start_cell)  # (x, y) in meters
-        self.start_time = 0
+        self.start_time = clock.now_ms() if clock else 0  # ms since game start
         self.cmd = None
         self.finished = False
 
@@ -36,6 +42,58 @@ class Physics(ABC):
     def get_pos(self) -> Tuple[float, float]:
         return self.pos
 
+    def _publish_timing(self, duration_ms: int, total_ms: int, start_pos=None, end_pos=None):
+        """After a reset: hand this state's timing to BatchPhysics through the PieceStore row."""
+        if self._store is None:
+            return
+        store, slot = self._store, self._slot
+        store.duration_ms[slot] = duration_ms
+        store.total_ms[slot] = total_ms
+        store.restart_timer(slot)
+        if start_pos is not None:
+            store.start_pos[slot] = start_pos
+            store.end_pos[slot] = end_pos
+
+    # pos and start_time live in the piece's PieceStore row once bound; every
+    # physics of one piece shares that row (only the current state's writes it)
+    def bind(self, store, slot: int):
+        pos, start_time = self.pos, self.start_time
+        self._store, self._slot = store, slot
+        self.pos = pos
+        self.start_time = start_time
+
+    @property
+    def pos(self) -> Tuple[float, float]:
+        if self._store is None:
+            return self._pos
+        x, y = self._store.pos[self._slot]
+        return float(x), float(y)
+
+    @pos.setter
+    def pos(self, value):
+        if self._store is None:
+            self._pos = value
+        else:
+            self._store.pos[self._slot] = value
+
+    @property
+    def start_time(self):
+        if self._store is None:
+            return self._start_time
+        t = self._store.start_ms[self._slot]
+        return None if t == NOT_STARTED else int(t)
+
+    @start_time.setter
+    def start_time(self, value):
+        if self._store is None:
+            self._start_time = value
+        else:
+            self._store.start_ms[self._slot] = NOT_STARTED if value is None else value
+
+    def clone_to(self, cell: Tuple[int, int]) -> "Physics":
+        """Fresh physics of the same kind and speed, standing on another cell."""
+        return self.__class__(cell, self.board, self.speed_m_s, self.clock)
+
     def get_pos_in_cell(self):
         return self.board.world_to_cell(self.pos)
 
@@ -59,15 +117,15 @@ class IdlePhysics(Physics):
 from typing import Tuple
 from Command import Command
 from Board import Board
+from Clock import Clock
 from Physics import Physics
 
 
 class MovePhysics(Physics):
-    def __init__(self, start_cell: Tuple[int, int], board: Board, speed_m_s: float = 1.0):
-        super().__init__(start_cell, board, speed_m_s)
+    def __init__(self, start_cell: Tuple[int, int], board: Board, speed_m_s: float = 1.0, clock: Clock = None):
+        super().__init__(start_cell, board, speed_m_s, clock)
         self.start_pos = self.board.cell_to_world(start_cell)
         self.end_pos = self.start_pos
-        self.start_time = 0
         self.duration_ms = 1 # minimal duration to avoid division by zero
         self.finished = False
         self.extra_delay_ms = 300  # Add 300ms delay after movement
@@ -87,6 +145,7 @@ class MovePhysics(Physics):
         # סך כל הזמן כולל העיכוב לאחר התנועה
         self.total_duration_ms = self.duration_ms + self.extra_delay_ms
         self.start_time = None
+        self._publish_timing(self.duration_ms, self.total_duration_ms, self.start_pos, self.end_pos)
 
     def update(self, now_ms: int) -> Command:
         if self.finished:
@@ -128,6 +187,7 @@ class JumpPhysics(Physics):
         super().reset(cmd)
         self.jump_duration = 1000  # 1 sec jump duration
         self.start_time = None
+        self._publish_timing(0, self.jump_duration)
 
     def update(self, now_ms: int) -> Command:
         if self.start_time is None:
@@ -150,6 +210,7 @@ class ShortRestPhysics(Physics):
         self.start_time = None
         self.start_cell = tuple(cmd.params[0])
         self.pos = self.board.cell_to_world(self.start_cell)
+        self._publish_timing(0, self.rest_duration)
 
     def update(self, now_ms: int) -> Command:
         if self.start_time is None:
@@ -172,6 +233,7 @@ class LongRestPhysics(Physics):
         self.start_time = None
         self.start_cell = tuple(cmd.params[0])
         self.pos = self.board.cell_to_world(self.start_cell)
+        self._publish_timing(0, self.rest_duration)
 
     def update(self, now_ms: int) -> Command:
         if self.start_time is None:
@@ -1,10 +1,12 @@
 from Board import Board
+from Clock import Clock
 from Physics import *
 
 class PhysicsFactory:
-    def __init__(self, board: Board):
-        """Initialize physics factory with board."""
+    def __init__(self, board: Board, clock: Clock = None):
+        """Initialize physics factory with board (and the game clock, if any)."""
         self.board = board
+        self.clock = clock
 
     def create(self, state_name, start_cell, cfg) -> Physics:
         """Create a physics object with the given configuration."""
@@ -12,14 +14,14 @@ class PhysicsFactory:
         speed = physics_cfg.get("speed_m_per_sec", 1.0)
 
         if state_name == "idle":
-            return IdlePhysics(start_cell, self.board, speed)
+            return IdlePhysics(start_cell, self.board, speed, self.clock)
         elif state_name == "move":
-            return MovePhysics(start_cell, self.board, speed)
+            return MovePhysics(start_cell, self.board, speed, self.clock)
         elif state_name == "jump":
-            return JumpPhysics(start_cell, self.board, speed)
+            return JumpPhysics(start_cell, self.board, speed, self.clock)
         elif state_name == "short_rest":
-            return ShortRestPhysics(start_cell, self.board, speed)
+            return ShortRestPhysics(start_cell, self.board, speed, self.clock)
         elif state_name == "long_rest":
-            return LongRestPhysics(start_cell, self.board, speed)
+            return LongRestPhysics(start_cell, self.board, speed, self.clock)
         else:
             raise ValueError(f"Unknown state name: {state_name}")
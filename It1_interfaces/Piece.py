@@ -1,26 +1,49 @@
-import PhysicsFactory
 from Board import Board
 from Command import Command
 from State import State
 from typing import Optional
-import cv2
+from img import blend_premultiplied
+from OccupancyGrid import STATE_IDS
 
 class Piece:
-    nextCode = 0
-    def __init__(self, piece_id: str, init_state: State):
+    def __init__(self, piece_id: str, init_state: State, unique: int = 0):
         self._id = piece_id
-        self._uniqueNumber = Piece.nextCode
-        Piece.nextCode += 1
+        self._uniqueNumber = unique  # handed out by the PieceFactory: unique within one game
+        self._store = None  # PieceStore holding this piece's row once it is in a game
+        self._slot = None
         self._state = init_state
         self._current_cmd: Optional[Command] = None
         self._has_moved = False  # מעקב אחר האם הכלי זז כבר
         count = 0
 
+    def _bind(self, store, slot: int):
+        self._store, self._slot = store, slot
+
+    @property
+    def _has_moved(self) -> bool:
+        if self._store is None:
+            return self._moved
+        return bool(self._store.has_moved[self._slot])
+
+    @_has_moved.setter
+    def _has_moved(self, value: bool):
+        if self._store is None:
+            self._moved = value
+        else:
+            self._store.has_moved[self._slot] = value
+
+    def _set_state(self, state: State):
+        if state is not self._state:
+            self._state = state
+            if self._store is not None:
+                self._store.state[self._slot] = STATE_IDS.get(state.name, 0)
+                self._store.touch(self._slot)
+
 
     def on_command(self, cmd: Command, now_ms: int):
         # הוסרה בדיקת is_command_possible כי זה נעשה ב-Game
         self._current_cmd = cmd
-        self._state = self._state.process_command(cmd, now_ms)
+        self._set_state(self._state.process_command(cmd, now_ms))
         # סימון שהכלי זז
         if cmd.type == "move":
             self._has_moved = True
@@ -41,49 +64,46 @@ class Piece:
             self._state.reset(self._current_cmd)
 
     def update(self, now_ms: int):
-        self._state = self._state.update(now_ms)
+        """Per-piece update; pieces in a game are advanced by BatchPhysics instead."""
+        self._set_state(self._state.update(now_ms))
         if self._state._physics.finished:
-            next_state =  next(iter(self._state.transitions.keys()))
-            new_cell = self._state._physics.get_pos_in_cell()
-            cmd = Command(now_ms, self._id, next_state, [new_cell, new_cell])
-            self.on_command(cmd, now_ms)
+            self.finish_state(now_ms)
+
+    def finish_state(self, now_ms: int, next_state: Optional[str] = None):
+        """The current state is over: continue to next_state (default: its first transition) on the current cell."""
+        if next_state is None:
+            next_state = next(iter(self._state.transitions.keys()))
+        new_cell = self._state._physics.get_pos_in_cell()
+        cmd = Command(now_ms, self._id, next_state, [new_cell, new_cell])
+        self.on_command(cmd, now_ms)
+
+    def get_sprite(self, pos=None):
+        """Return (x, y, Img) of what this piece draws right now; pos overrides the physics position."""
+        if pos is None:
+            pos = self._state._physics.get_pos()
+        return int(pos[0]), int(pos[1]), self._state._graphics.get_img()
 
     def draw_on_board(self, board: Board, now_ms: int):
-        pos = self._state._physics.get_pos()
-        img = self._state._graphics.get_img().img
-        if img is not None:
-            h, w = img.shape[:2]
-            x, y = int(pos[0]), int(pos[1])
-
-            board_img = board.img.img
-
-            # התאמה אם חורג מגבולות
-            h = min(h, board_img.shape[0] - y)
-            w = min(w, board_img.shape[1] - x)
-
-            if h > 0 and w > 0:
-                piece_img = img[:h, :w]
-                base = board_img[y:y + h, x:x + w]
-
-                # התאמת ערוצים
-                target_channels = base.shape[2]
-                piece_img = self._match_channels(piece_img, target_channels)
-
-                board_img[y:y + h, x:x + w] = self._blend(base, piece_img)
-
-    def _blend(self, base, overlay):
-        alpha = 0.8  # Simple fixed alpha
-        return cv2.addWeighted(overlay, alpha, base, 1 - alpha, 0)
-
-    def _match_channels(self, img, target_channels=3):
-        """Convert image to target_channels (3=BGR, 4=BGRA)."""
-        if img.shape[2] == target_channels:
-            return img
-        if target_channels == 3 and img.shape[2] == 4:
-            return cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-        if target_channels == 4 and img.shape[2] == 3:
-            return cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
-        return img
+        self.draw_on_region(board.img.img)
+
+    def draw_on_region(self, region, ox: int = 0, oy: int = 0, pos=None, pool=None):
+        """Draw onto an image whose top-left pixel is (ox, oy) on the board; clipped to it. pool: FramePool for temporaries."""
+        x, y, sprite = self.get_sprite(pos)
+        if sprite.img is None:
+            return
+        x -= ox
+        y -= oy
+        h, w = sprite.img.shape[:2]
+
+        # התאמה אם חורג מגבולות
+        x0, y0 = max(x, 0), max(y, 0)
+        x1 = min(x + w, region.shape[1])
+        y1 = min(y + h, region.shape[0])
+
+        if x1 > x0 and y1 > y0:
+            # sprites are premultiplied at load time (SpriteAtlas) – one blend, no conversions
+            sy, sx = slice(y0 - y, y1 - y), slice(x0 - x, x1 - x)
+            blend_premultiplied(region[y0:y1, x0:x1], sprite.color[sy, sx], sprite.inv_alpha[sy, sx], pool)
 
     def get_id(self):
         return self._id
@@ -94,29 +114,16 @@ class Piece:
     def get_command(self):
         return self._state.get_command()
 
-    def clone_to(self, cell: tuple[int, int], physics_factory: PhysicsFactory) -> "Piece":
+    def clone_to(self, cell: tuple[int, int], piece_id: Optional[str] = None, unique: int = 0) -> "Piece":
         """
         Clone this piece to a new piece at a different cell.
-        Graphics is copied, physics is recreated (new cell), moves are shared.
+        Moves, sprites and the transition table are shared with this piece;
+        only physics, graphics frame index and _has_moved are per instance.
         """
-        # מעתיק את הגרפיקה
-        graphics_copy = self._state._graphics.copy()
-
-        # יוצר פיזיקס חדש – משתמש בנתונים שכבר קיימים באובייקט
-        state_name = self._state._physics.__class__.__name__.replace("Physics", "").lower()
-        speed = getattr(self._state._physics, "speed", 1.0)
-        # אין לנו cfg, אז נבנה מינימלי
-        cfg = {"physics": {"speed_m_per_sec": speed}}
-
-        new_physics = physics_factory.create(state_name, cell, cfg)
-
-        # יוצר סטייט חדש
-        new_state = State(self._state._moves, graphics_copy, new_physics)
-
-        # מעתיק את הטרנזישנים הקיימים
-        for event, target in self._state.transitions.items():
-            new_state.set_transition(event, target)
+        machine = {}
+        for state in self._state._machine.values():
+            state.clone_to(machine, cell)
 
-        new_piece = Piece(self._id, new_state)
+        new_piece = Piece(piece_id or self._id, machine[self._state.name], unique)
         new_piece._has_moved = self._has_moved  # העתקת מצב התנועה
-        return new_piece
\ No newline at end of file
+        return new_piece
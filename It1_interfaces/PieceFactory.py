@@ -8,14 +8,17 @@ from PhysicsFactory import PhysicsFactory
 from Piece import Piece
 from State import State
 from Command import Command
+from SpriteAtlas import SpriteAtlas
+from Clock import Clock
 class PieceFactory:
-    def __init__(self, board: Board, pieces_root: pathlib.Path):
+    def __init__(self, board: Board, pieces_root: pathlib.Path, atlas: SpriteAtlas = None, clock: Clock = None):
         self.board = board
         self.pieces_root = pieces_root
-        self._physics_factory = PhysicsFactory(board)
-        self._graphics_factory = GraphicsFactory(board)
+        self._physics_factory = PhysicsFactory(board, clock)
+        self._graphics_factory = GraphicsFactory(board, atlas, clock)
         self._templates: Dict[str, Piece] = {}
         self.counter = {}
+        self._next_unique = 0  # Piece.get_unique(); per factory, so games in one process don't share a counter
     def _build_state_machine(self, piece_dir: pathlib.Path, cell: Tuple[int, int]) -> State:
         """Build a state machine for a piece from its directory."""
         states: Dict[str, State] = {}
@@ -38,28 +41,33 @@ class PieceFactory:
                 cfg["graphics"],
                 (self.board.cell_H_pix, self.board.cell_W_pix)
             )
-            states[state_name] = State(moves, graphics, physics)
+            states[state_name] = State(moves, graphics, physics, state_name)
         states["idle"].set_transition("move", states["move"])
         states["idle"].set_transition("jump", states["jump"])
         states["move"].set_transition("long_rest", states["long_rest"])
         states["jump"].set_transition("short_rest", states["short_rest"])
         states["long_rest"].set_transition("idle", states["idle"])
         states["short_rest"].set_transition("idle", states["idle"])
+        for state in states.values():
+            state.freeze()
         # יצירת ה-state הראשוני תהיה long_rest
         return states["idle"]
-    def create_piece(self, p_type: str, cell: Tuple[int, int]) -> Piece:
+
+    def _get_template(self, p_type: str) -> Piece:
+        """Build the template of a piece code once; every piece of that code is cloned from it."""
         if p_type not in self._templates:
             piece_dir = self.pieces_root / p_type
-            init_state = self._build_state_machine(piece_dir,cell)
-        #     piece = Piece(p_type, init_state)
-        #     self._templates[p_type] = piece
-        # return self._templates[p_type].clone_to(cell, self._physics_factory)
+            init_state = self._build_state_machine(piece_dir, (0, 0))
+            self._templates[p_type] = Piece(p_type, init_state)
+        return self._templates[p_type]
+
+    def create_piece(self, p_type: str, cell: Tuple[int, int]) -> Piece:
+        template = self._get_template(p_type)
         # Generate a unique id for the piece.
         if p_type not in self.counter:
             self.counter[p_type] = 0
         self.counter[p_type] += 1
         unique_id = f"{p_type}_{self.counter[p_type]}"
-        # Create and return the piece with the unique id.
-        piece = Piece(piece_id=unique_id, init_state=init_state)
-        return piece
-
+        # Clone the template with the unique id.
+        self._next_unique += 1
+        return template.clone_to(cell, unique_id, self._next_unique)
@@ -0,0 +1,133 @@
+from typing import List, Set
+
+import numpy as np
+
+from OccupancyGrid import COLOR_IDS, STATE_IDS
+
+NOT_STARTED = -1  # start_ms of a timer that starts on the next update
+KIND_IDS = {"K": 1, "Q": 2, "R": 3, "B": 4, "N": 5, "P": 6}  # 0 = unknown piece code
+KING = KIND_IDS["K"]
+IDLE = STATE_IDS["idle"]
+
+
+class PieceStore:
+    """
+    Per-piece data of a game as struct-of-arrays, one row (slot) per piece:
+      pos[s]       – (x, y) board pixels, written by the piece's physics
+      start_ms[s]  – start time of the current physics timer (NOT_STARTED)
+      duration_ms[s], total_ms[s] – travel time / time until the state is over
+      start_pos[s], end_pos[s]    – (x, y) ends of the current move
+      state[s]     – STATE_IDS of the current state
+      color[s]     – COLOR_IDS, kind[s] – KIND_IDS
+      has_moved[s] – the piece moved at least once (pawn double step)
+      alive[s]     – the slot holds a piece that is still on the board
+      cell[s]      – cell the piece stands on in the occupancy grid
+      grid_state[s] – last state id pushed to the occupancy grid
+      epoch[s]     – bumped on every state or timer change, so work queued
+                     for an older state of the row can tell it is stale
+    Piece and Physics stay as thin façades that read and write their row, so
+    the per-tick passes over all pieces are array operations.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = 0
+        self.size = 0  # slots in use so far (high-water mark)
+        self.pieces: List = []
+        self._free: List[int] = []
+        self._touched: Set[int] = set()  # slots whose state or timer changed since take_touched()
+        self._restarted: Set[int] = set()  # slots with a new physics timer since take_restarted()
+        self._allocate(max(capacity, 1))
+
+    # ─── rows ────────────────────────────────────────────────────────
+    def add(self, piece, cell) -> int:
+        """Give a piece (and every physics of its state machine) a row and move its data there."""
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self.size == self.capacity:
+                self._allocate(self.capacity * 2)
+            slot = self.size
+            self.size += 1
+
+        code = piece.get_id()
+        self.kind[slot] = KIND_IDS.get(code[:1], 0)
+        self.color[slot] = COLOR_IDS.get(code[1:2], 0)
+        self.has_moved[slot] = piece._has_moved
+        self.state[slot] = STATE_IDS.get(piece._state.name, 0)
+        self.grid_state[slot] = self.state[slot]
+        self.cell[slot] = cell
+        self.alive[slot] = True
+        self.pieces[slot] = piece
+
+        piece._bind(self, slot)
+        for state in piece._state._machine.values():
+            state._physics.bind(self, slot)
+        self.touch(slot)
+        if self.state[slot] != IDLE:
+            self._restarted.add(slot)
+        return slot
+
+    def remove(self, piece):
+        slot = piece._slot
+        if slot is None or self.pieces[slot] is not piece:
+            return
+        self.alive[slot] = False
+        self.pieces[slot] = None
+        self._free.append(slot)
+
+    def touch(self, slot: int):
+        """The row's state or timer changed."""
+        self.epoch[slot] += 1
+        self._touched.add(slot)
+
+    def restart_timer(self, slot: int):
+        """The row's physics published a new timer (Physics._publish_timing)."""
+        self.touch(slot)
+        self._restarted.add(slot)
+
+    def take_touched(self) -> np.ndarray:
+        """Sorted live slots touched since the last call."""
+        return self._take(self._touched)
+
+    def take_restarted(self) -> np.ndarray:
+        """Sorted live slots whose timer restarted since the last call."""
+        return self._take(self._restarted)
+
+    # ─── whole-board queries ─────────────────────────────────────────
+    def live_slots(self) -> np.ndarray:
+        return np.flatnonzero(self.alive[:self.size])
+
+    def cells_of(self, slots: np.ndarray, cell_w: int, cell_h: int) -> np.ndarray:
+        """(len(slots), 2) array of the (row, col) each piece's position falls in."""
+        return (self.pos[slots, ::-1] // (cell_h, cell_w)).astype(np.int64)
+
+    def count_kings(self) -> int:
+        return int(np.count_nonzero(self.alive[:self.size] & (self.kind[:self.size] == KING)))
+
+    def all_idle(self) -> bool:
+        n = self.size
+        return bool(np.all(self.state[:n][self.alive[:n]] == IDLE))
+
+    # ─── internal helpers ────────────────────────────────────────────
+    def _take(self, slots: Set[int]) -> np.ndarray:
+        taken = np.fromiter(slots, dtype=np.int64, count=len(slots))
+        slots.clear()
+        taken.sort()
+        return taken[self.alive[taken]]
+
+    _COLUMNS = (("pos", 2, np.float64, 0.0), ("start_ms", None, np.int64, 0),
+                ("duration_ms", None, np.int64, 0), ("total_ms", None, np.int64, 0),
+                ("start_pos", 2, np.float64, 0.0), ("end_pos", 2, np.float64, 0.0), ("state", None, np.int8, 0),
+                ("grid_state", None, np.int8, 0), ("color", None, np.int8, 0), ("kind", None, np.int8, 0),
+                ("has_moved", None, np.bool_, False), ("alive", None, np.bool_, False),
+                ("cell", 2, np.int32, -1), ("epoch", None, np.int64, 0))
+
+    def _allocate(self, capacity: int):
+        """(Re)allocate every column for `capacity` rows, keeping the rows in use."""
+        for name, width, dtype, fill in self._COLUMNS:
+            column = np.full((capacity, width) if width else capacity, fill, dtype=dtype)
+            if self.capacity:
+                column[:self.capacity] = getattr(self, name)
+            setattr(self, name, column)
+        self.pieces.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
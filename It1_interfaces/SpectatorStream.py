@@ -0,0 +1,120 @@
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from NetProtocol import DELTA, KEYFRAME, DELTA_ROW, GONE, encode_welcome, encode_delta, encode_end
+
+Send = Callable[[bytes], bool]  # gets every message of the stream; returns False to be dropped
+
+
+class SpectatorStream:
+    """
+    Live view of one game for any number of spectators, in the NetProtocol
+    format. After every tick it encodes one message: a DELTA with only the
+    pieces whose cell, state or position changed since the previous tick,
+    or every keyframe_every ticks a KEYFRAME with all pieces, so a client
+    that lost data resyncs within a second. The message is encoded once and
+    the same bytes go to every subscriber – the encoding cost does not grow
+    with the audience. Nothing is encoded while nobody watches.
+    Subscribe on the thread that runs the game (GameServer's event loop).
+    """
+
+    def __init__(self, stream_id: int = 0, keyframe_every: int = 100):
+        self.stream_id = stream_id
+        self.keyframe_every = keyframe_every
+        self.welcome = b""
+        self.ticks = 0
+        self.messages = 0
+        self.keyframes = 0
+        self.bytes_encoded = 0
+        self.encode_s = 0.0
+        self.fanout_s = 0.0
+        self._game = None
+        self._slots = np.empty(0, dtype=np.int64)
+        self._rows = np.empty(0, dtype=DELTA_ROW)  # this tick
+        self._sent = np.empty(0, dtype=DELTA_ROW)  # what the subscribers have
+        self._subscribers: List[Send] = []
+
+    def subscribe(self, send: Send):
+        """Send the welcome and a keyframe now, then every message of the stream."""
+        keyframe = self.keyframe()
+        if not self._subscribers:
+            self._sent = self._rows.copy()  # deltas continue from this keyframe
+        self._subscribers.append(send)
+        if not (send(self.welcome) and send(keyframe)):
+            self.unsubscribe(send)
+
+    def unsubscribe(self, send: Send):
+        self._subscribers = [s for s in self._subscribers if s is not send]
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def keyframe(self) -> bytes:
+        """Every piece as it is now."""
+        self._read_rows()
+        return encode_delta(self.ticks, self._rows, KEYFRAME)
+
+    # ─── called by Game ──────────────────────────────────────────────
+    def begin(self, now_ms: int, game):
+        self._game = game
+        pieces = list(game.pieces.values())  # piece number on the wire -> Piece
+        self._slots = np.array([piece._slot for piece in pieces], dtype=np.int64)
+        self._rows = np.zeros(len(pieces), dtype=DELTA_ROW)
+        self._rows["piece"] = np.arange(len(pieces))
+        self._sent = self._rows.copy()
+        self.welcome = encode_welcome(self.stream_id, game.tick_ms, [piece.get_id() for piece in pieces])
+
+    def after_tick(self, now_ms: int):
+        self.ticks += 1
+        if not self._subscribers:
+            return
+        t0 = time.perf_counter()
+        if self.ticks % self.keyframe_every == 0:
+            data = self.keyframe()
+            self.keyframes += 1
+        else:
+            data = self._delta()
+        self._sent, self._rows = self._rows, self._sent
+        t1 = time.perf_counter()
+        self.encode_s += t1 - t0
+        if data is not None:
+            self._publish(data)
+            self.fanout_s += time.perf_counter() - t1
+
+    def close(self, winner: Optional[str]):
+        self._publish(encode_end(winner))
+        self._subscribers = []
+
+    # ─── internal helpers ────────────────────────────────────────────
+    def _read_rows(self):
+        store = self._game.store
+        slots, rows = self._slots, self._rows
+        cells = store.cell[slots]
+        rows["row"], rows["col"] = cells[:, 0], cells[:, 1]
+        rows["state"] = store.state[slots]
+        rows["x"], rows["y"] = store.pos[slots, 0], store.pos[slots, 1]
+        # a captured piece's slot is freed, and nothing is added during a game to reuse it
+        gone = ~store.alive[slots]
+        if gone.any():
+            rows["state"][gone] = GONE
+            for name in ("row", "col", "x", "y"):
+                rows[name][gone] = 0
+
+    def _delta(self) -> Optional[bytes]:
+        self._read_rows()
+        rows, sent = self._rows, self._sent
+        changed = ((rows["row"] != sent["row"]) | (rows["col"] != sent["col"]) | (rows["state"] != sent["state"]) |
+                   (rows["x"] != sent["x"]) | (rows["y"] != sent["y"]))
+        if not changed.any():
+            return None
+        return encode_delta(self.ticks, rows[changed], DELTA)
+
+    def _publish(self, data: bytes):
+        self.messages += 1
+        self.bytes_encoded += len(data)
+        dropped = [send for send in self._subscribers if not send(data)]
+        for send in dropped:
+            self.unsubscribe(send)
@@ -0,0 +1,129 @@
+import pathlib
+import threading
+from typing import Dict, List, Tuple
+
+import cv2
+import numpy as np
+
+from img import Img, premultiply, blend_planes
+
+SPRITE_SUFFIXES = (".png", ".jpg", ".jpeg")
+
+
+class SpriteAtlas:
+    """
+    Process-wide cache of decoded sprite strips.
+    Each (sprites_dir, cell size) pair is decoded once into one packed
+    (frames, H, W, 4) premultiplied BGRA array, plus the packed color and
+    inverse-alpha planes used for blending; Graphics objects only hold views.
+    """
+    _shared: "SpriteAtlas" = None
+
+    def __init__(self):
+        self._strips: Dict[Tuple[str, Tuple[int, int]], np.ndarray] = {}
+        self._planes: Dict[Tuple[str, Tuple[int, int]], Tuple[np.ndarray, np.ndarray]] = {}
+        self._sprites: Dict[Tuple[str, Tuple[int, int]], List[Img]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls) -> "SpriteAtlas":
+        """Return the atlas shared by every factory in this process."""
+        if cls._shared is None:
+            cls._shared = SpriteAtlas()
+        return cls._shared
+
+    def get_strip(self, sprites_dir: pathlib.Path, cell_size: Tuple[int, int]) -> np.ndarray:
+        """Return the packed (frames, H, W, 4) array for a folder, decoding it on first use."""
+        return self._lookup(sprites_dir, cell_size)[0]
+
+    def get_sprites(self, sprites_dir: pathlib.Path, cell_size: Tuple[int, int]) -> List[Img]:
+        """Return one Img per frame; each Img wraps a view into the packed strip."""
+        return self._lookup(sprites_dir, cell_size)[1]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "strips": len(self._strips),
+                "bytes": sum(s.nbytes for s in self._strips.values()) +
+                         sum(c.nbytes + a.nbytes for c, a in self._planes.values()),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._strips.clear()
+            self._planes.clear()
+            self._sprites.clear()
+            self.hits = 0
+            self.misses = 0
+
+    # ─── internal helpers ─────────────────────────────────────────────
+    def _lookup(self, sprites_dir: pathlib.Path, cell_size: Tuple[int, int]):
+        key = (str(pathlib.Path(sprites_dir).resolve()), (int(cell_size[0]), int(cell_size[1])))
+        with self._lock:
+            strip = self._strips.get(key)
+            if strip is not None:
+                self.hits += 1
+                return strip, self._sprites[key]
+
+            self.misses += 1
+            strip = self._decode(pathlib.Path(sprites_dir), key[1])
+            color, inv_alpha = blend_planes(strip)
+            color.flags.writeable = False
+            inv_alpha.flags.writeable = False
+            sprites = []
+            for i, frame in enumerate(strip):
+                img = Img()
+                img.img = frame  # views, no copies
+                img.color = color[i]
+                img.inv_alpha = inv_alpha[i]
+                img.premultiplied = True
+                sprites.append(img)
+            self._strips[key] = strip
+            self._planes[key] = (color, inv_alpha)
+            self._sprites[key] = sprites
+            return strip, sprites
+
+    @staticmethod
+    def _decode(folder: pathlib.Path, cell_size: Tuple[int, int]) -> np.ndarray:
+        """Read every sprite in sorted order, resize to cell_size (w, h) and pack as premultiplied BGRA."""
+        cell_w, cell_h = cell_size
+        frames = []
+        for img_path in sorted(folder.iterdir()):
+            if img_path.suffix.lower() in SPRITE_SUFFIXES:
+                frames.append(SpriteAtlas._to_bgra(Img().read(img_path, size=(cell_w, cell_h)).img))
+
+        strip = np.empty((len(frames), cell_h, cell_w, 4), dtype=np.uint8)
+        for i, frame in enumerate(frames):
+            strip[i] = premultiply(frame)
+        strip.flags.writeable = False  # shared by every piece – never draw into it
+        return strip
+
+    @staticmethod
+    def _to_bgra(img: np.ndarray) -> np.ndarray:
+        if img.ndim == 2:
+            return cv2.cvtColor(img, cv2.COLOR_GRAY2BGRA)
+        if img.shape[2] == 3:
+            return cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+        return img
+
+
+class NullAtlas(SpriteAtlas):
+    """
+    Atlas for headless games: never touches the sprite folders and hands out a
+    single blank frame (img is None) that the draw code already skips.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._blank = [Img()]
+
+    def get_strip(self, sprites_dir: pathlib.Path, cell_size: Tuple[int, int]) -> np.ndarray:
+        return np.empty((0, int(cell_size[1]), int(cell_size[0]), 4), dtype=np.uint8)
+
+    def get_sprites(self, sprites_dir: pathlib.Path, cell_size: Tuple[int, int]) -> List[Img]:
+        self.hits += 1
+        return self._blank
@@ -1,20 +1,47 @@
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
 from Command import Command
 from Moves import Moves
 from Graphics import Graphics
 from Physics import Physics
-from typing import Dict, Optional
 
 
 class State:
-    def __init__(self, moves: Moves, graphics: Graphics, physics: Physics):
+    __slots__ = ("name", "_moves", "_graphics", "_physics", "transitions", "_machine", "_current_command")
+
+    def __init__(self, moves: Moves, graphics: Graphics, physics: Physics, name: str = ""):
+        self.name = name
         self._moves = moves
         self._graphics = graphics
         self._physics = physics
-        self.transitions: Dict[str, "State"] = {}
+        # event -> target state name. Shared read-only between clones once frozen.
+        self.transitions: Mapping[str, str] = {}
+        # state name -> State, one dict per piece shared by all of its states
+        self._machine: Dict[str, "State"] = {name: self}
         self._current_command: Optional[Command] = None
 
     def set_transition(self, event: str, target: "State"):
-        self.transitions[event] = target
+        self.transitions[event] = target.name
+        self._machine.update(target._machine)
+        target._machine = self._machine
+
+    def freeze(self):
+        """Make the transition table read-only so clones can share it."""
+        self.transitions = MappingProxyType(dict(self.transitions))
+
+    def clone_to(self, machine: Dict[str, "State"], cell) -> "State":
+        """Per-instance copy: shared moves/sprites/transitions, fresh physics and frame index."""
+        state = State.__new__(State)
+        state.name = self.name
+        state._moves = self._moves
+        state._graphics = self._graphics.copy()
+        state._physics = self._physics.clone_to(cell)
+        state.transitions = self.transitions
+        state._machine = machine
+        state._current_command = None
+        machine[self.name] = state
+        return state
 
     def reset(self, cmd: Command):
         self._current_command = cmd
@@ -29,9 +56,10 @@ class State:
         return self
 
     def process_command(self, cmd: Command, now_ms: int) -> "State":
-        next_state = self.transitions.get(cmd.type)
-        if next_state is None:
+        target = self.transitions.get(cmd.type)
+        if target is None:
             return self  # stay in current state
+        next_state = self._machine[target]
         next_state.reset(cmd)
         return next_state
 
@@ -40,4 +68,3 @@ class State:
 
     def get_command(self) -> Optional[Command]:
         return self._current_command
-
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Any, List, Tuple
+
+from EventType import EventType
+
+
+class Subscriber(ABC):
+    """
+    Receives events from a MessageBroker, on the broker's delivery thread for
+    this subscriber – never on the game loop.
+    """
+
+    @abstractmethod
+    def handle_event(self, event_type: EventType, data: Any):
+        pass
+
+    def handle_batch(self, events: List[Tuple[EventType, Any]]):
+        """Everything delivered in one go, oldest first; override to e.g. write a batch at once."""
+        for event_type, data in events:
+            self.handle_event(event_type, data)
@@ -0,0 +1,110 @@
+"""
+Allocation benchmark for the render loop, with tracemalloc (which also sees
+NumPy's array buffers). A game between two RandomPlayers is drawn on
+virtual time; after a warm-up, each Game._render call is measured on its
+own – the ticks in between are not:
+  peak    the most memory the frame had allocated at once beyond what was
+          live before it (a full-size frame array would show up here)
+  kept    what was still allocated after it (steady state: ~0)
+for incremental and full redraws, on a BGR and a BGRA board. For scale: one
+Board.clone(), which every full redraw used to allocate.
+
+    python bench_allocations.py PIECES_ROOT [--frames 500] [--warmup 100]
+"""
+import argparse
+import contextlib
+import io
+import pathlib
+import tracemalloc
+
+import numpy as np
+
+from Board import Board
+from Clock import VirtualClock
+from Game import Game
+from img import Img
+from InputSource import RandomPlayer
+
+BOARD_CSV = pathlib.Path(__file__).resolve().parent / "board.csv"
+TICKS_PER_FRAME = 2  # 100 Hz simulation, 50 fps
+
+
+def make_board(channels: int) -> Board:
+    squares = (np.indices((8, 8)).sum(axis=0) % 2).astype(np.uint8)
+    pixels = np.kron(squares, np.ones((80, 80), dtype=np.uint8))
+    planes = [pixels * 90 + 120, pixels * 60 + 150, pixels * 40 + 170, np.full_like(pixels, 255)]
+    return Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8,
+                 img=Img().set(np.dstack(planes[:channels])))
+
+
+def run(pieces_root: pathlib.Path, incremental: bool, channels: int, frames: int, warmup: int) -> dict:
+    clock = VirtualClock()
+    game = Game(make_board(channels), pieces_root, BOARD_CSV, clock=clock,
+                input_sources=[RandomPlayer("W", 1), RandomPlayer("B", 2)])
+    game.renderer.incremental = incremental
+    game.renderer.show = lambda image: None
+    game.input_handler.start()
+    for piece in game.pieces.values():
+        piece.reset(0)
+
+    now = 0
+    peaks, kept = [], []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for frame in range(warmup + frames):
+            for _ in range(TICKS_PER_FRAME):
+                game.input_handler.update()
+                prev_pos = game._piece_positions()
+                game._tick(now)
+                now += int(game.tick_ms)
+                clock.advance_to(now)
+            if frame == warmup:
+                tracemalloc.start()
+                pool_allocations = game.renderer.pool.allocations
+            if frame < warmup:
+                game._render(now, 0.5, prev_pos)
+                continue
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            game._render(now, 0.5, prev_pos)
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            kept.append(current - before)
+        tracemalloc.stop()
+    return {
+        "peak_mean": float(np.mean(peaks)),
+        "peak_max": max(peaks),
+        "kept_per_frame": sum(kept) / len(kept),
+        "pool_allocations": game.renderer.pool.allocations - pool_allocations,
+        "frame_bytes": game.board.img.img.nbytes,
+    }
+
+
+def clone_bytes(channels: int) -> int:
+    board = make_board(channels)
+    tracemalloc.start()
+    clone = board.clone()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del clone
+    return allocated
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pieces_root", type=pathlib.Path)
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=100)
+    args = parser.parse_args()
+
+    for channels in (3, 4):
+        print(f"{'BGR' if channels == 3 else 'BGRA'} board: one Board.clone() = {clone_bytes(channels) / 1024:.0f} KiB")
+        for incremental in (True, False):
+            r = run(args.pieces_root, incremental, channels, args.frames, args.warmup)
+            print(f"  {'incremental' if incremental else 'full redraw':<12} per frame: "
+                  f"peak {r['peak_mean'] / 1024:5.1f} KiB (max {r['peak_max'] / 1024:5.1f}), "
+                  f"kept {r['kept_per_frame']:6.1f} B, "
+                  f"pool allocations after warm-up {r['pool_allocations']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Micro-benchmark: frames per second for compositing a full set of piece sprites
+onto the board.
+
+    legacy-addWeighted : the old Piece.draw_on_board (cvtColor + fixed 0.8 alpha)
+    legacy-float-mask  : the old Img.draw_on (per-channel float mask loop)
+    premultiplied      : blend_premultiplied on sprites premultiplied at load time (SpriteAtlas)
+
+    python bench_compositing.py [pieces] [seconds]
+"""
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from img import premultiply, blend_planes, blend_premultiplied
+
+BOARD_PX, CELL_PX = 640, 80
+
+
+def _legacy_add_weighted(board, sprite, x, y):
+    piece_img = cv2.cvtColor(sprite, cv2.COLOR_BGRA2BGR)
+    base = board[y:y + CELL_PX, x:x + CELL_PX]
+    board[y:y + CELL_PX, x:x + CELL_PX] = cv2.addWeighted(piece_img, 0.8, base, 0.2, 0)
+
+
+def _legacy_float_mask(board, sprite, x, y):
+    roi = board[y:y + CELL_PX, x:x + CELL_PX]
+    mask = sprite[..., 3] / 255.0
+    for c in range(3):
+        roi[..., c] = (1 - mask) * roi[..., c] + mask * sprite[..., c]
+
+
+def _premultiplied(board, planes, x, y):
+    blend_premultiplied(board[y:y + CELL_PX, x:x + CELL_PX], *planes)
+
+
+def _fps(composite, background, sprites, cells, seconds):
+    frame = background.copy()
+    frames = 0
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        np.copyto(frame, background)
+        for sprite, (x, y) in zip(sprites, cells):
+            composite(frame, sprite, x, y)
+        frames += 1
+    return frames / (time.perf_counter() - t0)
+
+
+def main(n_pieces: int = 32, seconds: float = 2.0):
+    rng = np.random.default_rng(0)
+    background = rng.integers(0, 256, (BOARD_PX, BOARD_PX, 3), dtype=np.uint8)
+    sprites = [rng.integers(0, 256, (CELL_PX, CELL_PX, 4), dtype=np.uint8) for _ in range(n_pieces)]
+    premultiplied = [blend_planes(premultiply(s)) for s in sprites]
+    per_row = BOARD_PX // CELL_PX
+    cells = [((i % per_row) * CELL_PX, (i // per_row % per_row) * CELL_PX) for i in range(n_pieces)]
+
+    baseline = None
+    for name, composite, frames in (("legacy-addWeighted", _legacy_add_weighted, sprites),
+                                    ("legacy-float-mask", _legacy_float_mask, sprites),
+                                    ("premultiplied", _premultiplied, premultiplied)):
+        fps = _fps(composite, background, frames, cells, seconds)
+        baseline = baseline or fps
+        print(f"{name:>20}: {fps:8.1f} fps  ({fps / baseline:4.2f}x)")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 32, float(args[1]) if len(args) > 1 else 2.0)
@@ -0,0 +1,105 @@
+"""
+Load test for the event bus: a publisher emits --events PIECE_MOVED events
+as fast as it can to a fast subscriber and a slow one (it sleeps --slow-ms
+per batch, like a logger writing to disk). Reports the publish cost per
+event – which must not depend on the slow subscriber – and, per subscriber,
+what was delivered and dropped, for each queue policy. For comparison, the
+same subscribers called inline (the old synchronous publish).
+
+The burst is far larger than a queue, and the publisher holds the GIL,
+so even the fast subscriber – and the "alone" rows, a no-op subscriber
+with nobody else on the broker – lose most of it with the drop policies
+(one run: drop_oldest fast got 3331 of 20000; alone ~90% dropped with a
+256-slot queue, 60-70% with the default 1024). That is the burst
+outrunning the delivery thread, not the slow subscriber: see
+MessageBroker.
+
+    python bench_events.py [--events 20000] [--slow-ms 2] [--queue 256]
+"""
+import argparse
+import time
+
+from Command import Command
+from EventQueue import POLICIES
+from EventType import EventType
+from MessageBroker import MessageBroker, DEFAULT_MAXSIZE
+from Subscriber import Subscriber
+
+
+class Counter(Subscriber):
+    def __init__(self, delay_s: float = 0.0):
+        self.delay_s = delay_s
+        self.seen = 0
+
+    def handle_event(self, event_type, data):
+        self.seen += 1
+
+    def handle_batch(self, events):
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        self.seen += len(events)
+
+
+def publish_all(publish, count: int) -> float:
+    """Seconds spent inside publish() for `count` events."""
+    cmds = [Command(i, "PW", "move", ["e2", "e4"]) for i in range(count)]
+    t0 = time.perf_counter()
+    for cmd in cmds:
+        publish(EventType.PIECE_MOVED, cmd)
+    return time.perf_counter() - t0
+
+
+def run_policy(policy: str, args) -> str:
+    broker = MessageBroker()
+    fast, slow = Counter(), Counter(args.slow_ms / 1000)
+    broker.subscribe(EventType.PIECE_MOVED, fast, maxsize=args.queue)
+    broker.subscribe(EventType.PIECE_MOVED, slow, maxsize=args.queue, policy=policy)
+    broker.start()
+    spent = publish_all(broker.publish, args.events)
+    broker.stop(timeout_s=60)
+    stats = list(broker.stats().values())
+    return (f"{policy:>12}: publish {spent / args.events * 1e6:7.2f} us/event  "
+            f"fast got {fast.seen:>6} (dropped {stats[0]['dropped']})  "
+            f"slow got {slow.seen:>6} (dropped {stats[1]['dropped']})")
+
+
+def run_alone(maxsize: int, args) -> str:
+    """A no-op subscriber on its own: what a burst loses to the publisher alone."""
+    broker = MessageBroker()
+    sub = Counter()
+    broker.subscribe(EventType.PIECE_MOVED, sub, maxsize=maxsize)
+    broker.start()
+    spent = publish_all(broker.publish, args.events)
+    broker.stop(timeout_s=60)
+    dropped = list(broker.stats().values())[0]["dropped"]
+    return (f"{'alone':>12}: publish {spent / args.events * 1e6:7.2f} us/event  "
+            f"queue {maxsize:>5}: got {sub.seen:>6} (dropped {dropped}, {dropped / args.events:.0%})")
+
+
+def run_inline(args) -> str:
+    fast, slow = Counter(), Counter(args.slow_ms / 1000)
+
+    def publish(event_type, data):  # every subscriber handled on the publisher's thread
+        for sub in (fast, slow):
+            sub.handle_batch([(event_type, data)])
+    count = min(args.events, 500)  # at slow-ms per event the full run would take ages
+    spent = publish_all(publish, count)
+    return f"{'inline':>12}: publish {spent / count * 1e6:7.2f} us/event  ({count} events)"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--slow-ms", type=float, default=2.0)
+    parser.add_argument("--queue", type=int, default=256)
+    args = parser.parse_args()
+
+    print(run_inline(args))
+    for policy in POLICIES:
+        print(run_policy(policy, args))
+    for maxsize in sorted({args.queue, DEFAULT_MAXSIZE}):
+        print(run_alone(maxsize, args))
+
+
+if __name__ == "__main__":
+    main()
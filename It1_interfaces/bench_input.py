@@ -0,0 +1,94 @@
+"""
+Load test for the input path: producer threads push move Commands through a
+ProgrammaticSource (at --rate per second each, or as fast as they can with
+--rate 0) while a headless game ticks on real time. Reports submitted and processed commands
+per second and the enqueue -> handled latency in game ms.
+
+    python bench_input.py PIECES_ROOT [--seconds 3] [--producers 2] [--rate 2000]
+"""
+import argparse
+import contextlib
+import io
+import pathlib
+import random
+import threading
+import time
+
+from Board import Board
+from Clock import RealTimeClock
+from Game import Game
+from img import Img
+from InputSource import ProgrammaticSource
+
+BOARD_CSV = pathlib.Path(__file__).resolve().parent / "board.csv"
+SQUARES = [f"{f}{r}" for f in "abcdefgh" for r in range(1, 9)]
+
+
+def producer(source: ProgrammaticSource, stop: threading.Event, rate: float, seed: int):
+    rng = random.Random(seed)
+    interval = 1.0 / rate if rate else 0.0
+    next_t = time.perf_counter()
+    while not stop.is_set():
+        source.move(rng.choice(SQUARES), rng.choice(SQUARES))
+        if interval:
+            next_t += interval
+            delay = next_t - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pieces_root", type=pathlib.Path)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--producers", type=int, default=2)
+    parser.add_argument("--rate", type=float, default=2000.0, help="commands/s per producer, 0 = unthrottled")
+    args = parser.parse_args()
+
+    board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+    source = ProgrammaticSource()
+    game = Game(board, args.pieces_root, BOARD_CSV, headless=True, clock=RealTimeClock(), input_sources=[source])
+
+    latencies = []
+    handle_batch = game.command_handler.handle_batch
+
+    def timed_batch(commands, now):
+        handled_ms = game.clock.now_ms()
+        latencies.extend(handled_ms - cmd.timestamp for cmd in commands)
+        return handle_batch(commands, now)
+
+    game.command_handler.handle_batch = timed_batch
+
+    for piece in game.pieces.values():
+        piece.reset(game.game_time_ms())
+    game.input_handler.start()
+
+    stop = threading.Event()
+    threads = [threading.Thread(target=producer, args=(source, stop, args.rate, seed), daemon=True)
+               for seed in range(args.producers)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        while time.perf_counter() - t0 < args.seconds:
+            game.input_handler.update()
+            game._tick(game.game_time_ms())
+        stop.set()
+        for t in threads:
+            t.join()
+    elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    print(f"producers {args.producers}, {elapsed:.2f}s, {game.stats.ticks / elapsed:.0f} ticks/s")
+    print(f"submitted {source.submitted / elapsed:10.0f} cmd/s")
+    totals = game.command_handler.totals
+    processed = sum(totals.values())
+    print(f"processed {processed / elapsed:10.0f} cmd/s  (backlog {game.user_input_queue.qsize()})")
+    print(f"          {totals}")
+    if latencies:
+        print(f"latency   p50 {latencies[len(latencies) // 2]} ms  "
+              f"p99 {latencies[int(len(latencies) * 0.99)]} ms  max {latencies[-1]} ms")
+
+
+if __name__ == "__main__":
+    main()
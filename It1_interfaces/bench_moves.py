@@ -0,0 +1,126 @@
+"""
+Benchmark: legal-move generation per second on random positions, the old
+per-call rule filtering + cell-by-cell path walk vs. the precomputed tables.
+Also checks that both produce the same legal move sets.
+
+    python bench_moves.py [positions] [seconds]
+"""
+import pathlib
+import random
+import sys
+import tempfile
+import time
+
+from Board import Board
+from img import Img
+from OccupancyGrid import OccupancyGrid
+from PieceFactory import PieceFactory
+from synthetic_pieces import write_pieces_root
+
+CODES = [t + c for t in "KQRBNP" for c in "WB"]
+
+
+def legacy_get_moves(moves, r, c, has_moved, pos_to_piece):
+    """The old Moves.get_moves."""
+    possible_moves = []
+    if moves.piece_type.startswith('P'):
+        direction = 1 if moves.piece_type == 'PB' else -1
+        forward_moves = [(dr, dc) for dr, dc in moves.rules if dc == 0]
+        forward_moves.sort(key=lambda x: abs(x[0]))
+        for dr, dc in forward_moves:
+            if abs(dr) == 2 and has_moved:
+                continue
+            new_r, new_c = r + dr, c + dc
+            if 0 <= new_r < moves.dims[0] and 0 <= new_c < moves.dims[1]:
+                if (new_r, new_c) in pos_to_piece:
+                    break
+                possible_moves.append((new_r, new_c))
+        for dc in (-1, 1, 0):
+            target = (r + direction, c + dc)
+            if 0 <= target[0] < moves.dims[0] and 0 <= target[1] < moves.dims[1] and target in pos_to_piece:
+                if pos_to_piece[target].get_id()[1] != moves.piece_type[1]:
+                    possible_moves.append(target)
+    else:
+        for dr, dc in moves.rules:
+            new_r, new_c = r + dr, c + dc
+            if 0 <= new_r < moves.dims[0] and 0 <= new_c < moves.dims[1]:
+                possible_moves.append((new_r, new_c))
+    return possible_moves
+
+
+def legacy_is_path_clear(pos_to_piece, src_cell, dst_cell):
+    """The old CommandHandler._is_path_clear."""
+    dx = dst_cell[1] - src_cell[1]
+    dy = dst_cell[0] - src_cell[0]
+    step_x = dx // abs(dx) if dx else 0
+    step_y = dy // abs(dy) if dy else 0
+    if (step_x != 0 or step_y != 0) and (abs(dx) == abs(dy) or dx == 0 or dy == 0):
+        cur_cell = (src_cell[0] + step_y, src_cell[1] + step_x)
+        while cur_cell != dst_cell:
+            if cur_cell in pos_to_piece:
+                return False
+            cur_cell = (cur_cell[0] + step_y, cur_cell[1] + step_x)
+    return True
+
+
+def legacy_legal_moves(piece, cell, pos_to_piece):
+    """What CommandHandler.handle_command used to accept, for every destination."""
+    moves = piece._state._moves
+    legal = []
+    for dst in legacy_get_moves(moves, *cell, piece._has_moved, pos_to_piece):
+        target = pos_to_piece.get(dst)
+        if target is not None and target.get_id()[1] == piece.get_id()[1]:
+            continue
+        if legacy_is_path_clear(pos_to_piece, cell, dst) and dst not in legal:
+            legal.append(dst)
+    return legal
+
+
+def random_positions(factory, count, rng):
+    positions = []
+    cells = [(r, c) for r in range(8) for c in range(8)]
+    for _ in range(count):
+        grid = OccupancyGrid(8, 8)
+        for cell in rng.sample(cells, rng.randint(4, 32)):
+            piece = factory.create_piece(rng.choice(CODES), cell)
+            piece._has_moved = rng.random() < 0.5
+            grid.place(piece, cell)
+        positions.append((grid, dict(grid.items())))
+    return positions
+
+
+def _rate(generate, positions, seconds):
+    calls = 0
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        for grid, as_dict in positions:
+            for cell, piece in as_dict.items():
+                generate(piece, cell, grid, as_dict)
+                calls += 1
+    return calls / (time.perf_counter() - t0)
+
+
+def main(count: int = 200, seconds: float = 2.0):
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = write_pieces_root(pathlib.Path(tmp), CODES, frames=1, sprite_px=8)
+        board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+        positions = random_positions(PieceFactory(board, root), count, rng)
+
+    mismatches = 0
+    for grid, as_dict in positions:
+        for cell, piece in as_dict.items():
+            expected = sorted(legacy_legal_moves(piece, cell, as_dict))
+            actual = sorted(set(piece._state._moves.get_legal_moves(*cell, piece._has_moved, grid)))
+            mismatches += expected != actual
+    print(f"parity: {mismatches} mismatching move sets")
+
+    old = _rate(lambda p, cell, grid, d: legacy_legal_moves(p, cell, d), positions, seconds)
+    new = _rate(lambda p, cell, grid, d: p._state._moves.get_legal_moves(*cell, p._has_moved, grid), positions, seconds)
+    print(f"{'legacy':>8}: {old:10.0f} move lists/s")
+    print(f"{'tables':>8}: {new:10.0f} move lists/s  ({new / old:.2f}x)")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 200, float(args[1]) if len(args) > 1 else 2.0)
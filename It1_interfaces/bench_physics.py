@@ -0,0 +1,106 @@
+"""
+Benchmark: advancing N pieces through move -> long_rest -> idle, the old
+per-piece Piece.update loop vs. one BatchPhysics step per tick over a
+PieceStore. Also checks that both end every tick with the same positions
+and states, then times both once every piece is idle again – the batch
+step keeps its timers in a deadline heap, so a settled board costs it
+(almost) nothing.
+
+    python bench_physics.py [pieces] [ticks]
+"""
+import pathlib
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from BatchPhysics import BatchPhysics
+from Board import Board
+from Command import Command
+from img import Img
+from PieceFactory import PieceFactory
+from PieceStore import PieceStore
+from SpriteAtlas import NullAtlas
+from synthetic_pieces import write_pieces_root
+
+TICK_MS = 10
+SETTLE_TICKS = 1500  # 15 s – longer than any move plus its rests
+SQUARES = [f"{f}{r}" for f in "abcdefgh" for r in range(1, 9)]
+
+
+def make_pieces(factory, board, count, rng):
+    pieces = []
+    for _ in range(count):
+        src, dst = rng.sample(SQUARES, 2)
+        piece = factory.create_piece("QW", board.algebraic_to_cell(src))
+        pieces.append((piece, Command(0, piece.get_id(), "move", [src, dst])))
+    return pieces
+
+
+def run_legacy(pieces, ticks):
+    for piece, cmd in pieces:
+        piece.on_command(cmd, 0)
+
+    def tick(now):
+        for piece, _ in pieces:
+            piece.update(now)
+    return timed(tick, ticks)
+
+
+def run_batch(pieces, ticks):
+    store = PieceStore(len(pieces))
+    for piece, cmd in pieces:
+        store.add(piece, piece._state._physics.start_cell)
+    for piece, cmd in pieces:
+        piece.on_command(cmd, 0)
+    physics = BatchPhysics(store)
+
+    def tick(now):
+        for slot, next_state in physics.transitions(now):
+            store.pieces[slot].finish_state(now, next_state)
+    return timed(tick, ticks)
+
+
+def timed(tick, ticks):
+    """(seconds for `ticks` ticks, seconds for `ticks` more once every piece is idle)."""
+    t0 = time.perf_counter()
+    for n in range(1, ticks + 1):
+        tick(n * TICK_MS)
+    busy = time.perf_counter() - t0
+    n = ticks
+    while n < ticks + SETTLE_TICKS:  # let every move and rest run out
+        n += 1
+        tick(n * TICK_MS)
+    t0 = time.perf_counter()
+    for n in range(n + 1, n + ticks + 1):
+        tick(n * TICK_MS)
+    return busy, time.perf_counter() - t0
+
+
+def main(count: int = 2000, ticks: int = 500):
+    with tempfile.TemporaryDirectory() as tmp:
+        root = write_pieces_root(pathlib.Path(tmp), ["QW"], frames=1, sprite_px=8)
+        board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+        factory = PieceFactory(board, root, NullAtlas())
+        legacy = make_pieces(factory, board, count, random.Random(1))
+        batch = make_pieces(factory, board, count, random.Random(1))
+
+    (old, old_idle) = run_legacy(legacy, ticks)
+    (new, new_idle) = run_batch(batch, ticks)
+
+    pos_old = np.array([p._state._physics.get_pos() for p, _ in legacy])
+    pos_new = np.array([p._state._physics.get_pos() for p, _ in batch])
+    same_states = all(a._state.name == b._state.name for (a, _), (b, _) in zip(legacy, batch))
+    print(f"parity: max position difference {np.abs(pos_old - pos_new).max():.3g}px, "
+          f"states {'match' if same_states else 'DIFFER'}")
+    print(f"{'per-piece':>10}: {ticks * count / old:12.0f} piece-updates/s")
+    print(f"{'batch':>10}: {ticks * count / new:12.0f} piece-updates/s  ({old / new:.1f}x)")
+    print(f"settled board: per-piece {old_idle / ticks * 1e6:.1f} us/tick, "
+          f"batch {new_idle / ticks * 1e6:.1f} us/tick")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 2000, int(args[1]) if len(args) > 1 else 500)
@@ -0,0 +1,74 @@
+"""
+Benchmark: piece construction time and retained memory, per-piece state
+machines (the old create_piece) vs. template-and-clone.
+
+    python bench_piece_factory.py [pieces ...]
+"""
+import pathlib
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from Board import Board
+from img import Img
+from Piece import Piece
+from PieceFactory import PieceFactory
+from synthetic_pieces import write_pieces_root
+
+CODES = [t + c for t in "KQRBNP" for c in "WB"]
+
+
+def _board(cols: int) -> Board:
+    return Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1,
+                 W_cells=cols, H_cells=8, img=Img())
+
+
+def _layout(n_pieces: int):
+    cols = max(1, n_pieces // 4)
+    cells = []
+    for row, color in ((0, "B"), (1, "B"), (6, "W"), (7, "W")):
+        for col in range(cols):
+            kind = "P" if row in (1, 6) else "RNBQKBNR"[col % 8]
+            cells.append((kind + color, (row, col)))
+    return cols, cells
+
+
+def _build_per_piece(factory: PieceFactory, cells):
+    pieces = []
+    for code, cell in cells:
+        init_state = factory._build_state_machine(factory.pieces_root / code, cell)
+        pieces.append(Piece(code, init_state))
+    return pieces
+
+
+def _build_from_templates(factory: PieceFactory, cells):
+    return [factory.create_piece(code, cell) for code, cell in cells]
+
+
+def _measure(build, pieces_root: pathlib.Path, n_pieces: int):
+    cols, cells = _layout(n_pieces)
+    factory = PieceFactory(_board(cols), pieces_root)
+    factory._get_template("KW")  # warm the sprite atlas so both paths only pay for construction
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    pieces = build(factory, cells)
+    elapsed = time.perf_counter() - t0
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(pieces), elapsed, retained
+
+
+def main(sizes):
+    with tempfile.TemporaryDirectory() as tmp:
+        pieces_root = write_pieces_root(pathlib.Path(tmp), CODES, frames=2, sprite_px=16)
+        print(f"{'pieces':>8} {'mode':>10} {'total ms':>10} {'us/piece':>9} {'KiB':>9} {'B/piece':>8}")
+        for n in sizes:
+            for name, build in (("per-piece", _build_per_piece), ("template", _build_from_templates)):
+                count, elapsed, retained = _measure(build, pieces_root, n)
+                print(f"{count:>8} {name:>10} {elapsed * 1000:>10.1f} {elapsed / count * 1e6:>9.1f} "
+                      f"{retained / 1024:>9.0f} {retained / count:>8.0f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [32, 1024, 4096])
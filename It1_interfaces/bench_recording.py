@@ -0,0 +1,93 @@
+"""
+Load test for FrameRecorder: a rendered game between two RandomPlayers runs
+in real time for --seconds (drawn, not shown) while it is recorded with
+several settings. Reports per setting the frame rate, the simulation ticks
+lost against tick_hz (the game loop drops ticks only when a frame takes too
+long), the game-thread cost of recording, and the recorder's own numbers:
+frames written, skipped by fps, dropped on a full ring, encode backlog.
+
+    python bench_recording.py PIECES_ROOT [--seconds 5] [--out /tmp/recordings]
+
+"every frame, ring 1, block" writes every frame and makes the game wait
+for the encoder – about what writing on the game thread would cost.
+"not recording" is the noise floor of the ticks lost (0-1 on an idle host).
+On a single core, "png, every frame" does lose ticks (~11 in 2 s): the
+writer needs most of the CPU the game loop runs on – see FrameRecorder.
+"""
+import argparse
+import contextlib
+import io
+import pathlib
+import threading
+
+import numpy as np
+
+from Board import Board
+from Clock import RealTimeClock
+from EventQueue import DROP_NEWEST, DROP_OLDEST, BLOCK
+from FrameRecorder import FrameRecorder
+from Game import Game
+from img import Img
+from InputSource import RandomPlayer
+
+BOARD_CSV = pathlib.Path(__file__).resolve().parent / "board.csv"
+
+SETTINGS = [  # name, file name, FrameRecorder arguments
+    ("not recording", None, None),
+    ("mp4, 30 fps, ring 8, drop newest", "game.mp4", dict(fps=30, ring=8, overflow=DROP_NEWEST)),
+    ("mp4, every frame, ring 8, drop oldest", "game_all.mp4", dict(fps=None, ring=8, overflow=DROP_OLDEST)),
+    ("png, 30 fps, ring 8, drop newest", "frames", dict(fps=30, ring=8, overflow=DROP_NEWEST)),
+    ("png, every frame, ring 8, drop newest", "frames_all", dict(fps=None, ring=8, overflow=DROP_NEWEST)),
+    ("png, every frame, ring 1, block", "frames_block", dict(fps=None, ring=1, overflow=BLOCK, block_timeout_s=None)),
+]
+
+
+def make_board() -> Board:
+    squares = (np.indices((8, 8)).sum(axis=0) % 2).astype(np.uint8)
+    pixels = np.kron(squares, np.ones((80, 80), dtype=np.uint8))
+    board_img = np.dstack([pixels * 90 + 120, pixels * 60 + 150, pixels * 40 + 170])
+    return Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8,
+                 img=Img().set(board_img))
+
+
+def run(pieces_root: pathlib.Path, seconds: float, recorder) -> dict:
+    game = Game(make_board(), pieces_root, BOARD_CSV, clock=RealTimeClock(), recorder=recorder,
+                input_sources=[RandomPlayer("W", 1), RandomPlayer("B", 2)])
+    game.renderer.show = lambda image: None  # no window: this measures drawing and recording only
+    game.renderer.destroy_windows = lambda: None
+    timer = threading.Timer(seconds, lambda: setattr(game, "_running", False))
+    timer.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.run()
+    timer.cancel()
+    stats = game.stats.report()
+    record = stats["phases"].get("record", {"wall_ms": 0.0, "calls": 1})
+    return {
+        "fps": stats["fps"],
+        "ticks_lost": max(round(stats["elapsed_s"] * 1000 / game.tick_ms) - game.stats.ticks, 0),
+        "record_ms": record["wall_ms"] / record["calls"],
+        "recorder": recorder.report() if recorder is not None else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pieces_root", type=pathlib.Path)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--out", type=pathlib.Path, default=pathlib.Path("recordings"))
+    args = parser.parse_args()
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    for name, file_name, kwargs in SETTINGS:
+        recorder = FrameRecorder(args.out / file_name, **kwargs) if file_name else None
+        r = run(args.pieces_root, args.seconds, recorder)
+        line = f"{name:<40} {r['fps']:5.1f} fps, {r['ticks_lost']:4d} ticks lost, record {r['record_ms']:.2f} ms/frame"
+        rec = r["recorder"]
+        if rec is not None:
+            line += (f", {rec['written']} written, {rec['skipped']} skipped, {rec['dropped']} dropped, "
+                     f"max backlog {rec['max_backlog']}, encode {rec['encode_ms_per_frame']:.2f} ms/frame")
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Load test for SpectatorStream: a seeded game between two RandomPlayers is
+streamed to --spectators in-memory subscribers. Reports, per audience size,
+the encoding cost per tick – which must stay flat as the audience grows –
+the fan-out cost, and the bytes per tick against sending every piece every
+tick. One subscriber decodes the stream and checks, after every tick, that
+it matches the game.
+
+    python bench_spectators.py PIECES_ROOT [--spectators 1 10 100 1000] [--seconds 20]
+"""
+import argparse
+import contextlib
+import io
+import pathlib
+
+import numpy as np
+
+from Board import Board
+from Game import Game
+from img import Img
+from InputSource import RandomPlayer
+from NetProtocol import DELTA, KEYFRAME, DELTA_ROW, FRAME, GONE, decode_delta
+from SpectatorStream import SpectatorStream
+
+BOARD_CSV = pathlib.Path(__file__).resolve().parent / "board.csv"
+
+
+class Viewer:
+    """A subscriber that applies the stream to its own copy of the pieces."""
+
+    def __init__(self):
+        self.rows = None
+        self.messages = 0
+
+    def send(self, data: bytes) -> bool:
+        body = data[FRAME.size:]
+        self.messages += 1
+        if body[0] in (DELTA, KEYFRAME):
+            _, rows = decode_delta(body)
+            if self.rows is None:
+                self.rows = rows.copy()
+            self.rows[rows["piece"]] = rows
+        return True
+
+
+def expected_rows(game: Game, slots: np.ndarray) -> np.ndarray:
+    store = game.store
+    rows = np.zeros(len(slots), dtype=DELTA_ROW)
+    rows["piece"] = np.arange(len(slots))
+    alive = store.alive[slots]
+    rows["row"] = np.where(alive, store.cell[slots, 0], 0)
+    rows["col"] = np.where(alive, store.cell[slots, 1], 0)
+    rows["state"] = np.where(alive, store.state[slots], GONE)
+    rows["x"] = np.where(alive, store.pos[slots, 0], 0)
+    rows["y"] = np.where(alive, store.pos[slots, 1], 0)
+    return rows
+
+
+def run(pieces_root: pathlib.Path, spectators: int, seconds: float) -> dict:
+    board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+    stream = SpectatorStream()
+    game = Game(board, pieces_root, BOARD_CSV, headless=True, spectators=stream)
+    game.input_handler.sources += [RandomPlayer("W", 1), RandomPlayer("B", 2)]
+    slots = np.array([piece._slot for piece in game.pieces.values()], dtype=np.int64)
+
+    viewer = Viewer()
+    mismatches = 0
+    begin = stream.begin
+
+    def begin_and_subscribe(now_ms, g):
+        begin(now_ms, g)
+        stream.subscribe(viewer.send)
+        for _ in range(spectators - 1):
+            stream.subscribe(lambda data: True)
+    stream.begin = begin_and_subscribe
+
+    after_tick = stream.after_tick
+
+    def checked_after_tick(now_ms):
+        nonlocal mismatches
+        after_tick(now_ms)
+        if not np.array_equal(viewer.rows, expected_rows(game, slots)):
+            mismatches += 1
+    stream.after_tick = checked_after_tick
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = game.run_headless([], max_ms=int(seconds * 1000))
+    ticks = max(stream.ticks, 1)
+    return {
+        "ticks": result["ticks"],
+        "encode_us": stream.encode_s / ticks * 1e6,
+        "fanout_us": stream.fanout_s / ticks * 1e6,
+        "bytes_per_tick": stream.bytes_encoded / ticks,
+        "full_bytes_per_tick": len(stream.keyframe()),
+        "keyframes": stream.keyframes,
+        "mismatches": mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pieces_root", type=pathlib.Path)
+    parser.add_argument("--spectators", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--seconds", type=float, default=20.0)
+    args = parser.parse_args()
+
+    for n in args.spectators:
+        r = run(args.pieces_root, n, args.seconds)
+        print(f"{n:>5} spectators: encode {r['encode_us']:6.1f} us/tick, fan-out {r['fanout_us']:7.1f} us/tick, "
+              f"{r['bytes_per_tick']:6.1f} bytes/tick (every piece every tick: {r['full_bytes_per_tick']}), "
+              f"{r['keyframes']} keyframes, {r['ticks']} ticks, {r['mismatches']} mismatching")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Parity suite: BitboardEngine against Moves.get_legal_moves on the start
+position of board.csv and on random positions. Exits with status 1 on any
+mismatch and then reports move lists generated per second for both engines.
+
+    python bitboard_parity.py [positions]
+"""
+import csv
+import pathlib
+import random
+import sys
+import tempfile
+import time
+
+from Bitboard import BitboardEngine
+from Board import Board
+from img import Img
+from OccupancyGrid import OccupancyGrid
+from PieceFactory import PieceFactory
+from bench_moves import CODES, random_positions
+from synthetic_pieces import write_pieces_root
+
+
+def start_position(factory, csv_path: pathlib.Path):
+    grid = OccupancyGrid(8, 8)
+    with csv_path.open() as f:
+        for row_idx, row in enumerate(csv.reader(f)):
+            for col_idx, code in enumerate(row):
+                if code.strip():
+                    grid.place(factory.create_piece(code.strip(), (row_idx, col_idx)), (row_idx, col_idx))
+    return grid, dict(grid.items())
+
+
+def compare(engine, grid):
+    """Number of pieces whose legal move sets differ between the two engines."""
+    engine.load(grid)
+    mismatches = 0
+    for cell, piece in grid.items():
+        code = piece.get_id().split("_")[0]
+        for has_moved in (False, True):
+            expected = sorted(set(piece._state._moves.get_legal_moves(*cell, has_moved, grid)))
+            actual = engine.legal_moves(code, cell, has_moved)
+            if expected != actual:
+                mismatches += 1
+                print(f"{piece.get_id()} at {cell} has_moved={has_moved}: moves {expected} bitboard {actual}")
+    return mismatches
+
+
+def main(count: int = 500):
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = write_pieces_root(pathlib.Path(tmp), CODES, frames=1, sprite_px=8)
+        board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+        factory = PieceFactory(board, root)
+        engine = BitboardEngine.from_factory(factory, CODES)
+        positions = [start_position(factory, pathlib.Path(__file__).parent / "board.csv")]
+        positions += random_positions(factory, count, rng)
+
+    mismatches = sum(compare(engine, grid) for grid, _ in positions)
+    print(f"parity: {len(positions)} positions, {mismatches} mismatching move sets")
+    if mismatches:
+        sys.exit(1)
+
+    for name, generate in (("moves", lambda p, code, cell, grid: p._state._moves.get_legal_moves(*cell, p._has_moved, grid)),
+                           ("bitboard", lambda p, code, cell, grid: engine.legal_mask(code, cell, p._has_moved))):
+        calls = 0
+        t0 = time.perf_counter()
+        for _ in range(5):
+            for grid, as_dict in positions:
+                engine.load(grid)
+                for cell, piece in as_dict.items():
+                    generate(piece, piece.get_id().split("_")[0], cell, grid)
+                    calls += 1
+        print(f"{name:>9}: {calls / (time.perf_counter() - t0):10.0f} move lists/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
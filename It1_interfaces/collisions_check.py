@@ -0,0 +1,84 @@
+"""
+Plays moves in every direction – up, down, left, right and diagonally, for
+both colours – and logs every cell crossing Collisions (or the sampled
+fallback in Game) applies. Checks that each mover enters each cell of its
+path exactly once and ends on its destination, and that the crossings and
+their times (from the start of the move) are the same at every tick rate.
+
+    python collisions_check.py PIECES_ROOT [--tick-hz 100 50 25]
+"""
+import argparse
+import collections
+import contextlib
+import io
+import pathlib
+
+from Board import Board
+from Command import Command
+from Game import Game
+from img import Img
+
+BOARD_CSV = pathlib.Path(__file__).resolve().parent / "board.csv"
+
+# (ms, src, dst); no piece goes back over a cell it has left, and nothing is captured
+SCRIPT = [
+    (0, "a2", "a4"), (0, "e2", "e3"), (0, "f2", "f4"), (0, "h7", "h5"), (0, "b7", "b6"), (0, "g7", "g6"),
+    (5000, "a1", "a3"), (5000, "f1", "c4"), (5000, "h8", "h6"), (5000, "c8", "a6"), (5000, "f8", "g7"),
+    (10000, "a3", "d3"), (10000, "e1", "h4"), (10000, "b8", "c6"),
+    (15000, "d3", "d5"),
+    (20000, "d5", "a5"),
+]
+
+
+def play(pieces_root: pathlib.Path, tick_hz: float):
+    """Every crossing as (ms into the move, piece id, cell), and each piece's cell at the end."""
+    board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+    game = Game(board, pieces_root, BOARD_CSV, tick_hz=tick_hz, headless=True)
+    crossings = []
+    apply_crossings = game.collisions.apply_crossings
+
+    def logged(t, moves):
+        store = game.store
+        crossings.extend((float(t - store.start_ms[slot]), store.pieces[slot].get_id(), tuple(cell))
+                         for slot, cell in moves)
+        return apply_crossings(t, moves)
+    game.collisions.apply_crossings = logged
+
+    commands = [Command(ms, 0, "move", [src, dst]) for ms, src, dst in SCRIPT]
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.run_headless(commands, max_ms=30000)
+    return crossings, {piece.get_id(): game.occupancy.cell_of(piece) for piece in game.pieces.values()}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pieces_root", type=pathlib.Path)
+    parser.add_argument("--tick-hz", type=float, nargs="+", default=[100.0, 50.0, 25.0])
+    args = parser.parse_args()
+
+    board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+    destinations = set()  # where the moved pieces end up
+    for _, src, dst in SCRIPT:
+        destinations.discard(board.algebraic_to_cell(src))
+        destinations.add(board.algebraic_to_cell(dst))
+
+    reference = None
+    for tick_hz in args.tick_hz:
+        crossings, cells = play(args.pieces_root, tick_hz)
+        entered = collections.defaultdict(list)
+        for _, piece_id, cell in crossings:
+            entered[piece_id].append(cell)
+        repeated = {piece_id: path for piece_id, path in entered.items() if len(set(path)) != len(path)}
+        ends = collections.Counter(cells.values())
+        missing = [dst for dst in destinations if ends[dst] != 1]
+        same = reference is None or crossings == reference
+        reference = reference or crossings
+        print(f"{tick_hz:g} Hz: {len(crossings)} crossings by {len(entered)} pieces, "
+              f"{len(repeated)} entering a cell twice, {len(missing)} destinations not reached, "
+              f"{'same' if same else 'DIFFERENT'} times as {args.tick_hz[0]:g} Hz")
+        for piece_id, path in repeated.items():
+            print(f"  {piece_id}: {path}")
+
+
+if __name__ == "__main__":
+    main()
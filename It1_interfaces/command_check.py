@@ -0,0 +1,74 @@
+"""
+Feeds well-formed and malformed move commands through
+CommandHandler.handle_batch, one per fresh headless game, and checks that
+each is accepted or rejected as expected – never raised. Squares may be
+algebraic ("e2") or (row, col) tuples, the form a replayed journal uses;
+anything else (lists, ints, off-board or missing squares) is rejected.
+Then sends the same commands through InputHandler and Game._tick, as a
+game loop would.
+
+    python command_check.py PIECES_ROOT
+"""
+import argparse
+import contextlib
+import io
+import pathlib
+
+from Board import Board
+from Command import Command
+from Game import Game
+from img import Img
+
+BOARD_CSV = pathlib.Path(__file__).resolve().parent / "board.csv"
+
+CASES = [  # name, params, accepted
+    ("algebraic", ["e2", "e4"], True),
+    ("cell tuples", [(6, 4), (4, 4)], True),
+    ("mixed", ["e2", (4, 4)], True),
+    ("lists", [[6, 4], [4, 4]], False),
+    ("ints", [6, 4], False),
+    ("off-board tuple", [(6, 4), (8, 4)], False),
+    ("short tuple", [(6,), (4, 4)], False),
+    ("float tuple", [(6.0, 4.0), (4.0, 4.0)], False),
+    ("bad square", ["e2", "z9"], False),
+    ("one square", ["e2"], False),
+    ("no squares", [], False),
+    ("None", [None, None], False),
+]
+
+
+def make_game(pieces_root: pathlib.Path) -> Game:
+    board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+    return Game(board, pieces_root, BOARD_CSV, headless=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pieces_root", type=pathlib.Path)
+    args = parser.parse_args()
+
+    failures = 0
+    for name, params, expected in CASES:
+        game = make_game(args.pieces_root)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                accepted = game.command_handler.handle_batch([Command(0, "x", "move", params)], 0)["accepted"] == 1
+                # the same command the way a game loop gets it
+                loop = make_game(args.pieces_root)
+                for piece in loop.pieces.values():
+                    piece.reset(0)
+                loop.input_handler.start()
+                loop.input_handler.submit(Command(0, "x", "move", params))
+                loop.input_handler.update()
+                loop._tick(0)
+            result = "accepted" if accepted else "rejected"
+            ok = accepted == expected
+        except Exception as e:
+            result, ok = f"raised {type(e).__name__}: {e}", False
+        failures += not ok
+        print(f"{name:<16} {str(params):<26} {result}{'' if ok else '  <- WRONG'}")
+    print(f"{len(CASES)} commands, {failures} wrong")
+
+
+if __name__ == "__main__":
+    main()
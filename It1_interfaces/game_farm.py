@@ -0,0 +1,49 @@
+"""
+Play many games between two random bots on all cores and report who wins.
+
+    python game_farm.py PIECES_ROOT [--games 1000] [--workers N] [--max-ms 300000] [--think-ms 250] [--first-seed 0]
+
+Game i plays seed first-seed + i, so a run can be repeated (or split over
+machines) exactly. Useful to see what a change to the rules or to the
+pieces does to the balance: compare the win split and capture counts.
+"""
+import argparse
+import pathlib
+import time
+
+from Board import Board
+from GameFarm import GameFarm
+from img import Img
+
+BOARD_CSV = pathlib.Path(__file__).resolve().parent / "board.csv"
+
+
+def make_board() -> Board:
+    return Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pieces_root", type=pathlib.Path)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-ms", type=int, default=300_000)
+    parser.add_argument("--think-ms", type=int, default=250)
+    parser.add_argument("--first-seed", type=int, default=0)
+    args = parser.parse_args()
+
+    farm = GameFarm(make_board, args.pieces_root, BOARD_CSV, workers=args.workers,
+                    max_ms=args.max_ms, think_ms=args.think_ms)
+    t0 = time.perf_counter()
+    results = farm.run(range(args.first_seed, args.first_seed + args.games))
+    elapsed = time.perf_counter() - t0
+
+    summary = GameFarm.summary(results)
+    print(f"{summary['games']} games on {farm.workers} processes in {elapsed:.1f}s "
+          f"({summary['games'] / elapsed * 60:.0f} games/min, {summary['ticks'] / elapsed:.0f} ticks/s)")
+    print("wins:", summary["wins"])
+    print(f"mean game: {summary['mean_end_ms'] / 1000:.1f}s game time, captures {summary['mean_captures']}")
+
+
+if __name__ == "__main__":
+    main()
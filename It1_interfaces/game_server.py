@@ -0,0 +1,99 @@
+"""
+Run the multiplayer GameServer, or load-test it with loopback clients.
+
+    python game_server.py PIECES_ROOT serve [--port 8765] [--tick-hz 100]
+    python game_server.py PIECES_ROOT bench [--games 1 8 32 128] [--seconds 5] [--watchers 0]
+
+bench starts a server in this process and, for each --games count, that
+many games with a White and a Black LoopbackClient each (plus --watchers
+spectators per game), all over localhost TCP. It reports per step the
+tick rate each game achieved, how late ticks finished (histogram over all
+games), traffic and move latency, and finally the most games that kept
+up: at least 95% of the tick rate with p99 lateness under one tick.
+The clients share the process (and the GIL) with the server, so this is a
+lower bound for a server on its own.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import pathlib
+
+from Board import Board
+from GameServer import GameServer
+from img import Img
+from LatencyHistogram import LatencyHistogram
+from LoopbackClient import LoopbackClient
+
+BOARD_CSV = pathlib.Path(__file__).resolve().parent / "board.csv"
+
+
+def make_board() -> Board:
+    return Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+
+
+WARMUP_S = 1.0  # games load their sprites and clients connect; not measured
+
+
+async def bench_step(args, games: int) -> dict:
+    server = GameServer(make_board, args.pieces_root, BOARD_CSV, tick_hz=args.tick_hz)
+    await server.start()
+    for game_id in range(games):
+        server.host_game(game_id)
+    clients = []
+    for game_id in range(games):
+        clients.append(LoopbackClient(server.host, server.port, game_id, "W", seed=2 * game_id))
+        clients.append(LoopbackClient(server.host, server.port, game_id, "B", seed=2 * game_id + 1))
+        clients += [LoopbackClient(server.host, server.port, game_id) for _ in range(args.watchers)]
+    runs = asyncio.gather(*(client.run(WARMUP_S + args.seconds) for client in clients))
+    await asyncio.sleep(WARMUP_S)
+    server.reset_stats()
+    for client in clients:
+        client.move_latency = LatencyHistogram()
+    await runs
+    report = server.report()
+    await server.stop()
+
+    latency = LatencyHistogram()
+    for client in clients:
+        latency.merge(client.move_latency)
+    report["move_latency"] = latency.summary()
+    return report
+
+
+async def bench(args):
+    best = 0
+    for games in args.games:
+        with contextlib.redirect_stdout(io.StringIO()):  # the games print every refused move
+            r = await bench_step(args, games)
+        late = r["tick_late"]
+        kept_up = r["tick_hz_per_game"] >= 0.95 * args.tick_hz and late["p99_ms"] < 1000 / args.tick_hz
+        if kept_up:
+            best = games
+        print(f"{games:>5} games: {r['tick_hz_per_game']:6.1f} ticks/s per game, "
+              f"late p50 {late['p50_ms']:6.2f} p99 {late['p99_ms']:7.2f} max {late['max_ms']:7.1f} ms, "
+              f"{r['bytes_per_s'] / 1024:8.1f} KiB/s out, {r['commands']['accepted']} moves taken, "
+              f"move latency p50 {r['move_latency']['p50_ms']:.1f} ms  {'ok' if kept_up else 'BEHIND'}")
+    print(f"most games kept up with at {args.tick_hz:g} Hz: {best}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pieces_root", type=pathlib.Path)
+    parser.add_argument("mode", choices=("serve", "bench"))
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--tick-hz", type=float, default=100.0)
+    parser.add_argument("--games", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--watchers", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.mode == "serve":
+        server = GameServer(make_board, args.pieces_root, BOARD_CSV, tick_hz=args.tick_hz, port=args.port)
+        asyncio.run(server.serve_forever())
+    else:
+        asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Play scripted games headless (no sprites, no windows) on virtual time and
+report the results and the throughput.
+
+A script has one command per line: "<ms> <src> <dst>", e.g. "0 e2 e4".
+Blank lines and lines starting with # are ignored.
+
+    python headless_games.py PIECES_ROOT script.txt [script.txt ...] [--repeat N]
+"""
+import argparse
+import collections
+import contextlib
+import io
+import pathlib
+import time
+from typing import List
+
+from Board import Board
+from Command import Command
+from Game import Game
+from img import Img
+from InputSource import ScriptedSource
+
+BOARD_CSV = pathlib.Path(__file__).resolve().parent / "board.csv"
+
+
+def play(pieces_root: pathlib.Path, commands: List[Command], max_ms: int = None, quiet: bool = True) -> dict:
+    board = Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+    game = Game(board, pieces_root, BOARD_CSV, headless=True)
+    out = io.StringIO() if quiet else None
+    with contextlib.redirect_stdout(out) if quiet else contextlib.nullcontext():
+        return game.run_headless(commands, max_ms)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pieces_root", type=pathlib.Path)
+    parser.add_argument("scripts", type=pathlib.Path, nargs="+")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--max-ms", type=int, default=None)
+    args = parser.parse_args()
+
+    scripts = [(path, ScriptedSource.load(path)) for path in args.scripts]
+    winners = collections.Counter()
+    ticks = 0
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for path, commands in scripts:
+            result = play(args.pieces_root, commands, args.max_ms)
+            winners[result["winner"]] += 1
+            ticks += result["ticks"]
+            if args.repeat == 1:
+                print(f"{path.name}: {result}")
+    elapsed = time.perf_counter() - t0
+
+    games = args.repeat * len(scripts)
+    print(f"{games} games in {elapsed:.2f}s  ({games / elapsed:.1f} games/s, {ticks / elapsed:.0f} ticks/s)")
+    print("winners:", dict(winners))
+
+
+if __name__ == "__main__":
+    main()
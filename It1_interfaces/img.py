@@ -5,7 +5,47 @@ import pathlib
 import cv2
 import numpy as np
 
+def premultiply(bgra: np.ndarray) -> np.ndarray:
+    """Return a copy of a BGRA uint8 image with B, G, R multiplied by alpha (rounded)."""
+    out = bgra.copy()
+    alpha = bgra[..., 3:4].astype(np.uint16)
+    out[..., :3] = (bgra[..., :3] * alpha + 127) // 255
+    return out
+
+
+def blend_planes(premultiplied_bgra: np.ndarray):
+    """Split a premultiplied BGRA image into the contiguous (color, 255 - alpha) planes blend_premultiplied takes."""
+    color = np.ascontiguousarray(premultiplied_bgra[..., :3])
+    inv_alpha = np.repeat(255 - premultiplied_bgra[..., 3:4], 3, axis=-1)
+    return color, inv_alpha
+
+
+def blend_premultiplied(dst: np.ndarray, color: np.ndarray, inv_alpha: np.ndarray, pool=None):
+    """
+    Composite a premultiplied sprite over dst in place, with its real per-pixel alpha:
+    dst.bgr = color + round(dst.bgr * (255 - alpha) / 255), uint8 in and out.
+    dst may be BGR or BGRA; its alpha channel is left untouched. pool (a
+    FramePool) lends the BGRA path its temporary, else it is allocated.
+    """
+    if dst.shape[2] == 3:
+        cv2.multiply(dst, inv_alpha, dst=dst, scale=1 / 255)
+        cv2.add(dst, color, dst=dst)
+        return
+    # BGRA target: cv2 cannot write through a 3-of-4 channel view, so blend a contiguous copy of B, G, R
+    bgr = dst[..., :3]
+    tmp = np.empty(bgr.shape, dtype=np.uint8) if pool is None else pool.scratch("blend", bgr.shape)
+    np.copyto(tmp, bgr)
+    cv2.multiply(tmp, inv_alpha, dst=tmp, scale=1 / 255)
+    cv2.add(tmp, color, dst=tmp)
+    np.copyto(bgr, tmp)
+
+
 class Img:
+    # Sprites from the SpriteAtlas are premultiplied BGRA and carry their blend planes
+    premultiplied = False
+    color = None
+    inv_alpha = None
+
     def __init__(self):
         self.img = None
 
@@ -51,12 +91,6 @@ class Img:
         if self.img is None or other_img.img is None:
             raise ValueError("Both images must be loaded before drawing.")
 
-        if self.img.shape[2] != other_img.img.shape[2]: # Check if channel count matches
-            if self.img.shape[2] == 3 and other_img.img.shape[2] == 4:
-                self.img = cv2.cvtColor(self.img, cv2.COLOR_BGR2BGRA)
-            elif self.img.shape[2] == 4 and other_img.img.shape[2] == 3:
-                self.img = cv2.cvtColor(self.img, cv2.COLOR_BGRA2BGR)
-
         h, w = self.img.shape[:2]
         H, W = other_img.img.shape[:2]
 
@@ -66,12 +100,13 @@ class Img:
         roi = other_img.img[y:y + h, x:x + w]
 
         if self.img.shape[2] == 4:
-            b, g, r, a = cv2.split(self.img)
-            mask = a / 255.0
-            for c in range(3):
-                roi[..., c] = (1 - mask) * roi[..., c] + mask * self.img[..., c]
+            if self.premultiplied:
+                color, inv_alpha = self.color, self.inv_alpha
+            else:
+                color, inv_alpha = blend_planes(premultiply(self.img))
+            blend_premultiplied(roi, color, inv_alpha)
         else:
-            other_img.img[y:y + h, x:x + w] = self.img
+            roi[..., :3] = self.img
 
     def put_text(self, txt, x, y, font_size, color=(255, 255, 255, 255), thickness=1): # Add text to the image
         if self.img is None:
@@ -0,0 +1,100 @@
+"""
+Records a headless game (random legal moves, one try per tick) into a GameJournal,
+then seeks a JournalReplay to random times in random order and checks
+that every piece's cell, state and position match what the live game had
+after that tick. Reports the journal size and the cost of a seek against
+simulating from the start.
+
+    python journal_check.py PIECES_ROOT [--seconds 30] [--seeks 50] [--snapshot-ms 1000]
+"""
+import argparse
+import contextlib
+import io
+import pathlib
+import random
+import tempfile
+import time
+
+from Board import Board
+from Command import Command
+from Game import Game
+from GameJournal import GameJournal
+from img import Img
+from JournalReplay import JournalReplay
+
+BOARD_CSV = pathlib.Path(__file__).resolve().parent / "board.csv"
+
+
+def make_board() -> Board:
+    return Board(cell_H_pix=80, cell_W_pix=80, cell_H_m=1, cell_W_m=1, W_cells=8, H_cells=8, img=Img())
+
+
+def pieces_state(game: Game) -> dict:
+    """piece id -> (cell, state, position) of everything on the board."""
+    return {piece.get_id(): (game.occupancy.cell_of(piece), piece._state.name, piece._state._physics.get_pos())
+            for piece in game.pieces.values()}
+
+
+def random_legal_move(game: Game, now: int, rng: random.Random):
+    """A legal move of a random idle piece, or None."""
+    idle = [(cell, piece) for cell, piece in game.pos_to_piece.items() if piece._state.name == "idle"]
+    if not idle:
+        return None
+    cell, piece = rng.choice(idle)
+    targets = [dst for dst in piece._state._moves.get_moves(*cell, piece._has_moved, game.pos_to_piece)
+               if piece._state._moves.is_legal(cell, dst, piece._has_moved, game.pos_to_piece)]
+    if not targets:
+        return None
+    dst = rng.choice(targets)
+    return Command(now, piece.get_id(), "move",
+                   [game.board.cell_to_algebraic(cell), game.board.cell_to_algebraic(dst)])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pieces_root", type=pathlib.Path)
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--seeks", type=int, default=50)
+    parser.add_argument("--snapshot-ms", type=int, default=1000)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "game.kfj"
+        game = Game(make_board(), args.pieces_root, BOARD_CSV, headless=True,
+                    journal=GameJournal(path, args.snapshot_ms))
+        live = {}
+        tick = game._tick
+
+        def recorded_tick(now):
+            cmd = random_legal_move(game, now, rng)
+            if cmd is not None:
+                game.user_input_queue.put(cmd)
+            tick(now)
+            live[now] = pieces_state(game)
+        game._tick = recorded_tick
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = game.run_headless([], max_ms=int(args.seconds * 1000))
+        size = path.stat().st_size
+
+        replay = JournalReplay(path, make_board(), args.pieces_root, BOARD_CSV)
+        times = rng.sample(sorted(live), min(args.seeks, len(live)))
+        mismatches = 0
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for t in times:
+                if pieces_state(replay.seek(t)) != live[t]:
+                    mismatches += 1
+        seek_s = time.perf_counter() - t0
+
+    ticks = result["ticks"]
+    print(f"game: {ticks} ticks, {result['commands']}, winner {result['winner']}")
+    print(f"journal: {size} bytes, {game.journal.records} records, {len(replay.snapshots)} snapshots, "
+          f"{len(replay.captures)} captures")
+    print(f"seeks: {len(times)} to random times, {mismatches} mismatching, "
+          f"{seek_s / len(times) * 1000:.2f} ms/seek, {replay.ticks_simulated / len(times):.0f} ticks simulated "
+          f"per seek (from the start: {ticks / 2:.0f} on average)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
-import csv, pathlib, time, queue, threading, cv2
+import csv, pathlib, sys, time, queue, threading, cv2
 from typing import List, Dict, Tuple
 from Board import Board
 from pathlib import Path
 from Board import Board
 from Game import Game
+from FrameRecorder import FrameRecorder
 from img import Img
 if __name__ == "__main__":
     # Initialize paths
@@ -37,6 +38,8 @@ if __name__ == "__main__":
     #     img=Img().read(str(base_path.parent / "board.png"), size=(640, 640))
     # )
 
-    game = Game(board, pieces_root, placement_csv)
+    # python main.py [game.mp4 | frames_dir]  – also record the game, as a video or PNG files
+    recorder = FrameRecorder(sys.argv[1]) if len(sys.argv) > 1 else None
+    game = Game(board, pieces_root, placement_csv, recorder=recorder)
     game.run()
 
@@ -0,0 +1,90 @@
+"""
+Plays a headless game of random legal moves with a GameSnapshot after
+every tick (each sharing unchanged columns with the one before), then
+rewinds to random ticks, restores, plays the same input again and checks
+that every piece's cell, state and position match the original run.
+Also round-trips snapshots through to_bytes() / from_bytes() into a fresh
+game. Reports capture / restore times and snapshot sizes.
+
+    python snapshot_check.py PIECES_ROOT [--seconds 20] [--rewinds 30] [--replay-ticks 50]
+"""
+import argparse
+import contextlib
+import io
+import pathlib
+import random
+import time
+
+from Game import Game
+from GameSnapshot import GameSnapshot
+from journal_check import BOARD_CSV, make_board, pieces_state, random_legal_move
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pieces_root", type=pathlib.Path)
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--rewinds", type=int, default=30)
+    parser.add_argument("--replay-ticks", type=int, default=50)
+    args = parser.parse_args()
+    rng = random.Random(11)
+
+    game = Game(make_board(), args.pieces_root, BOARD_CSV, headless=True)
+    times, inputs, live, snaps = [], [], [], []
+    capture_s = 0.0
+    previous = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for k in range(int(args.seconds * 1000 / game.tick_ms)):
+            now = int(k * game.tick_ms)
+            cmd = random_legal_move(game, now, rng)
+            if cmd is not None:
+                game.user_input_queue.put(cmd)
+            game._tick(now)
+            t0 = time.perf_counter()
+            previous = GameSnapshot.capture(game, now, previous)
+            capture_s += time.perf_counter() - t0
+            times.append(now)
+            inputs.append(cmd)
+            live.append(pieces_state(game))
+            snaps.append(previous)
+            if game._is_win():
+                break
+
+    mismatches = 0
+    restore_s = 0.0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for k in rng.sample(range(len(snaps) - 1), min(args.rewinds, len(snaps) - 1)):
+            t0 = time.perf_counter()
+            snaps[k].restore(game)
+            restore_s += time.perf_counter() - t0
+            for j in range(k + 1, min(k + 1 + args.replay_ticks, len(snaps))):
+                if inputs[j] is not None:
+                    game.user_input_queue.put(inputs[j])
+                game._tick(times[j])
+                if pieces_state(game) != live[j]:
+                    mismatches += 1
+                    break
+        rewinds = min(args.rewinds, len(snaps) - 1)
+
+        # save / load through bytes into another game built from the same placement
+        fresh = Game(make_board(), args.pieces_root, BOARD_CSV, headless=True)
+        by_id = {piece.get_id(): piece for piece in fresh.pieces.values()}
+        blobs = [snaps[k].to_bytes() for k in rng.sample(range(len(snaps)), min(20, len(snaps)))]
+        loaded_ok = 0
+        for blob in blobs:
+            snap = GameSnapshot.from_bytes(fresh, blob, by_id)
+            k = snap.ticks - 1
+            loaded_ok += pieces_state(fresh) == live[k]
+
+    full = snaps[-1].nbytes()
+    unique = sum(snaps[i].nbytes(snaps[i - 1]) for i in range(1, len(snaps))) / max(len(snaps) - 1, 1)
+    print(f"game: {len(snaps)} ticks, {len(game.pieces)} pieces left")
+    print(f"capture: {capture_s / len(snaps) * 1e6:.1f} us/snapshot, arrays {full} bytes, "
+          f"{unique:.0f} bytes not shared with the previous snapshot on average")
+    print(f"restore: {restore_s / rewinds * 1e6:.1f} us, {rewinds} rewinds of {args.replay_ticks} ticks, "
+          f"{mismatches} diverged")
+    print(f"bytes: {len(blobs[0])} bytes per snapshot, {loaded_ok}/{len(blobs)} loaded into a fresh game match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Generate a throw-away PIECES tree (moves.txt, state configs and tiny sprites)
+so the benchmarks can run without the real art assets.
+"""
+import json
+import pathlib
+
+import cv2
+import numpy as np
+
+STATES = ("idle", "move", "jump", "short_rest", "long_rest")
+
+_ORTHOGONAL = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+_DIAGONAL = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+_KNIGHT = [(1, 2), (2, 1), (-1, 2), (-2, 1), (1, -2), (2, -1), (-1, -2), (-2, -1)]
+
+
+def _slide(directions, max_dist):
+    return [(dr * k, dc * k) for dr, dc in directions for k in range(1, max_dist + 1)]
+
+
+def move_rules(piece_type: str, max_dist: int = 7):
+    """Offsets (dr, dc) for a piece letter, in the moves.txt order."""
+    if piece_type == "K":
+        return _ORTHOGONAL + _DIAGONAL
+    if piece_type == "Q":
+        return _slide(_ORTHOGONAL + _DIAGONAL, max_dist)
+    if piece_type == "R":
+        return _slide(_ORTHOGONAL, max_dist)
+    if piece_type == "B":
+        return _slide(_DIAGONAL, max_dist)
+    if piece_type == "N":
+        return list(_KNIGHT)
+    raise ValueError(f"Unknown piece type: {piece_type}")
+
+
+def write_pieces_root(root: pathlib.Path, codes, frames: int = 5, sprite_px: int = 128,
+                      max_dist: int = 7) -> pathlib.Path:
+    """Create root/<code>/{moves.txt,states/*} for every piece code."""
+    root = pathlib.Path(root)
+    rng = np.random.default_rng(0)
+    for code in sorted(set(codes)):
+        piece_dir = root / code
+        piece_dir.mkdir(parents=True, exist_ok=True)
+        if code[0] == "P":
+            direction = 1 if code[1] == "B" else -1
+            rules = [(direction, 0), (2 * direction, 0)]
+        else:
+            rules = move_rules(code[0], max_dist)
+        (piece_dir / "moves.txt").write_text("\n".join(f"{dr},{dc}" for dr, dc in rules))
+
+        for state in STATES:
+            state_dir = piece_dir / "states" / state
+            sprites_dir = state_dir / "sprites"
+            sprites_dir.mkdir(parents=True, exist_ok=True)
+            cfg = {
+                "physics": {"speed_m_per_sec": 1.0},
+                "graphics": {"frames_per_sec": 6, "is_loop": state != "jump"},
+            }
+            (state_dir / "config.json").write_text(json.dumps(cfg))
+            for i in range(frames):
+                sprite = rng.integers(0, 256, (sprite_px, sprite_px, 4), dtype=np.uint8)
+                cv2.imwrite(str(sprites_dir / f"{i + 1}.png"), sprite)
+    return root
+
+
+def write_board_csv(path: pathlib.Path, rows: int, cols: int) -> pathlib.Path:
+    """A board of rows x cols with two full armies on the first and last two ranks."""
+    back = ["R", "N", "B", "Q", "K", "B", "N", "R"]
+    lines = []
+    for r in range(rows):
+        if r in (0, rows - 1):
+            color = "B" if r == 0 else "W"
+            lines.append(",".join(back[c % 8] + color for c in range(cols)))
+        elif r in (1, rows - 2):
+            color = "B" if r == 1 else "W"
+            lines.append(",".join("P" + color for _ in range(cols)))
+        else:
+            lines.append("," * (cols - 1))
+    path = pathlib.Path(path)
+    path.write_text("\n".join(lines) + "\n")
+    return path